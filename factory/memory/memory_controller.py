@@ -1,4 +1,5 @@
 from collections import defaultdict
+from collections.abc import Iterable
 
 import httpx
 
@@ -28,6 +29,13 @@ class MemoryController:
         if len(self._banks[bank_id]) > self._max_bank_size:
             self._compress(bank_id)
 
+    def recall_batch(self, bank_ids: Iterable[str], limit: int = 5) -> dict[str, list[str]]:
+        return {bank_id: self.recall(bank_id, limit) for bank_id in bank_ids}
+
+    def retain_batch(self, items: Iterable[tuple[str, str]]) -> None:
+        for bank_id, item in items:
+            self.retain(bank_id, item)
+
     def _compress(self, bank_id: str) -> None:
         """Keep the most recent items and prepend a compression marker."""
         current = self._banks[bank_id]
@@ -86,6 +94,35 @@ class RemoteMemoryController:
         except Exception:
             self._fallback.retain(bank_id, item)
 
+    def recall_batch(self, bank_ids: Iterable[str], limit: int = 5) -> dict[str, list[str]]:
+        """Recall several banks in one request — ``{bank_id: items}``."""
+        bank_ids = list(bank_ids)
+        try:
+            response = httpx.post(
+                f"{self.base_url}/banks/recall-batch",
+                json={"bank_ids": bank_ids, "limit": limit},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            banks = response.json().get("banks", {})
+            return {bank_id: banks.get(bank_id, []) for bank_id in bank_ids}
+        except Exception:
+            return self._fallback.recall_batch(bank_ids, limit)
+
+    def retain_batch(self, items: Iterable[tuple[str, str]]) -> None:
+        """Retain ``(bank_id, item)`` pairs in one request."""
+        items = list(items)
+        try:
+            response = httpx.post(
+                f"{self.base_url}/banks/retain-batch",
+                json={"items": [{"bank_id": b, "item": i} for b, i in items]},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return
+        except Exception:
+            self._fallback.retain_batch(items)
+
     def snapshot(self) -> dict[str, list[str]]:
         try:
             response = httpx.get(f"{self.base_url}/banks/snapshot", timeout=self.timeout)
@@ -137,3 +174,21 @@ class RemoteMemoryController:
         except Exception:
             items = self._fallback.recall(bank_id, limit=1000)
             return {"bank_id": bank_id, "count": len(items), "store": "memory-fallback"}
+
+
+def recall_many(memory, bank_ids: Iterable[str], limit: int = 5) -> dict[str, list[str]]:
+    """``memory.recall_batch`` — or one ``recall`` per bank for adapters without it."""
+    batch = getattr(memory, "recall_batch", None)
+    if batch is not None:
+        return batch(bank_ids, limit)
+    return {bank_id: memory.recall(bank_id, limit) for bank_id in bank_ids}
+
+
+def retain_many(memory, items: Iterable[tuple[str, str]]) -> None:
+    """``memory.retain_batch`` — or one ``retain`` per item for adapters without it."""
+    batch = getattr(memory, "retain_batch", None)
+    if batch is not None:
+        batch(items)
+        return
+    for bank_id, item in items:
+        memory.retain(bank_id, item)
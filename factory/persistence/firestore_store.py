@@ -9,23 +9,67 @@ users/{uid}
         ├── name, created_at, updated_at
         ├── config/team_settings   — per-team model / budget / API-key
         ├── config/git             — git_url, git_token_set (token lives at user level)
-        ├── memory/{bank_id}       — items[]
+        ├── memory/{bank_id}       — updated_at (items[] on legacy banks)
+        │     └── items/{auto_id}  — text (or gzipped text_gz), ts
         └── runs/{task_id}         — full pipeline run payload
 """
 
+import gzip
 import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
 from google.cloud import firestore  # type: ignore
 
+# Firestore rejects a single commit with more than 500 writes.
+_BATCH_LIMIT = 500
+# ``ts`` prefix for migrated memory items: sorts before any ISO timestamp, so
+# legacy items stay older than anything retained since.
+_LEGACY_TS = "0000"
+# Fields returned by list_runs; activities/result stay server-side.
+_RUN_SUMMARY_FIELDS = [
+    "task_id",
+    "project_id",
+    "requirement",
+    "mode",
+    "status",
+    "current_team",
+    "started_at",
+    "updated_at",
+    "error",
+]
+# Memory items at least this long are stored gzipped in ``text_gz``.
+_GZIP_MIN_BYTES = 1024
+# User-level git tokens change rarely; cache reads per instance.
+_TOKEN_CACHE_TTL = 300.0
+_TOKEN_CACHE_MAX = 1024
+# Docs fetched per round-trip when paginating a collection.
+_PAGE_SIZE = 100
+
+
+@lru_cache(maxsize=None)
+def _client(project_id: str) -> "firestore.Client":
+    """Process-wide Firestore client — one gRPC channel + credential probe."""
+    return firestore.Client(project=project_id)
+
 
 class FirestoreStore:
     """Stores user projects, memory, settings, and pipeline runs in Firestore."""
 
     def __init__(self) -> None:
         project_id = os.getenv("GCP_PROJECT_ID", "unicon-494419")
-        self.db = firestore.Client(project=project_id)
+        self.db = _client(project_id)
+        # The store is shared across pipeline threads, so the open batch (if
+        # any) is tracked per thread.
+        self._local = threading.local()
+        # uid → (expires_at, token); see get_user_git_token
+        self._token_cache: dict[str, tuple[float, str]] = {}
+        self._token_lock = threading.Lock()
 
     # ── helpers ──────────────────────────────────────────────
     def _now(self) -> str:
@@ -37,6 +81,72 @@ class FirestoreStore:
     def _project_ref(self, uid: str, project_id: str):
         return self._user_ref(uid).collection("projects").document(project_id)
 
+    @staticmethod
+    def _paginate(query, page_size: int = _PAGE_SIZE) -> Iterator:
+        """Yield snapshots from ``query`` one page at a time.
+
+        Only one page is held in memory; each page is a separate
+        ``limit().start_after()`` query so no stream stays open for long.
+        """
+        last = None
+        while True:
+            page = query.limit(page_size)
+            if last is not None:
+                page = page.start_after(last)
+            docs = list(page.stream())
+            yield from docs
+            if len(docs) < page_size:
+                return
+            last = docs[-1]
+
+    def _write(self, op: str, ref, *args, **kwargs) -> None:
+        """Run ``ref.<op>(...)`` — or queue it on this thread's open batch."""
+        batch = getattr(self._local, "batch", None)
+        if batch is None:
+            getattr(ref, op)(*args, **kwargs)
+            return
+        if self._local.pending >= _BATCH_LIMIT:
+            raise ValueError(f"batch exceeds Firestore's {_BATCH_LIMIT}-write commit limit")
+        getattr(batch, op)(ref, *args, **kwargs)
+        self._local.pending += 1
+
+    def _set(self, ref, data: dict, merge: bool = False) -> None:
+        self._write("set", ref, data, merge=merge)
+
+    def _update(self, ref, data: dict) -> None:
+        self._write("update", ref, data)
+
+    # ── Batched writes ──────────────────────────────────────
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group writes made inside the block into one atomic Firestore commit.
+
+        Applies to ``save_run``, ``save_team_settings``, ``save_decision``,
+        ``save_user_git_token`` and ``save_task_routing``.  Nested blocks
+        join the outer batch.  Nothing is committed if the block raises.
+        A batch holds at most 500 writes; the 501st raises ``ValueError``
+        rather than splitting the commit, so callers with more writes must
+        chunk them into separate blocks.
+
+        Usage::
+
+            with store.batch():
+                store.save_run(uid, project_id, task_id, payload)
+                store.save_task_routing(task_id, uid, project_id)
+        """
+        if getattr(self._local, "batch", None) is not None:
+            yield
+            return
+        self._local.batch = self.db.batch()
+        self._local.pending = 0
+        try:
+            yield
+            if self._local.pending:
+                self._local.batch.commit()
+        finally:
+            self._local.batch = None
+            self._local.pending = 0
+
     # ── User Profile ────────────────────────────────────────
     def ensure_user(self, uid: str, email: str = "", display_name: str = "") -> dict:
         ref = self._user_ref(uid)
@@ -55,9 +165,14 @@ class FirestoreStore:
         return profile
 
     # ── Projects ────────────────────────────────────────────
+    def iter_projects(self, uid: str, page_size: int = _PAGE_SIZE) -> Iterator[dict]:
+        """Yield the user's projects, fetching ``page_size`` docs per request."""
+        query = self._user_ref(uid).collection("projects")
+        for d in self._paginate(query, page_size):
+            yield {"id": d.id, **d.to_dict()}
+
     def list_projects(self, uid: str) -> list[dict]:
-        docs = self._user_ref(uid).collection("projects").stream()
-        return [{"id": d.id, **d.to_dict()} for d in docs]
+        return list(self.iter_projects(uid))
 
     def get_project(self, uid: str, project_id: str) -> dict | None:
         doc = self._project_ref(uid, project_id).get()
@@ -82,32 +197,116 @@ class FirestoreStore:
         self._project_ref(uid, project_id).delete()
 
     # ── Memory Banks (scoped to user + project) ────────────
+    def _bank_ref(self, uid: str, project_id: str, bank_id: str):
+        return self._project_ref(uid, project_id).collection("memory").document(bank_id)
+
+    def _bank_docs(self, bank_ref, limit: int | None = None) -> list[dict]:
+        """Return bank item docs oldest-first, optionally only the newest ``limit``."""
+        query = bank_ref.collection("items").order_by(
+            "ts", direction=firestore.Query.DESCENDING
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        docs = [d.to_dict() for d in query.stream()]
+        docs.reverse()
+        return docs
+
+    @staticmethod
+    def _is_migrated(data: dict) -> bool:
+        """Whether an item doc was written by ``migrate_memory_banks``."""
+        return data.get("ts", "").startswith(f"{_LEGACY_TS}#")
+
+    def _bank_items(self, bank_ref, legacy: list[str]) -> list[str]:
+        """Every item of a bank whose ``items[]`` array is ``legacy``, oldest-first.
+
+        While the array still exists (a migration not yet run, or one that
+        failed part-way) the items already migrated out of it are skipped,
+        so none is returned twice.
+        """
+        docs = self._bank_docs(bank_ref)
+        if legacy:
+            docs = [d for d in docs if not self._is_migrated(d)]
+        return legacy + [self._unpack_item(d) for d in docs]
+
+    @staticmethod
+    def _pack_item(item: str, ts: str) -> dict:
+        """Item doc payload — long (LLM transcript) text is gzipped to bytes."""
+        raw = item.encode("utf-8")
+        if len(raw) < _GZIP_MIN_BYTES:
+            return {"text": item, "ts": ts}
+        return {"text_gz": gzip.compress(raw), "ts": ts}
+
+    @staticmethod
+    def _unpack_item(data: dict) -> str:
+        packed = data.get("text_gz")
+        if packed is not None:
+            return gzip.decompress(packed).decode("utf-8")
+        return data.get("text", "")
+
     def recall(self, uid: str, project_id: str, bank_id: str, limit: int = 5) -> list[str]:
-        ref = self._project_ref(uid, project_id).collection("memory").document(bank_id)
+        ref = self._bank_ref(uid, project_id, bank_id)
+        docs = self._bank_docs(ref, limit)
+        if len(docs) >= limit and not any(self._is_migrated(d) for d in docs):
+            return [self._unpack_item(d) for d in docs]
+        # Short bank, or one reaching back into migrated items — it may still
+        # (partly) live in items[]
         doc = ref.get()
-        if not doc.exists:
-            return []
-        items = doc.to_dict().get("items", [])
-        return items[-limit:]
+        legacy = doc.to_dict().get("items", []) if doc.exists else []
+        if legacy:
+            docs = [d for d in docs if not self._is_migrated(d)]
+        return (legacy + [self._unpack_item(d) for d in docs])[-limit:]
 
     def retain(self, uid: str, project_id: str, bank_id: str, item: str) -> None:
-        ref = self._project_ref(uid, project_id).collection("memory").document(bank_id)
-        doc = ref.get()
-        if doc.exists:
-            ref.update({
-                "items": firestore.ArrayUnion([item]),
-                "updated_at": self._now(),
-            })
-        else:
-            ref.set({
-                "items": [item],
-                "created_at": self._now(),
-                "updated_at": self._now(),
-            })
+        """Append ``item`` to a memory bank as its own ``items/{auto_id}`` doc.
+
+        Appends are O(1) and never rewrite the bank, so banks are not bounded
+        by the 1 MB document limit.  The bank doc's ``updated_at`` is touched
+        in the same commit so the bank stays listable.
+        """
+        ref = self._bank_ref(uid, project_id, bank_id)
+        now = self._now()
+        with self.batch():
+            self._set(ref.collection("items").document(), self._pack_item(item, now))
+            self._set(ref, {"updated_at": now}, merge=True)
+
+    def iter_memory_banks(
+        self, uid: str, project_id: str, page_size: int = _PAGE_SIZE
+    ) -> Iterator[tuple[str, list[str]]]:
+        """Yield ``(bank_id, items)`` pairs, loading each bank's items lazily."""
+        query = self._project_ref(uid, project_id).collection("memory")
+        for d in self._paginate(query, page_size):
+            yield d.id, self._bank_items(d.reference, d.to_dict().get("items", []))
 
     def memory_snapshot(self, uid: str, project_id: str) -> dict[str, list[str]]:
+        return dict(self.iter_memory_banks(uid, project_id))
+
+    def migrate_memory_banks(self, uid: str, project_id: str) -> int:
+        """Move legacy ``items[]`` arrays into ``items/`` sub-collections.
+
+        Returns the number of items moved.  Banks without an ``items`` array
+        are skipped, so re-running after a completed migration is a no-op.
+        Item docs get deterministic ids (``legacy-000000``, ...), so a re-run
+        after a partial migration overwrites them instead of duplicating; the
+        ``items`` array is only dropped once every chunk has been committed.
+        """
+        moved = 0
         docs = self._project_ref(uid, project_id).collection("memory").stream()
-        return {d.id: d.to_dict().get("items", []) for d in docs}
+        for d in docs:
+            data = d.to_dict()
+            legacy = data.get("items")
+            if not legacy:
+                continue
+            items = d.reference.collection("items")
+            for start in range(0, len(legacy), _BATCH_LIMIT):
+                with self.batch():
+                    for i, item in enumerate(legacy[start : start + _BATCH_LIMIT], start):
+                        self._set(
+                            items.document(f"legacy-{i:06d}"),
+                            self._pack_item(item, f"{_LEGACY_TS}#{i:06d}"),
+                        )
+            self._update(d.reference, {"items": firestore.DELETE_FIELD})
+            moved += len(legacy)
+        return moved
 
     # ── Team Settings (model, budget, API key per user+project) ──
     def get_team_settings(self, uid: str, project_id: str) -> dict:
@@ -117,13 +316,13 @@ class FirestoreStore:
 
     def save_team_settings(self, uid: str, project_id: str, settings: dict) -> None:
         ref = self._project_ref(uid, project_id).collection("config").document("team_settings")
-        ref.set(settings, merge=True)
+        self._set(ref, settings, merge=True)
 
     # ── Pipeline Runs ───────────────────────────────────────
     def save_run(self, uid: str, project_id: str, task_id: str, data: dict) -> None:
         ref = self._project_ref(uid, project_id).collection("runs").document(task_id)
         data["updated_at"] = self._now()
-        ref.set(data, merge=True)
+        self._set(ref, data, merge=True)
 
     def get_run(self, uid: str, project_id: str, task_id: str) -> dict | None:
         ref = self._project_ref(uid, project_id).collection("runs").document(task_id)
@@ -131,9 +330,11 @@ class FirestoreStore:
         return doc.to_dict() if doc.exists else None
 
     def list_runs(self, uid: str, project_id: str, limit: int = 20) -> list[dict]:
+        """Return run summaries, newest first — use ``get_run`` for the full payload."""
         query = (
             self._project_ref(uid, project_id)
             .collection("runs")
+            .select(_RUN_SUMMARY_FIELDS)
             .order_by("updated_at", direction=firestore.Query.DESCENDING)
             .limit(limit)
         )
@@ -143,21 +344,41 @@ class FirestoreStore:
     def save_user_git_token(self, uid: str, token: str) -> None:
         """Store the GitHub PAT at the user level — one token for all projects."""
         ref = self._user_ref(uid).collection("config").document("git_token")
-        ref.set({"token": token, "updated_at": self._now()})
+        self._set(ref, {"token": token, "updated_at": self._now()})
+        self._forget_git_token(uid)
 
     def get_user_git_token(self, uid: str) -> str:
-        """Retrieve user-level GitHub PAT."""
+        """Retrieve user-level GitHub PAT.
+
+        Cached in-process for ``_TOKEN_CACHE_TTL`` seconds.  Saves and deletes
+        on this instance invalidate immediately; other instances may serve the
+        previous value until the entry expires.
+        """
+        now = time.monotonic()
+        with self._token_lock:
+            hit = self._token_cache.get(uid)
+        if hit is not None and hit[0] > now:
+            return hit[1]
         ref = self._user_ref(uid).collection("config").document("git_token")
         doc = ref.get()
-        return doc.to_dict().get("token", "") if doc.exists else ""
+        token = doc.to_dict().get("token", "") if doc.exists else ""
+        with self._token_lock:
+            if len(self._token_cache) >= _TOKEN_CACHE_MAX:
+                # Drop the oldest entry (dicts keep insertion order)
+                self._token_cache.pop(next(iter(self._token_cache)))
+            self._token_cache[uid] = (now + _TOKEN_CACHE_TTL, token)
+        return token
+
+    def _forget_git_token(self, uid: str) -> None:
+        with self._token_lock:
+            self._token_cache.pop(uid, None)
 
     def delete_user_git_token(self, uid: str) -> None:
         self._user_ref(uid).collection("config").document("git_token").delete()
+        self._forget_git_token(uid)
 
     def user_git_token_set(self, uid: str) -> bool:
-        ref = self._user_ref(uid).collection("config").document("git_token")
-        doc = ref.get()
-        return doc.exists and bool(doc.to_dict().get("token"))
+        return bool(self.get_user_git_token(uid))
 
     # ── Git Config (URL per-project, token at user level) ───
     def get_git_config(self, uid: str, project_id: str) -> dict | None:
@@ -173,13 +394,18 @@ class FirestoreStore:
     def save_git_config(self, uid: str, project_id: str, git_url: str, git_token: str = "") -> None:
         """Save URL per-project. If a token is supplied here, promote it to user level."""
         ref = self._project_ref(uid, project_id).collection("config").document("git")
-        ref.set({
-            "git_url": git_url,
-            "updated_at": self._now(),
-        })
+        # One atomic commit — the URL and a promoted token land together
+        with self.batch():
+            self._set(ref, {
+                "git_url": git_url,
+                "updated_at": self._now(),
+            })
+            if git_token:
+                # Promote to user-level — applies to all projects
+                self.save_user_git_token(uid, git_token)
         if git_token:
-            # Promote to user-level — applies to all projects
-            self.save_user_git_token(uid, git_token)
+            # A read between queueing and commit may have re-cached the old token
+            self._forget_git_token(uid)
 
     def get_git_token(self, uid: str, project_id: str = "") -> str:  # project_id kept for compat
         """Always return the user-level token."""
@@ -193,24 +419,33 @@ class FirestoreStore:
             .collection("decisions")
             .document(entry.id)
         )
-        ref.set(
-            {
-                "id": entry.id,
-                "ts": entry.ts,
-                "project_id": entry.project_id,
-                "team": entry.team,
-                "decision_type": entry.decision_type,
-                "title": entry.title,
-                "rationale": entry.rationale,
-                "artifact_ref": entry.artifact_ref,
-            }
-        )
+        self._set(ref, self._decision_payload(entry))
+
+    def save_decisions_bulk(self, uid: str, project_id: str, entries: list) -> None:
+        """Persist many DecisionEntry objects, one commit per 500 entries."""
+        for start in range(0, len(entries), _BATCH_LIMIT):
+            with self.batch():
+                for entry in entries[start : start + _BATCH_LIMIT]:
+                    self.save_decision(uid, project_id, entry)
+
+    @staticmethod
+    def _decision_payload(entry: object) -> dict:
+        return {
+            "id": entry.id,
+            "ts": entry.ts,
+            "project_id": entry.project_id,
+            "team": entry.team,
+            "decision_type": entry.decision_type,
+            "title": entry.title,
+            "rationale": entry.rationale,
+            "artifact_ref": entry.artifact_ref,
+        }
 
     # ── Task Routing (cross-instance task lookup) ────────────────────────
     def save_task_routing(self, task_id: str, uid: str, project_id: str) -> None:
         """Register task→user mapping so any Cloud Run instance can find the run."""
         ref = self.db.collection("task_routing").document(task_id)
-        ref.set({"uid": uid, "project_id": project_id, "updated_at": self._now()}, merge=True)
+        self._set(ref, {"uid": uid, "project_id": project_id, "updated_at": self._now()}, merge=True)
 
     def get_task_routing(self, task_id: str) -> dict | None:
         """Return {uid, project_id} for a task, or None if not found."""
@@ -1,10 +1,23 @@
 """Google Cloud Storage for large pipeline artifacts."""
 
+import concurrent.futures
 import json
 import os
 from datetime import UTC, datetime
+from functools import lru_cache
 
+import orjson
 from google.cloud import storage  # type: ignore
+from google.cloud.exceptions import NotFound  # type: ignore
+
+# Uploads are network-bound; past a few dozen threads the returns diminish.
+_UPLOAD_WORKERS = 16
+
+
+@lru_cache(maxsize=1)
+def _client() -> "storage.Client":
+    """Process-wide Storage client — shares one HTTP session and credentials."""
+    return storage.Client()
 
 
 class GCSArtifactStore:
@@ -14,7 +27,7 @@ class GCSArtifactStore:
         self.bucket_name = os.getenv(
             "GCS_ARTIFACTS_BUCKET", "unicon-494419.firebasestorage.app"
         )
-        self.client = storage.Client()
+        self.client = _client()
         self.bucket = self.client.bucket(self.bucket_name)
 
     def _prefix(self, uid: str, project_id: str) -> str:
@@ -31,7 +44,6 @@ class GCSArtifactStore:
         """Save all pipeline artifacts as JSON in GCS. Returns the GCS path."""
         prefix = self._prefix(uid, project_id)
         path = f"{prefix}/{task_id}/artifacts.json"
-        blob = self.bucket.blob(path)
         payload = {
             "task_id": task_id,
             "project_id": project_id,
@@ -40,15 +52,21 @@ class GCSArtifactStore:
             "teams": list(artifacts.keys()),
             "artifacts": artifacts,
         }
-        blob.upload_from_string(
-            json.dumps(payload, indent=2), content_type="application/json"
-        )
-
+        uploads = [(path, orjson.dumps(payload), "application/json")]
         # Also save per-team files for easy browsing
-        for team, artifact in artifacts.items():
-            team_path = f"{prefix}/{task_id}/{team}.txt"
-            team_blob = self.bucket.blob(team_path)
-            team_blob.upload_from_string(artifact, content_type="text/plain")
+        uploads += [
+            (f"{prefix}/{task_id}/{team}.txt", artifact, "text/plain")
+            for team, artifact in artifacts.items()
+        ]
+        # Upload concurrently so wall time is ~max(RTT) rather than sum(RTT)
+        max_workers = min(len(uploads), _UPLOAD_WORKERS)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(self.bucket.blob(p).upload_from_string, data, content_type=ct)
+                for p, data, ct in uploads
+            ]
+            for fut in futures:
+                fut.result()
 
         return f"gs://{self.bucket_name}/{path}"
 
@@ -56,7 +74,8 @@ class GCSArtifactStore:
         """Load pipeline artifacts from GCS."""
         prefix = self._prefix(uid, project_id)
         path = f"{prefix}/{task_id}/artifacts.json"
-        blob = self.bucket.blob(path)
-        if not blob.exists():
+        # Download optimistically — one round-trip instead of exists() + get
+        try:
+            return json.loads(self.bucket.blob(path).download_as_bytes())
+        except NotFound:
             return None
-        return json.loads(blob.download_as_string())
@@ -5,12 +5,29 @@ artifacts are committed to a new branch and pushed instead of being
 stored in GCS.
 """
 
+import asyncio
+import base64
+import importlib.util
 import os
+import re
 import shutil
-import subprocess
 import tempfile
 from datetime import UTC, datetime
+from pathlib import Path
 
+import httpx
+
+# HTTP/2 multiplexes blob fetches over one connection when h2 is installed.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+# Max in-flight blob requests per fetch_repo_tree call.
+_BLOB_CONCURRENCY = 16
+
+_GITHUB_URL_RE = re.compile(r'github\.com[:/]([^/]+)/([^/\s]+?)(?:\.git)?$')
+
+# fetch_repo_tree filters: binary/media extensions and vendored/build dirs
+_SKIP_EXTS = frozenset({'.png','.jpg','.jpeg','.gif','.ico','.svg','.woff','.woff2','.ttf','.eot','.mp4','.zip','.gz','.tar','.lock'})
+_SKIP_DIRS = ('node_modules/', '.git/', 'dist/', 'build/', '__pycache__/', '.next/', 'vendor/')
+_KEY_FILES = frozenset({'readme.md','package.json','pyproject.toml','requirements.txt','dockerfile'})
 
 # Git env that prevents any interactive prompts (safe for Cloud Run / CI)
 _GIT_NONINTERACTIVE_ENV = {
@@ -20,17 +37,48 @@ _GIT_NONINTERACTIVE_ENV = {
 }
 
 
+def strip_credentials(url: str) -> str:
+    """Drop any ``user:pass@`` from an HTTPS git URL."""
+    if "@" in url and "://" in url:
+        scheme, rest = url.split("://", 1)
+        rest = rest.split("@", 1)[1]  # drop existing user:pass@
+        url = f"{scheme}://{rest}"
+    return url
+
+
+def inject_token(url: str, token: str) -> str:
+    """Insert a Personal Access Token into an HTTPS git URL."""
+    if not token:
+        return url
+    url = strip_credentials(url)
+    if url.startswith("https://"):
+        return url.replace("https://", f"https://x-access-token:{token}@")
+    if url.startswith("http://"):
+        return url.replace("http://", f"http://x-access-token:{token}@")
+    return url
+
+
 class GitArtifactStore:
     """Push pipeline artifacts to a user's Git repository."""
 
     def fetch_repo_tree(self, git_url: str, git_token: str, branch: str = "main", max_files: int = 60) -> list[dict]:
         """Fetch the repo file tree + contents of key files for learning."""
         try:
-            tree_raw = self._github(git_url, git_token, "GET", f"git/trees/{branch}?recursive=1")
+            return asyncio.run(self._fetch_repo_tree_async(git_url, git_token, branch, max_files))
+        except Exception as exc:
+            return [{'path': 'error', 'content': str(exc), 'size': 0}]
+
+    async def _fetch_repo_tree_async(self, git_url: str, git_token: str, branch: str, max_files: int) -> list[dict]:
+        """Fetch the tree, then all selected blobs concurrently over one client."""
+        base = self._api_base(git_url)
+        headers = self._headers(git_token)
+        limits = httpx.Limits(max_keepalive_connections=_BLOB_CONCURRENCY)
+        async with httpx.AsyncClient(timeout=15.0, http2=_HTTP2, limits=limits, headers=headers) as client:
+            resp = await client.get(f"{base}/git/trees/{branch}?recursive=1")
+            resp.raise_for_status()
+            tree_raw = resp.json() if resp.text else {}
             tree = tree_raw.get("tree", []) if isinstance(tree_raw, dict) else []
             # Filter to code files, skip binaries/images/node_modules
-            _SKIP = {'.png','.jpg','.jpeg','.gif','.ico','.svg','.woff','.woff2','.ttf','.eot','.mp4','.zip','.gz','.tar','.lock'}
-            _SKIP_DIRS = {'node_modules/', '.git/', 'dist/', 'build/', '__pycache__/', '.next/', 'vendor/'}
             files = []
             for item in tree:
                 if item.get('type') != 'blob':
@@ -39,30 +87,28 @@ class GitArtifactStore:
                 if any(path.startswith(d) or f'/{d}' in path for d in _SKIP_DIRS):
                     continue
                 ext = '.' + path.rsplit('.', 1)[-1] if '.' in path else ''
-                if ext.lower() in _SKIP:
+                if ext.lower() in _SKIP_EXTS:
                     continue
                 files.append({'path': path, 'sha': item.get('sha', ''), 'size': item.get('size', 0)})
             # Fetch content of key files (README, package.json, main source, etc.)
-            results = []
-            fetched = 0
-            for f in sorted(files, key=lambda x: (0 if x['path'].lower() in ('readme.md','package.json','pyproject.toml','requirements.txt','dockerfile') else 1, x['size'])):
-                if fetched >= max_files:
-                    break
+            selected = sorted(files, key=lambda x: (0 if x['path'].lower() in _KEY_FILES else 1, x['size']))[:max_files]
+            # Bounded fan-out keeps us under GitHub's secondary rate limits
+            sem = asyncio.Semaphore(_BLOB_CONCURRENCY)
+
+            async def _fetch(f: dict) -> dict:
                 if f['size'] > 50000:  # skip very large files
-                    results.append({'path': f['path'], 'content': f'(file too large: {f["size"]} bytes)', 'size': f['size']})
-                    fetched += 1
-                    continue
+                    return {'path': f['path'], 'content': f'(file too large: {f["size"]} bytes)', 'size': f['size']}
                 try:
-                    blob = self._github(git_url, git_token, "GET", f"git/blobs/{f['sha']}")
-                    import base64
+                    async with sem:
+                        r = await client.get(f"{base}/git/blobs/{f['sha']}")
+                    r.raise_for_status()
+                    blob = r.json()
                     content = base64.b64decode(blob.get('content', '')).decode('utf-8', errors='replace') if blob.get('encoding') == 'base64' else blob.get('content', '')
-                    results.append({'path': f['path'], 'content': content[:8000], 'size': f['size']})
+                    return {'path': f['path'], 'content': content[:8000], 'size': f['size']}
                 except Exception:
-                    results.append({'path': f['path'], 'content': '(fetch failed)', 'size': f['size']})
-                fetched += 1
-            return results
-        except Exception as exc:
-            return [{'path': 'error', 'content': str(exc), 'size': 0}]
+                    return {'path': f['path'], 'content': '(fetch failed)', 'size': f['size']}
+
+            return list(await asyncio.gather(*(_fetch(f) for f in selected)))
 
     def push_artifacts(
         self,
@@ -73,7 +119,11 @@ class GitArtifactStore:
         requirement: str,
         artifacts: dict[str, str],
     ) -> dict:
-        """Clone repo, write artifacts, commit, push. Returns status dict."""
+        """Write artifacts to a new branch and push. Returns status dict.
+
+        GitHub repos go through the Git Data API (no clone); other hosts fall
+        back to a shallow clone + commit + push.
+        """
         # Fall back to env-level token if caller didn't supply one
         if not git_token:
             git_token = os.environ.get("GITHUB_TOKEN", "")
@@ -87,42 +137,129 @@ class GitArtifactStore:
                 ),
             }
 
+        if not self._is_github(git_url):
+            return self._push_artifacts_clone(
+                git_url, git_token, project_id, task_id, requirement, artifacts
+            )
+        return self.push_artifacts_api(
+            git_url, git_token, project_id, task_id, requirement, artifacts
+        )
+
+    async def push_artifacts_async(
+        self,
+        git_url: str,
+        git_token: str,
+        project_id: str,
+        task_id: str,
+        requirement: str,
+        artifacts: dict[str, str],
+    ) -> dict:
+        """``push_artifacts`` for async callers — never blocks the event loop.
+
+        The API path runs in a worker thread; the clone path awaits its git
+        subprocesses, so other coroutines make progress meanwhile.
+        """
+        if not git_token:
+            git_token = os.environ.get("GITHUB_TOKEN", "")
+        if git_token and not self._is_github(git_url):
+            return await self._push_artifacts_clone_async(
+                git_url, git_token, project_id, task_id, requirement, artifacts
+            )
+        return await asyncio.to_thread(
+            self.push_artifacts, git_url, git_token, project_id, task_id, requirement, artifacts
+        )
+
+    def push_artifacts_api(
+        self,
+        git_url: str,
+        git_token: str,
+        project_id: str,
+        task_id: str,
+        requirement: str,
+        artifacts: dict[str, str],
+    ) -> dict:
+        """Push artifacts to a new branch via the GitHub Git Data API.
+
+        base commit → tree (contents inlined) → commit → branch ref: a handful
+        of HTTPS calls instead of a clone, a temp dir and four git processes.
+        """
+        try:
+            branch, files = self._render_artifacts(project_id, task_id, requirement, artifacts)
+            repo = self._github(git_url, git_token, "GET", "")
+            base_branch = repo.get("default_branch", "main") if isinstance(repo, dict) else "main"
+            ref = self._github(git_url, git_token, "GET", f"git/ref/heads/{base_branch}")
+            base_sha = ref["object"]["sha"]
+            base_commit = self._github(git_url, git_token, "GET", f"git/commits/{base_sha}")
+            tree = self._github(git_url, git_token, "POST", "git/trees", body={
+                "base_tree": base_commit["tree"]["sha"],
+                "tree": [
+                    {"path": path, "mode": "100644", "type": "blob", "content": content}
+                    for path, content in files.items()
+                ],
+            })
+            commit = self._github(git_url, git_token, "POST", "git/commits", body={
+                "message": f"AI Factory: {project_id} - {requirement[:80]}",
+                "tree": tree["sha"],
+                "parents": [base_sha],
+                "author": {"name": "AI Factory", "email": "ai-factory@unicon.ai"},
+            })
+            self._github(git_url, git_token, "POST", "git/refs", body={
+                "ref": f"refs/heads/{branch}",
+                "sha": commit["sha"],
+            })
+            return {
+                "status": "pushed",
+                "branch": branch,
+                "files": len(files),
+                "git_url": git_url,
+            }
+        except Exception as e:
+            return {"status": "failed", "error": str(e)}
+
+    def _push_artifacts_clone(
+        self,
+        git_url: str,
+        git_token: str,
+        project_id: str,
+        task_id: str,
+        requirement: str,
+        artifacts: dict[str, str],
+    ) -> dict:
+        """Clone repo, write artifacts, commit, push. Returns status dict."""
+        return asyncio.run(self._push_artifacts_clone_async(
+            git_url, git_token, project_id, task_id, requirement, artifacts
+        ))
+
+    async def _push_artifacts_clone_async(
+        self,
+        git_url: str,
+        git_token: str,
+        project_id: str,
+        task_id: str,
+        requirement: str,
+        artifacts: dict[str, str],
+    ) -> dict:
         tmpdir = tempfile.mkdtemp(prefix="aifactory-git-")
         try:
-            auth_url = self._inject_token(git_url, git_token)
+            auth_url = inject_token(git_url, git_token)
 
             # Clone (shallow) — use auth URL + non-interactive env
-            self._run(["git", "clone", "--depth", "1", auth_url, tmpdir])
+            await self._arun(["git", "clone", "--depth", "1", auth_url, tmpdir])
 
             # Re-set remote origin to auth URL so push also uses it
-            self._run(["git", "remote", "set-url", "origin", auth_url], cwd=tmpdir)
+            await self._arun(["git", "remote", "set-url", "origin", auth_url], cwd=tmpdir)
 
             # Create branch
-            short_task = task_id[:12] if len(task_id) > 12 else task_id
-            branch = f"ai-factory/{project_id}/{short_task}"
-            self._run(["git", "checkout", "-b", branch], cwd=tmpdir)
-
-            # Write artifacts
-            out_dir = os.path.join(tmpdir, "ai-factory-output", project_id, short_task)
-            os.makedirs(out_dir, exist_ok=True)
-
-            # README with summary
-            readme = "# AI Factory Output\n\n"
-            readme += f"**Project:** {project_id}  \n"
-            readme += f"**Task:** {task_id}  \n"
-            readme += f"**Requirement:** {requirement}  \n"
-            readme += f"**Generated:** {datetime.now(UTC).isoformat()}  \n\n"
-            readme += "## Teams\n\n"
-            for team in artifacts:
-                readme += f"- [{team}](./{team}.md)\n"
-            with open(os.path.join(out_dir, "README.md"), "w") as f:
-                f.write(readme)
-
-            # Per-team artifact files
-            for team, artifact in artifacts.items():
-                path = os.path.join(out_dir, f"{team}.md")
-                with open(path, "w") as f:
-                    f.write(f"# {team}\n\n```\n{artifact}\n```\n")
+            branch, files = self._render_artifacts(project_id, task_id, requirement, artifacts)
+            await self._arun(["git", "checkout", "-b", branch], cwd=tmpdir)
+
+            # Write artifacts — all files share one output dir, so create it
+            # once and write each file in a single call.
+            root = Path(tmpdir)
+            for parent in {(root / p).parent for p in files}:
+                parent.mkdir(parents=True, exist_ok=True)
+            for rel_path, content in files.items():
+                (root / rel_path).write_text(content, encoding="utf-8")
 
             # Commit and push — include identity + non-interactive guards
             git_env = {
@@ -132,13 +269,13 @@ class GitArtifactStore:
                 "GIT_COMMITTER_EMAIL": "ai-factory@unicon.ai",
                 **_GIT_NONINTERACTIVE_ENV,
             }
-            self._run(["git", "add", "."], cwd=tmpdir, env=git_env)
-            self._run(
+            await self._arun(["git", "add", "."], cwd=tmpdir, env=git_env)
+            await self._arun(
                 ["git", "commit", "-m", f"AI Factory: {project_id} - {requirement[:80]}"],
                 cwd=tmpdir,
                 env=git_env,
             )
-            self._run(
+            await self._arun(
                 ["git", "push", "--set-upstream", "origin", branch],
                 cwd=tmpdir,
                 env=git_env,
@@ -147,7 +284,7 @@ class GitArtifactStore:
             return {
                 "status": "pushed",
                 "branch": branch,
-                "files": len(artifacts) + 1,
+                "files": len(files),
                 "git_url": git_url,
             }
         except Exception as e:
@@ -155,30 +292,69 @@ class GitArtifactStore:
         finally:
             shutil.rmtree(tmpdir, ignore_errors=True)
 
+    @staticmethod
+    def _render_artifacts(
+        project_id: str,
+        task_id: str,
+        requirement: str,
+        artifacts: dict[str, str],
+    ) -> tuple[str, dict[str, str]]:
+        """Return (branch, {repo-relative path: content}) for a pipeline run."""
+        short_task = task_id[:12] if len(task_id) > 12 else task_id
+        branch = f"ai-factory/{project_id}/{short_task}"
+        out_dir = f"ai-factory-output/{project_id}/{short_task}"
+
+        # README with summary
+        readme = "# AI Factory Output\n\n"
+        readme += f"**Project:** {project_id}  \n"
+        readme += f"**Task:** {task_id}  \n"
+        readme += f"**Requirement:** {requirement}  \n"
+        readme += f"**Generated:** {datetime.now(UTC).isoformat()}  \n\n"
+        readme += "## Teams\n\n"
+        for team in artifacts:
+            readme += f"- [{team}](./{team}.md)\n"
+        files = {f"{out_dir}/README.md": readme}
+
+        # Per-team artifact files
+        for team, artifact in artifacts.items():
+            files[f"{out_dir}/{team}.md"] = f"# {team}\n\n```\n{artifact}\n```\n"
+        return branch, files
+
     # ── internal helpers ─────────────────────────────────────
     # ── GitHub REST API helpers ───────────────────────────────────────────
 
     @staticmethod
     def _parse_github_repo(git_url: str) -> tuple[str, str]:
         """Return (owner, repo) from a GitHub HTTPS or SSH URL."""
-        import re
-        m = re.search(r'github\.com[:/]([^/]+)/([^/\s]+?)(?:\.git)?$', git_url)
+        m = _GITHUB_URL_RE.search(git_url)
         if not m:
             raise ValueError(f"Not a GitHub URL: {git_url}")
         return m.group(1), m.group(2)
 
-    def _github(self, git_url: str, git_token: str,
-                method: str, endpoint: str,
-                body: dict | None = None) -> dict | list:
-        """Make a GitHub REST API call."""
-        import httpx
-        owner, repo = self._parse_github_repo(git_url)
-        url = f"https://api.github.com/repos/{owner}/{repo}/{endpoint}"
-        headers = {
+    @staticmethod
+    def _is_github(git_url: str) -> bool:
+        return _GITHUB_URL_RE.search(git_url) is not None
+
+    @classmethod
+    def _api_base(cls, git_url: str) -> str:
+        owner, repo = cls._parse_github_repo(git_url)
+        return f"https://api.github.com/repos/{owner}/{repo}"
+
+    @staticmethod
+    def _headers(git_token: str) -> dict[str, str]:
+        return {
             "Authorization": f"Bearer {git_token}",
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28",
         }
+
+    def _github(self, git_url: str, git_token: str,
+                method: str, endpoint: str,
+                body: dict | None = None) -> dict | list:
+        """Make a GitHub REST API call."""
+        base = self._api_base(git_url)
+        url = f"{base}/{endpoint}" if endpoint else base
+        headers = self._headers(git_token)
         with httpx.Client(timeout=15.0) as client:
             if method == "GET":
                 resp = client.get(url, headers=headers)
@@ -294,36 +470,25 @@ class GitArtifactStore:
     # ── internal helpers ─────────────────────────────────────────────────
 
     @staticmethod
-    def _inject_token(url: str, token: str) -> str:
-        """Insert a Personal Access Token into an HTTPS git URL."""
-        if not token:
-            return url
-        # Strip any existing credentials first
-        if "@" in url and "://" in url:
-            scheme, rest = url.split("://", 1)
-            rest = rest.split("@", 1)[1]  # drop existing user:pass@
-            url = f"{scheme}://{rest}"
-        if url.startswith("https://"):
-            return url.replace("https://", f"https://x-access-token:{token}@")
-        if url.startswith("http://"):
-            return url.replace("http://", f"http://x-access-token:{token}@")
-        return url
-
-    @staticmethod
-    def _run(cmd: list[str], cwd: str | None = None, env: dict | None = None) -> str:
+    async def _arun(cmd: list[str], cwd: str | None = None, env: dict | None = None) -> str:
         full_env = dict(os.environ)
         # Always disable interactive prompts (Cloud Run has no TTY)
         full_env.update(_GIT_NONINTERACTIVE_ENV)
         if env:
             full_env.update(env)
-        result = subprocess.run(
-            cmd,
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
             cwd=cwd,
             env=full_env,
-            capture_output=True,
-            text=True,
-            timeout=120,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        if result.returncode != 0:
-            raise RuntimeError(f"git failed: {' '.join(cmd)}\n{result.stderr}")
-        return result.stdout
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=120)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise RuntimeError(f"git timed out: {' '.join(cmd)}") from None
+        if proc.returncode != 0:
+            raise RuntimeError(f"git failed: {' '.join(cmd)}\n{stderr.decode(errors='replace')}")
+        return stdout.decode(errors="replace")
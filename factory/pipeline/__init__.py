@@ -0,0 +1,3 @@
+def count_lines(text: str) -> int:
+    """``len(text.splitlines())`` for newline-separated text, without building the list."""
+    return text.count("\n") + (1 if text and not text.endswith("\n") else 0)
@@ -1,3 +1,4 @@
+import concurrent.futures
 from dataclasses import dataclass
 
 from factory.agents.phase1_operatives import (
@@ -8,7 +9,8 @@ from factory.agents.phase1_operatives import (
     solution_arch_operative,
 )
 from factory.agents.task_result import TaskResult
-from factory.memory.memory_controller import MemoryController
+from factory.memory.memory_controller import MemoryController, recall_many, retain_many
+from factory.pipeline import count_lines
 
 
 @dataclass
@@ -38,34 +40,51 @@ class Phase1Pipeline:
     def run(self, ctx: Phase1Context) -> Phase1RunOutput:
         outputs: list[TaskResult] = []
         artifacts: dict[str, str] = {}
+        bank_ids = {team: f"team-{team}" for team in self.teams}
 
-        ba = biz_analysis_operative(ctx.requirement)
-        artifacts[ba.team] = ba.artifact
+        # The operative chain is a strict data dependency (each consumes its
+        # predecessor's artifact), but the priors depend on none of it — so
+        # the one batched recall runs alongside the chain.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="phase1") as pool:
+            priors_future = pool.submit(recall_many, self.memory, bank_ids.values())
 
-        arch = solution_arch_operative(ctx.requirement, ba.artifact)
-        artifacts[arch.team] = arch.artifact
+            ba = biz_analysis_operative(ctx.requirement)
+            artifacts[ba.team] = ba.artifact
 
-        be = backend_eng_operative(ctx.requirement, arch.artifact)
-        artifacts[be.team] = be.artifact
+            arch = solution_arch_operative(ctx.requirement, ba.artifact)
+            artifacts[arch.team] = arch.artifact
 
-        qa = qa_eng_operative(be.artifact)
-        artifacts[qa.team] = qa.artifact
+            be = backend_eng_operative(ctx.requirement, arch.artifact)
+            artifacts[be.team] = be.artifact
 
-        docs = docs_team_operative(ctx.requirement, qa.artifact)
-        artifacts[docs.team] = docs.artifact
+            qa = qa_eng_operative(be.artifact)
+            artifacts[qa.team] = qa.artifact
 
+            docs = docs_team_operative(ctx.requirement, qa.artifact)
+            artifacts[docs.team] = docs.artifact
+
+            priors = priors_future.result()
+
+        # One batched retain for all teams
+        summaries: dict[str, str] = {}
         for team in self.teams:
-            bank_id = f"team-{team}"
-            recalled = self.memory.recall(bank_id)
             artifact = artifacts.get(team, "")
-            summary = f"Processed by {team}. prior={len(recalled)} artifact_lines={len(artifact.splitlines())}"
-            self.memory.retain(bank_id, f"{ctx.project_id}:{summary}:{artifact[:120]}")
+            summaries[team] = f"Processed by {team}. prior={len(priors.get(bank_ids[team], []))} artifact_lines={count_lines(artifact)}"
+        retain_many(
+            self.memory,
+            [
+                (bank_ids[team], f"{ctx.project_id}:{summaries[team]}:{artifacts.get(team, '')[:120]}")
+                for team in self.teams
+            ],
+        )
+
+        for team in self.teams:
             outputs.append(
                 TaskResult(
                     team=team,
                     objective=ctx.requirement,
                     status="COMPLETE",
-                    reasoning=summary,
+                    reasoning=summaries[team],
                     verified_facts=["phase1-operative", f"artifact:{team}"],
                 )
             )
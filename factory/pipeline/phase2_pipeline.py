@@ -1,31 +1,85 @@
+import asyncio
 import concurrent.futures
+import functools
 import logging
+import threading
 from dataclasses import dataclass
+from typing import ClassVar
 
 from factory.agents.phase2_handlers import extract_handoff_to, run_phase2_handler
 from factory.agents.task_result import TaskResult
 from factory.llm.runtime import TeamLLMRuntime
-from factory.memory.memory_controller import RemoteMemoryController
+from factory.memory.memory_controller import RemoteMemoryController, recall_many, retain_many
+from factory.pipeline import count_lines
 
 log = logging.getLogger(__name__)
 
-# Teams that can run in parallel within each wave.
-# Wave N completes before Wave N+1 starts, preserving dependency order while
-# maximising throughput across independent teams.
+# Per-team predecessors.  A team starts as soon as every predecessor has
+# finished — there are no wave barriers, so one slow team only delays its own
+# descendants and end-to-end latency tracks the critical path.
 #
-# KEY CHANGE: solution_arch runs ALONE in wave 2 so its ADR / architecture
-# decisions are available to api_design and ux_ui in wave 3.
-# Every subsequent wave receives the accumulated shared_knowledge from all
-# prior knowledge-producing teams.
-EXECUTION_WAVES: list[list[str]] = [
-    ["product_mgmt", "biz_analysis"],                                        # Wave 1: requirements
-    ["solution_arch"],                                                        # Wave 2: architecture (solo — feeds ALL downstream)
-    ["api_design", "ux_ui"],                                                  # Wave 3: design (knows Sol Arch ADR)
-    ["frontend_eng", "backend_eng", "database_eng", "data_eng", "ml_eng"],   # Wave 4: implementation
-    ["security_eng", "compliance", "devops"],                                 # Wave 5: ops & security
-    ["qa_eng", "sre_ops"],                                                    # Wave 6: quality
-    ["docs_team", "feature_eng"],                                             # Wave 7: docs & closure
-]
+# solution_arch depends only on the requirements teams and everything design-
+# or implementation-related descends from it, so its ADR reaches all of them.
+# Each team receives the shared knowledge of its knowledge-producing ancestors,
+# so the edges also make every producer of an earlier stage (requirements →
+# architecture → design → implementation → ops & security → quality → docs)
+# an ancestor of every later-stage team.
+TEAM_DEPENDENCIES: dict[str, list[str]] = {
+    "product_mgmt":  [],                                          # requirements
+    "biz_analysis":  [],
+    "solution_arch": ["product_mgmt", "biz_analysis"],            # architecture — feeds ALL downstream
+    "api_design":    ["solution_arch"],                           # design
+    "ux_ui":         ["solution_arch"],
+    "frontend_eng":  ["api_design", "ux_ui"],                     # implementation
+    "backend_eng":   ["api_design", "ux_ui"],
+    "database_eng":  ["api_design", "ux_ui"],
+    "data_eng":      ["api_design", "ux_ui"],
+    "ml_eng":        ["api_design", "ux_ui"],
+    "security_eng":  ["frontend_eng", "backend_eng", "database_eng"],  # ops & security
+    "compliance":    ["backend_eng", "database_eng", "data_eng"],
+    "devops":        ["frontend_eng", "backend_eng", "database_eng"],
+    "qa_eng":        ["security_eng", "devops"],                  # quality
+    "sre_ops":       ["security_eng", "devops"],
+    "docs_team":     ["qa_eng", "devops"],                        # docs & closure
+    "feature_eng":   ["qa_eng"],
+}
+
+
+def _ancestors(deps: dict[str, list[str]]) -> dict[str, frozenset[str]]:
+    """Transitive predecessors per team; raises ValueError on a cycle."""
+    result: dict[str, frozenset[str]] = {}
+    visiting: set[str] = set()
+
+    def _visit(team: str) -> frozenset[str]:
+        if team in result:
+            return result[team]
+        if team in visiting:
+            raise ValueError(f"Dependency cycle through {team!r}")
+        visiting.add(team)
+        acc: set[str] = set()
+        for pred in deps.get(team, []):
+            acc.add(pred)
+            acc |= _visit(pred)
+        visiting.discard(team)
+        result[team] = frozenset(acc)
+        return result[team]
+
+    for team in deps:
+        _visit(team)
+    return result
+
+
+_TEAM_ANCESTORS = _ancestors(TEAM_DEPENDENCIES)
+
+
+def _topological_order(teams: list[str]) -> list[str]:
+    """``teams`` reordered so every team follows all of its ancestors."""
+    return sorted(teams, key=lambda t: len(_TEAM_ANCESTORS.get(t, ())))
+
+# Default size of the pipeline's shared worker pool.  A single run never has
+# more than 5 teams in flight (the DAG's widest antichain); the headroom is for
+# concurrent runs.
+_POOL_WORKERS = 16
 
 # Teams whose output is worth sharing as upstream context to later teams.
 # ALL key decision-making and implementation teams contribute to the shared KB so
@@ -33,7 +87,7 @@ EXECUTION_WAVES: list[list[str]] = [
 _KNOWLEDGE_PRODUCERS = frozenset({
     "product_mgmt",   # MVP scope + features
     "biz_analysis",   # Acceptance criteria
-    "solution_arch",  # ADR + tech stack (most critical — runs solo in wave 2)
+    "solution_arch",  # ADR + tech stack (most critical — ancestor of all design/impl teams)
     "api_design",     # API contract
     "ux_ui",          # Screen inventory + design tokens
     "backend_eng",    # Endpoint implementations + auth patterns
@@ -79,113 +133,178 @@ class Phase2Pipeline:
         "docs_team",
         "feature_eng",
     ]
+    # Derived from ``teams`` once per class, not on every run
+    _TEAM_ORDER: ClassVar[dict[str, int]] = {t: i for i, t in enumerate(teams)}
+    _EXPECTED_HANDOFF: ClassVar[dict[str, str]] = dict(zip(teams, teams[1:] + ["none"]))
 
-    def __init__(self, memory: RemoteMemoryController, llm_runtime: TeamLLMRuntime | None = None) -> None:
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._TEAM_ORDER = {t: i for i, t in enumerate(cls.teams)}
+        cls._EXPECTED_HANDOFF = dict(zip(cls.teams, cls.teams[1:] + ["none"]))
+
+    def __init__(
+        self,
+        memory: RemoteMemoryController,
+        llm_runtime: TeamLLMRuntime | None = None,
+        max_workers: int = _POOL_WORKERS,
+    ) -> None:
         self.memory = memory
         self.llm_runtime = llm_runtime
+        # One pool for every run (created on first use) — teams don't pay
+        # thread create/join.  Shared by concurrent runs, so it is sized above
+        # the per-run peak.
+        self._max_workers = max_workers
+        self._pool: concurrent.futures.ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="phase2"
+                )
+            return self._pool
+
+    def close(self) -> None:
+        """Shut down the worker pool; a later ``run`` starts a fresh one."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def __enter__(self) -> "Phase2Pipeline":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
     def run(self, ctx: Phase2Context) -> Phase2RunOutput:
-        """Execute teams in dependency waves (parallel within each wave).
+        """Synchronous entry point — runs :meth:`run_async` on a fresh loop."""
+        return asyncio.run(self.run_async(ctx))
+
+    async def run_async(self, ctx: Phase2Context) -> Phase2RunOutput:
+        """Execute teams as a dependency DAG (parallel wherever deps allow).
 
-        Knowledge produced by earlier waves (Sol Arch ADR, BA acceptance criteria,
-        PM features) is accumulated and passed to every subsequent team so they can
-        build on top of prior decisions rather than starting from scratch.
+        Each team is a coroutine that awaits its predecessors' tasks, so it
+        starts the moment they finish.  Handlers (LLM + tool calls) are
+        blocking, so they run on the pipeline's worker pool.
+
+        Knowledge produced by upstream teams (Sol Arch ADR, BA acceptance
+        criteria, PM features) is passed to every descendant so it can build on
+        top of prior decisions rather than starting from scratch.
         """
         outputs: list[TaskResult] = []
         artifacts: dict[str, str] = {}
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+
+        # Harvested decision knowledge, keyed by producing team
+        knowledge: dict[str, str] = {}
+        # Joined context per set of contributing teams — siblings with the same
+        # producing ancestors (e.g. backend_eng / database_eng) share one string
+        joined: dict[tuple[str, ...], str] = {}
+
+        def _build_shared_knowledge(team: str) -> str:
+            ancestors = _TEAM_ANCESTORS.get(team, frozenset())
+            key = tuple(t for t in self.teams if t in ancestors and t in knowledge)[-10:]
+            if key not in joined:
+                joined[key] = "\n\n".join(knowledge[t] for t in key)
+            return joined[key]
 
-        # Rolling knowledge base — grows as waves complete
-        knowledge_log: list[str] = []
-
-        def _build_shared_knowledge() -> str:
-            return "\n\n".join(knowledge_log[-10:])
-
-        def _run_team(team: str, shared_knowledge: str) -> tuple[str, object]:
-            bank_id = f"team-{team}"
-            prior = self.memory.recall(bank_id=bank_id, limit=3)
-            stage = run_phase2_handler(
-                team=team,
-                requirement=ctx.requirement,
-                prior_count=len(prior),
-                llm_runtime=self.llm_runtime,
-                shared_knowledge=shared_knowledge,
+        # A team only ever recalls its own bank, which nothing in this run
+        # writes before the team itself finishes — so priors can be read
+        # ahead of time, and all retains flushed in one batch at the end.
+        # Root teams get a small batch of their own so they start at once;
+        # everyone else's priors are prefetched while the roots run.
+        roots = [t for t in self.teams if not TEAM_DEPENDENCIES.get(t)]
+        rest = [t for t in self.teams if TEAM_DEPENDENCIES.get(t)]
+        roots_recall = loop.run_in_executor(pool, recall_many, self.memory, [f"team-{t}" for t in roots], 3)
+        rest_recall = loop.run_in_executor(pool, recall_many, self.memory, [f"team-{t}" for t in rest], 3)
+        priors_for = {t: roots_recall for t in roots} | {t: rest_recall for t in rest}
+        retains: list[tuple[str, str]] = []
+
+        async def _run_team(team: str) -> None:
+            preds = [tasks[p] for p in TEAM_DEPENDENCIES.get(team, []) if p in tasks]
+            if preds:
+                await asyncio.gather(*preds)
+            try:
+                # Inside the try, as the per-team recall always was — a memory
+                # failure becomes this team's fallback artifact, not the run's
+                prior = (await priors_for[team]).get(f"team-{team}", [])
+                stage = await loop.run_in_executor(
+                    pool,
+                    functools.partial(
+                        run_phase2_handler,
+                        team=team,
+                        requirement=ctx.requirement,
+                        prior_count=len(prior),
+                        llm_runtime=self.llm_runtime,
+                        shared_knowledge=_build_shared_knowledge(team),
+                    ),
+                )
+            except Exception as exc:
+                log.warning("Phase2 team %s failed: %s", team, exc)
+                from factory.agents.phase2_handlers import Phase2StageArtifact
+                stage = Phase2StageArtifact(
+                    team=team,
+                    artifact=f"P2:{team}\n- requirement: {ctx.requirement}\n- action: fallback (error: {exc})\n- handoff_to: none",
+                )
+            else:
+                summary = f"phase2-stage={team} prior={len(prior)} artifact_lines={count_lines(stage.artifact)}"
+                retains.append((f"team-{team}", f"{ctx.project_id}:{summary}:{stage.artifact[:120]}"))
+            artifacts[team] = stage.artifact
+            summary = f"phase2-stage={team} artifact_lines={count_lines(stage.artifact)}"
+            outputs.append(
+                TaskResult(
+                    team=team,
+                    objective=ctx.requirement,
+                    status="COMPLETE",
+                    reasoning=summary,
+                    verified_facts=["phase2-kickoff", f"artifact:{team}"],
+                )
             )
-            summary = f"phase2-stage={team} prior={len(prior)} artifact_lines={len(stage.artifact.splitlines())}"
-            self.memory.retain(bank_id=bank_id, item=f"{ctx.project_id}:{summary}:{stage.artifact[:120]}")
-            return team, stage
-
-        # Execute each wave; teams within a wave run in parallel
-        for wave in EXECUTION_WAVES:
-            wave_teams = [t for t in wave if t in self.teams]
-            if not wave_teams:
-                continue
-
-            # Snapshot knowledge before starting this wave (all teams in the wave
-            # see the same knowledge — knowledge from the SAME wave is not shared
-            # within the wave since they run in parallel)
-            wave_knowledge = _build_shared_knowledge()
-
-            max_workers = min(len(wave_teams), 5)  # cap to avoid rate-limit bursts
-            wave_stages: dict[str, object] = {}
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
-                futures = {pool.submit(_run_team, t, wave_knowledge): t for t in wave_teams}
-                for fut in concurrent.futures.as_completed(futures):
-                    try:
-                        team, stage = fut.result()
-                    except Exception as exc:
-                        team = futures[fut]
-                        log.warning("Phase2 wave team %s failed: %s", team, exc)
-                        from factory.agents.phase2_handlers import Phase2StageArtifact
-                        stage = Phase2StageArtifact(
-                            team=team,
-                            artifact=f"P2:{team}\n- requirement: {ctx.requirement}\n- action: fallback (error: {exc})\n- handoff_to: none",
-                        )
-                    artifacts[team] = stage.artifact
-                    wave_stages[team] = stage
-                    summary = f"phase2-stage={team} artifact_lines={len(stage.artifact.splitlines())}"
-                    outputs.append(
-                        TaskResult(
-                            team=team,
-                            objective=ctx.requirement,
-                            status="COMPLETE",
-                            reasoning=summary,
-                            verified_facts=["phase2-kickoff", f"artifact:{team}"],
-                        )
-                    )
-
-            # After the wave completes, harvest knowledge from key producers.
+
+            # Harvest knowledge from key producers for descendants.
             # Solution Arch is the most critical — capture its full ADR content.
-            for team in wave_teams:
-                if team in _KNOWLEDGE_PRODUCERS:
-                    stage = wave_stages.get(team)
-                    rationale = getattr(stage, "decision_rationale", "") or ""
-                    title = getattr(stage, "decision_title", team) or team
-                    # Sol Arch ADR is the foundation — give it 3x the space
-                    max_chars = 3000 if team == "solution_arch" else 1500
-                    if rationale:
-                        knowledge_log.append(
-                            f"[{team.replace('_', ' ').title()}] {title}:\n{rationale[:max_chars]}"
-                        )
+            if team in _KNOWLEDGE_PRODUCERS:
+                rationale = getattr(stage, "decision_rationale", "") or ""
+                title = getattr(stage, "decision_title", team) or team
+                # Sol Arch ADR is the foundation — give it 3x the space
+                max_chars = 3000 if team == "solution_arch" else 1500
+                if rationale:
+                    knowledge[team] = f"[{team.replace('_', ' ').title()}] {title}:\n{rationale[:max_chars]}"
+
+        # Create tasks in dependency order so predecessors always exist
+        tasks: dict[str, asyncio.Task] = {}
+        for team in _topological_order(self.teams):
+            tasks[team] = asyncio.create_task(_run_team(team))
+        await asyncio.gather(*tasks.values())
+
+        try:
+            await loop.run_in_executor(pool, retain_many, self.memory, retains)
+        except Exception as exc:
+            # Memory is best-effort — the artifacts are already produced
+            log.warning("Phase2 memory retain failed: %s", exc)
 
         # Sort outputs to match the canonical team ordering
-        team_order = {t: i for i, t in enumerate(self.teams)}
+        team_order = self._TEAM_ORDER
         outputs.sort(key=lambda r: team_order.get(r.team, 999))
 
         handoffs: list[dict[str, str | bool]] = []
-        for idx, team in enumerate(self.teams):
-            expected = self.teams[idx + 1] if idx < len(self.teams) - 1 else "none"
+        overall_handoff_ok = True
+        for team, expected in self._EXPECTED_HANDOFF.items():
             observed = extract_handoff_to(artifacts.get(team, ""))
+            ok = observed == expected
+            overall_handoff_ok &= ok
             handoffs.append(
                 {
                     "team": team,
                     "expected_handoff_to": expected,
                     "observed_handoff_to": observed,
-                    "ok": observed == expected,
+                    "ok": ok,
                 }
             )
 
-        overall_handoff_ok = all(bool(x["ok"]) for x in handoffs)
-
         return Phase2RunOutput(
             results=outputs,
             artifacts=artifacts,
@@ -1,6 +1,12 @@
 from dataclasses import dataclass
+import atexit
+import functools
+import hashlib
+import heapq
+import importlib.util
 import os
 import re
+import threading
 
 import httpx
 
@@ -12,8 +18,109 @@ class QAMatch:
     score: float
 
 
-def _tokens(text: str) -> set[str]:
-    return set(re.findall(r"[a-zA-Z0-9_]+", text.lower()))
+@functools.lru_cache(maxsize=1)
+def _http() -> httpx.Client:
+    """Process-wide client — keeps the proxy connection alive between questions."""
+    client = httpx.Client(
+        timeout=30,
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    )
+    atexit.register(client.close)
+    return client
+
+
+# Answers cached per (proxy, model, prompt digest).  The prompt embeds the
+# full memory context, so a hit means the same question against unchanged
+# memory.  No TTL — entries only leave by LRU eviction; set QA_DISABLE_CACHE
+# to always go to the proxy.
+_ANSWER_CACHE_MAX = 256
+_answer_cache: dict[tuple[str, str, bytes], str] = {}
+_answer_lock = threading.Lock()
+
+# Byte table keeping [a-zA-Z0-9_] and mapping every other byte to a space
+_TOKEN_CHARS = frozenset(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+_TOKEN_TRANS = bytes(c if c in _TOKEN_CHARS else 0x20 for c in range(256))
+# Used for non-ASCII text, where the byte table doesn't apply
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9_]+")
+
+
+@functools.lru_cache(maxsize=4096)
+def _tokens(text: str) -> frozenset[str]:
+    # Cached: the same memory snippets are scored on every question
+    text = text.lower()
+    if not text.isascii():
+        return frozenset(_TOKEN_RE.findall(text))
+    return frozenset(text.encode("ascii").translate(_TOKEN_TRANS).decode("ascii").split())
+
+
+class _QAIndex:
+    """Inverted index over a memory snapshot: token -> ids of items containing it.
+
+    Scoring then only touches items that share at least one token with the
+    question instead of every item in every bank.
+    """
+
+    __slots__ = ("items", "token_sets", "index")
+
+    def __init__(self, memory_snapshot: dict[str, list[str]]) -> None:
+        self.items: list[tuple[str, str]] = []
+        self.token_sets: list[frozenset[str]] = []
+        self.index: dict[str, list[int]] = {}
+        for bank_id, items in memory_snapshot.items():
+            for item in items:
+                item_tokens = _tokens(item)
+                if not item_tokens:
+                    continue
+                item_id = len(self.items)
+                self.items.append((bank_id, item))
+                self.token_sets.append(item_tokens)
+                for tok in item_tokens:
+                    self.index.setdefault(tok, []).append(item_id)
+
+    def candidates(self, q: frozenset[str]) -> list[int]:
+        """Ids of items sharing a token with ``q``, in snapshot order."""
+        ids: set[int] = set()
+        for tok in q:
+            ids.update(self.index.get(tok, ()))
+        return sorted(ids)
+
+
+# Indexes cached by snapshot content digest.  Callers load a fresh snapshot
+# dict per request, so identity can't be the key; hashing the items is far
+# cheaper than re-tokenising and re-indexing them.
+_INDEX_CACHE_MAX = 16
+_index_cache: dict[bytes, _QAIndex] = {}
+_index_lock = threading.Lock()
+
+
+def _snapshot_digest(memory_snapshot: dict[str, list[str]]) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    for bank_id, items in memory_snapshot.items():
+        # Length-prefixed so ("ab", "c") and ("a", "bc") hash differently
+        for part in (bank_id, *items):
+            raw = str(part).encode("utf-8", "surrogatepass")
+            h.update(len(raw).to_bytes(8, "little"))
+            h.update(raw)
+        h.update(b"\xff" * 8)  # bank terminator — no length prefix is this large
+    return h.digest()
+
+
+def _index_for(memory_snapshot: dict[str, list[str]]) -> _QAIndex:
+    """The _QAIndex for ``memory_snapshot``, built once per distinct content."""
+    key = _snapshot_digest(memory_snapshot)
+    with _index_lock:
+        index = _index_cache.pop(key, None)
+        if index is not None:
+            _index_cache[key] = index  # re-insert as most recent
+            return index
+    index = _QAIndex(memory_snapshot)
+    with _index_lock:
+        if len(_index_cache) >= _INDEX_CACHE_MAX:
+            # Drop the least recently used entry (dicts keep insertion order)
+            _index_cache.pop(next(iter(_index_cache)))
+        _index_cache[key] = index
+    return index
 
 
 def _call_llm(question: str, context: str) -> str:
@@ -28,16 +135,31 @@ def _call_llm(question: str, context: str) -> str:
         f"=== User Question ===\n{question}\n\n"
         "Answer concisely and helpfully:"
     )
+    use_cache = not os.getenv("QA_DISABLE_CACHE")
+    key = (proxy_url, model, hashlib.blake2b(prompt.encode(), digest_size=16).digest())
+    if use_cache:
+        with _answer_lock:
+            answer = _answer_cache.pop(key, None)
+            if answer is not None:
+                _answer_cache[key] = answer  # re-insert as most recent
+                return answer
     try:
-        resp = httpx.post(
+        resp = _http().post(
             f"{proxy_url}/chat/completions",
             json={"model": model, "messages": [{"role": "user", "content": prompt}], "max_tokens": 600},
-            timeout=30,
         )
         resp.raise_for_status()
-        return resp.json()["choices"][0]["message"]["content"].strip()
+        answer = resp.json()["choices"][0]["message"]["content"].strip()
     except Exception as e:
+        # Failures are not cached — the next ask retries the proxy
         return f"(LLM unavailable: {e})"
+    if use_cache:
+        with _answer_lock:
+            if len(_answer_cache) >= _ANSWER_CACHE_MAX:
+                # Drop the least recently used entry (dicts keep insertion order)
+                _answer_cache.pop(next(iter(_answer_cache)))
+            _answer_cache[key] = answer
+    return answer
 
 
 def answer_project_question(
@@ -47,21 +169,29 @@ def answer_project_question(
     top_k: int = 5,
 ) -> tuple[str, list[QAMatch]]:
     q = _tokens(question)
-    matches: list[QAMatch] = []
+    q_len = len(q)
+    index = _index_for(memory_snapshot)
+    # Min-heap of (score, -item_id, match) holding the best top_k so far;
+    # -item_id makes later items lose ties, matching a stable sort on score.
+    heap: list[tuple[float, int, QAMatch]] = []
 
-    for bank_id, items in memory_snapshot.items():
-        for item in items:
-            item_tokens = _tokens(item)
-            if not item_tokens:
-                continue
-            overlap = len(q & item_tokens)
-            union = len(q | item_tokens) or 1
-            score = overlap / union
-            if score > 0:
-                matches.append(QAMatch(bank_id=bank_id, snippet=item[:300], score=round(score, 4)))
-
-    matches.sort(key=lambda m: m.score, reverse=True)
-    top = matches[:top_k]
+    for item_id in index.candidates(q):
+        item_tokens = index.token_sets[item_id]
+        n = len(item_tokens)
+        # Jaccard can't exceed min/max of the two set sizes — skip items
+        # that couldn't displace the current worst of a full heap.
+        if top_k > 0 and len(heap) >= top_k and min(q_len, n) / max(q_len, n) < heap[0][0]:
+            continue
+        overlap = len(q & item_tokens)
+        score = round(overlap / (q_len + n - overlap), 4)
+        bank_id, item = index.items[item_id]
+        entry = (score, -item_id, QAMatch(bank_id=bank_id, snippet=item[:300], score=score))
+        if len(heap) < top_k:
+            heapq.heappush(heap, entry)
+        elif top_k > 0 and entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    top = [m for _, _, m in sorted(heap, key=lambda e: e[:2], reverse=True)]
 
     if not top:
         # Still try LLM but with any available broad context
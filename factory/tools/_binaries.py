@@ -0,0 +1,11 @@
+"""Binary lookup shared by the CLI-wrapping tools."""
+
+import shutil
+
+
+def resolve_binary(name: str) -> str:
+    """``name``'s absolute path on PATH, or ``name`` itself when it isn't found.
+
+    Tools call this once at import, so each invocation skips the PATH walk.
+    """
+    return shutil.which(name) or name
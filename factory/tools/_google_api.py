@@ -0,0 +1,42 @@
+"""Shared credentials and service objects for the Google Docs/Drive/Sheets tools.
+
+Uses Application Default Credentials (same SA as Cloud Run), or the service
+account file named by GOOGLE_APPLICATION_CREDENTIALS.
+"""
+
+import os
+import threading
+from collections.abc import Sequence
+from functools import lru_cache
+
+from google.oauth2 import service_account
+from googleapiclient.discovery import build
+
+# Credentials refresh themselves and are safe to share, so one set per scope
+# list serves the process.  Service objects ride on an httplib2.Http, which is
+# not thread-safe, so each thread builds its own once and keeps it.
+_local = threading.local()
+
+
+@lru_cache(maxsize=None)
+def _get_creds(scopes: tuple[str, ...]):
+    """Build credentials from ADC or explicit path."""
+    cred_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+    if cred_path:
+        return service_account.Credentials.from_service_account_file(cred_path, scopes=list(scopes))
+    # On Cloud Run, use default credentials
+    import google.auth
+    creds, _ = google.auth.default(scopes=list(scopes))
+    return creds
+
+
+def service(api: str, version: str, scopes: Sequence[str]):
+    """This thread's ``build(api, version)`` client for ``scopes``."""
+    key = (api, version, tuple(scopes))
+    services = getattr(_local, "services", None)
+    if services is None:
+        services = _local.services = {}
+    svc = services.get(key)
+    if svc is None:
+        svc = services[key] = build(api, version, credentials=_get_creds(key[2]), cache_discovery=False)
+    return svc
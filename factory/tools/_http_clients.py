@@ -0,0 +1,37 @@
+"""httpx client plumbing shared by the REST API tools."""
+
+import atexit
+import contextlib
+import importlib.util
+from collections.abc import AsyncIterator, Callable
+
+import httpx
+
+# HTTP/2 lets concurrent calls share one connection; needs the h2 package
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def process_client(**kwargs) -> httpx.Client:
+    """A client meant to live for the whole process; closed at exit.
+
+    Wrap the caller in ``lru_cache`` so the TLS connection stays alive between calls.
+    """
+    client = httpx.Client(http2=HTTP2, **kwargs)
+    atexit.register(client.close)
+    return client
+
+
+def async_client(**kwargs) -> httpx.AsyncClient:
+    return httpx.AsyncClient(http2=HTTP2, **kwargs)
+
+
+@contextlib.asynccontextmanager
+async def client_scope(
+    client: httpx.AsyncClient | None, new_client: Callable[[], httpx.AsyncClient]
+) -> AsyncIterator[httpx.AsyncClient]:
+    """``client`` if given, else one from ``new_client`` that lives for this one call."""
+    if client is not None:
+        yield client
+    else:
+        async with new_client() as own:
+            yield own
@@ -7,33 +7,87 @@ Env vars:
   BANDIT_BIN      — path to bandit binary (default: bandit)
   BANDIT_SEVERITY — min severity level: LOW | MEDIUM | HIGH (default: LOW)
   BANDIT_TIMEOUT  — subprocess timeout seconds (default: 60)
+  BANDIT_DAEMON   — serve scan_code from one long-lived bandit process (default: 0)
+  BANDIT_PYTHON   — interpreter with bandit installed, for the daemon (default: current)
 """
 
+import atexit
 import json
 import logging
 import os
+import select
 import subprocess
-import tempfile
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+
 log = logging.getLogger(__name__)
 
 BANDIT_BIN = os.getenv("BANDIT_BIN", "bandit")
 SEVERITY = os.getenv("BANDIT_SEVERITY", "LOW")
 TIMEOUT = int(os.getenv("BANDIT_TIMEOUT", "60"))
 
+# Findings returned per scan; counts still cover every issue
+_MAX_FINDINGS = 50
+
+# Opt-in: the daemon drives bandit's private BanditManager._parse_file,
+# which any bandit release may change; it falls back to the CLI if so.
+USE_DAEMON = os.getenv("BANDIT_DAEMON", "0") not in ("0", "false", "no")
+BANDIT_PYTHON = os.getenv("BANDIT_PYTHON", sys.executable)
+
+# Daemon loop: imports bandit and its plugins once, then answers one JSON line
+# {"src"} per scan with one JSON line {"results", "metrics", "errors"}.  The
+# source is parsed as "<stdin>", exactly as `bandit -` would.  Exits at once
+# (so scan_code falls back to the CLI) when _parse_file is gone.
+_DAEMON_SRC = """
+import io, json, sys
+from bandit.core import config, manager
+if not callable(getattr(manager.BanditManager, "_parse_file", None)):
+    sys.exit(3)
+conf = config.BanditConfig()
+for line in sys.stdin:
+    req = json.loads(line)
+    mgr = manager.BanditManager(conf, "file")
+    files = ["<stdin>"]
+    mgr._parse_file("<stdin>", io.BytesIO(req["src"].encode()), files)
+    mgr.files_list = files
+    mgr.metrics.aggregate()
+    out = {
+        "results": [i.as_dict() for i in mgr.get_issue_list()],
+        "metrics": mgr.metrics.data,
+        "errors": [{"filename": f, "reason": r} for f, r in mgr.get_skipped()],
+    }
+    sys.stdout.write(json.dumps(out) + "\\n")
+    sys.stdout.flush()
+"""
+
 
-def _run_bandit(args: list[str]) -> dict:
-    cmd = [BANDIT_BIN, "-f", "json"] + args
+def _loads(raw: bytes) -> dict:
+    """Parse bandit's JSON report, or {} when it isn't valid JSON."""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=TIMEOUT)
+        return orjson.loads(raw)
+    except ValueError:  # orjson.JSONDecodeError subclasses it
+        return {}
+
+
+def _run_bandit(args: list[str], stdin_bytes: bytes | None = None) -> dict:
+    # -q: past ~50 files bandit draws a progress bar on stdout, corrupting the JSON
+    cmd = [BANDIT_BIN, "-f", "json", "-q"] + args
+    try:
+        # Bytes, not text — both parsers take UTF-8 directly, so a large
+        # report is never copied into a str first
+        result = subprocess.run(cmd, input=stdin_bytes, capture_output=True, timeout=TIMEOUT)
         # bandit exits 1 when issues found — that's expected
         raw = result.stdout or result.stderr
-        try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
-            data = {}
-        return {"raw_output": raw, "data": data, "returncode": result.returncode}
+        return {
+            "raw_output": raw[:2000].decode(errors="replace"),
+            "data": _loads(raw),
+            "returncode": result.returncode,
+        }
     except FileNotFoundError:
         return {"raw_output": "", "data": {}, "returncode": -1,
                 "error": f"bandit not found — install with: pip install bandit"}
@@ -41,63 +95,153 @@ def _run_bandit(args: list[str]) -> dict:
         return {"raw_output": "", "data": {}, "returncode": -1, "error": "bandit timed out"}
 
 
-def _parse_results(data: dict) -> dict:
+class _BanditDaemon:
+    """One long-lived bandit process, so scans skip interpreter and plugin startup."""
+
+    def __init__(self) -> None:
+        self._proc = subprocess.Popen(
+            [BANDIT_PYTHON, "-c", _DAEMON_SRC],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._lock = threading.Lock()
+
+    def scan(self, src: str) -> dict:
+        """Report for ``src`` in bandit's JSON shape; raises if the daemon is unusable."""
+        request = json.dumps({"src": src}).encode() + b"\n"
+        with self._lock:
+            self._proc.stdin.write(request)
+            self._proc.stdin.flush()
+            ready, _, _ = select.select([self._proc.stdout], [], [], TIMEOUT)
+            if not ready:
+                raise TimeoutError("bandit daemon timed out")
+            line = self._proc.stdout.readline()
+        if not line:
+            raise EOFError("bandit daemon exited")
+        return _loads(line)
+
+    def close(self) -> None:
+        self._proc.kill()
+        self._proc.wait()
+
+
+_DAEMON: _BanditDaemon | None = None
+_daemon_broken = False
+_daemon_lock = threading.Lock()
+
+
+def _scan_with_daemon(src: str) -> dict | None:
+    """Daemon report for ``src``, or None once the daemon has failed."""
+    global _DAEMON, _daemon_broken
+    if not USE_DAEMON or _daemon_broken:
+        return None
+    with _daemon_lock:
+        if _DAEMON is None:
+            try:
+                _DAEMON = _BanditDaemon()
+            except OSError as e:
+                log.warning("bandit daemon unavailable (%s) — using per-scan subprocess", e)
+                _daemon_broken = True
+                return None
+        daemon = _DAEMON
+    try:
+        return daemon.scan(src)
+    except (OSError, EOFError, TimeoutError) as e:
+        # Typically bandit isn't importable from BANDIT_PYTHON; don't retry
+        log.warning("bandit daemon failed (%s) — using per-scan subprocess", e)
+        with _daemon_lock:
+            _daemon_broken = True
+            if _DAEMON is daemon:
+                _DAEMON = None
+        daemon.close()
+        return None
+
+
+@atexit.register
+def _close_daemon() -> None:
+    if _DAEMON is not None:
+        _DAEMON.close()
+
+
+def _parse_results(data: dict, full: bool = True) -> dict:
     results_list = data.get("results", [])
     metrics = data.get("metrics", {}).get("_totals", {})
+    if not full and "SEVERITY.HIGH" in metrics:
+        # Counts only: bandit already tallies severities in the totals
+        high = int(metrics.get("SEVERITY.HIGH", 0))
+        medium = int(metrics.get("SEVERITY.MEDIUM", 0))
+        low = int(metrics.get("SEVERITY.LOW", 0))
+        return {
+            "passed": high == 0 and medium == 0,
+            "total_issues": high + medium + low + int(metrics.get("SEVERITY.UNDEFINED", 0)),
+            "high": high,
+            "medium": medium,
+            "low": low,
+            "findings": [],
+        }
+    max_findings = _MAX_FINDINGS if full else 0
+    # One pass: tally every issue, but only build the dicts that are returned
+    sev_counts: Counter[str] = Counter()
     findings = []
     for r in results_list:
-        findings.append({
-            "test_id": r.get("test_id"),
-            "test_name": r.get("test_name"),
-            "severity": r.get("issue_severity"),
-            "confidence": r.get("issue_confidence"),
-            "file": r.get("filename"),
-            "line": r.get("line_number"),
-            "text": r.get("issue_text"),
-            "code": r.get("code", "").strip()[:200],
-        })
-    high = sum(1 for f in findings if f["severity"] == "HIGH")
-    medium = sum(1 for f in findings if f["severity"] == "MEDIUM")
-    low = sum(1 for f in findings if f["severity"] == "LOW")
+        sev_counts[r.get("issue_severity")] += 1
+        if len(findings) < max_findings:
+            findings.append({
+                "test_id": r.get("test_id"),
+                "test_name": r.get("test_name"),
+                "severity": r.get("issue_severity"),
+                "confidence": r.get("issue_confidence"),
+                "file": r.get("filename"),
+                "line": r.get("line_number"),
+                "text": r.get("issue_text"),
+                "code": r.get("code", "").strip()[:200],
+            })
+    high = sev_counts["HIGH"]
+    medium = sev_counts["MEDIUM"]
+    low = sev_counts["LOW"]
     return {
         "passed": high == 0 and medium == 0,
-        "total_issues": len(findings),
+        "total_issues": len(results_list),
         "high": high,
         "medium": medium,
         "low": low,
-        "findings": findings[:50],
+        "findings": findings,
     }
 
 
-def scan_code(code: str, filename: str = "code.py") -> dict:
+def scan_code(code: str, filename: str = "code.py", detailed: bool = True) -> dict:
     """Scan a Python code string with bandit.
 
     Args:
       code:     Python source code
       filename: Virtual filename used in report (default: code.py)
+      detailed: Build the findings list; False returns counts only (default True)
 
     Returns:
       {"passed": bool, "total_issues": int, "high": int, "medium": int, "low": int,
        "findings": list[{"test_id","severity","line","text","code"}]}
     """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(code)
-        tmp_path = f.name
-    try:
-        result = _run_bandit([tmp_path])
+    data = _scan_with_daemon(code)
+    if data is None:
+        # Fed on stdin ("-") — no temp file to create and unlink per scan
+        result = _run_bandit(["-"], stdin_bytes=code.encode())
         if "error" in result:
             return {"passed": True, "total_issues": 0, "high": 0, "medium": 0, "low": 0,
                     "findings": [], "error": result["error"]}
-        return _parse_results(result["data"])
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+        data = result["data"]
+    parsed = _parse_results(data, full=detailed)
+    for finding in parsed["findings"]:
+        finding["file"] = filename  # bandit reports stdin as "<stdin>"
+    return parsed
 
 
-def scan_file(filepath: str) -> dict:
+def scan_file(filepath: str, detailed: bool = True) -> dict:
     """Scan a Python file with bandit.
 
     Args:
       filepath: Absolute or relative path to .py file
+      detailed: Build the findings list; False returns counts only (default True)
 
     Returns:
       Same structure as scan_code()
@@ -106,16 +250,22 @@ def scan_file(filepath: str) -> dict:
     if "error" in result:
         return {"passed": True, "total_issues": 0, "high": 0, "medium": 0, "low": 0,
                 "findings": [], "error": result["error"]}
-    return _parse_results(result["data"])
+    return _parse_results(result["data"], full=detailed)
 
 
-def scan_directory(path: str, exclude_dirs: list[str] | None = None, recursive: bool = True) -> dict:
+def scan_directory(
+    path: str,
+    exclude_dirs: list[str] | None = None,
+    recursive: bool = True,
+    detailed: bool = True,
+) -> dict:
     """Scan a directory of Python files.
 
     Args:
       path:         Directory path to scan
       exclude_dirs: Directories to exclude (e.g. ["tests", ".venv"])
       recursive:    Scan recursively (default True)
+      detailed:     Build the findings list; False returns counts only (default True)
 
     Returns:
       {"passed": bool, "total_issues": int, "high": int, "medium": int, "low": int,
@@ -132,7 +282,78 @@ def scan_directory(path: str, exclude_dirs: list[str] | None = None, recursive:
         return {"passed": True, "total_issues": 0, "high": 0, "medium": 0, "low": 0,
                 "findings": [], "files_scanned": 0, "error": result["error"]}
 
-    parsed = _parse_results(result["data"])
+    parsed = _parse_results(result["data"], full=detailed)
     metrics = result["data"].get("metrics", {})
     files_scanned = len([k for k in metrics if k != "_totals"])
     return {**parsed, "files_scanned": files_scanned}
+
+
+# Directories bandit itself skips when recursing
+_DEFAULT_EXCLUDES = frozenset({".svn", "CVS", ".bzr", ".hg", ".git", "__pycache__", ".tox", ".eggs"})
+
+
+def _merge_reports(reports: list[dict]) -> dict:
+    """Combine per-shard bandit reports into one, summing the ``_totals`` metrics."""
+    results: list[dict] = []
+    metrics: dict[str, dict] = {}
+    totals: Counter[str] = Counter()
+    for data in reports:
+        results.extend(data.get("results", []))
+        for key, value in data.get("metrics", {}).items():
+            if key == "_totals":
+                totals.update(value)
+            else:
+                metrics[key] = value
+    results.sort(key=lambda r: (r.get("filename") or "", r.get("line_number") or 0))
+    metrics["_totals"] = dict(totals)
+    return {"results": results, "metrics": metrics}
+
+
+def scan_directory_parallel(
+    path: str,
+    exclude_dirs: list[str] | None = None,
+    recursive: bool = True,
+    workers: int | None = None,
+    detailed: bool = True,
+) -> dict:
+    """Scan a directory with one bandit process per CPU.
+
+    Bandit's own recursive scan is single-threaded; this collects the .py
+    files, deals them round-robin into ``workers`` shards and runs the shards
+    concurrently.  scan_directory() remains the single-process path.
+
+    Args:
+      path:         Directory path to scan
+      exclude_dirs: Directory names to exclude (e.g. ["tests", ".venv"])
+      recursive:    Scan recursively (default True)
+      workers:      Concurrent bandit processes (default: CPU count)
+      detailed:     Build the findings list; False returns counts only (default True)
+
+    Returns:
+      Same structure as scan_directory()
+    """
+    excluded = _DEFAULT_EXCLUDES | set(exclude_dirs or [])
+    root = Path(path)
+    candidates = root.rglob("*.py") if recursive else root.glob("*.py")
+    files = [
+        str(f) for f in candidates
+        if f.is_file() and not excluded.intersection(f.relative_to(root).parts[:-1])
+    ]
+    if not files:
+        return {"passed": True, "total_issues": 0, "high": 0, "medium": 0, "low": 0,
+                "findings": [], "files_scanned": 0}
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(files)))
+    shards = [files[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_run_bandit, shards))
+
+    errors = [r["error"] for r in results if "error" in r]
+    if errors:
+        return {"passed": True, "total_issues": 0, "high": 0, "medium": 0, "low": 0,
+                "findings": [], "files_scanned": 0, "error": errors[0]}
+
+    merged = _merge_reports([r["data"] for r in results])
+    parsed = _parse_results(merged, full=detailed)
+    files_scanned = len([k for k in merged["metrics"] if k != "_totals"])
+    return {**parsed, "files_scanned": files_scanned}
@@ -13,6 +13,11 @@ Env vars:
 
 import logging
 import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 log = logging.getLogger(__name__)
 
@@ -20,8 +25,21 @@ PROJECT = os.getenv("BIGQUERY_PROJECT") or os.getenv("GCP_PROJECT", "")
 LOCATION = os.getenv("BIGQUERY_LOCATION", "US")
 MAX_ROWS = int(os.getenv("BIGQUERY_MAX_ROWS", "1000"))
 
+# Dataset/table listings and schemas change rarely; successful lookups are
+# served from memory for this long.
+_META_TTL = 300.0
+_META_MAX = 1024
+_meta_cache: dict[tuple[str, ...], tuple[float, dict]] = {}
+_meta_lock = threading.Lock()
 
+# Above this many rows, results are streamed as Arrow batches over the
+# BigQuery Storage Read API (when installed) instead of paged REST JSON.
+_STORAGE_MIN_ROWS = 1000
+
+
+@lru_cache(maxsize=1)
 def _client():
+    """Process-wide client — one auth discovery and HTTP session for every call."""
     try:
         from google.cloud import bigquery
         return bigquery.Client(project=PROJECT or None)
@@ -29,37 +47,114 @@ def _client():
         raise RuntimeError("google-cloud-bigquery not installed — pip install google-cloud-bigquery")
 
 
-def run_query(sql: str, params: dict | None = None, max_rows: int = 0) -> dict:
+@lru_cache(maxsize=1)
+def _default_project() -> str:
+    """PROJECT, else the client's discovered project — resolved once per client."""
+    return PROJECT or _client().project
+
+
+@lru_cache(maxsize=1)
+def _storage_client():
+    """Process-wide Storage Read client, or None when the library isn't installed."""
+    try:
+        from google.cloud.bigquery_storage_v1 import BigQueryReadClient
+    except ImportError:
+        return None
+    return BigQueryReadClient()
+
+
+def reset_client() -> None:
+    """Drop the cached clients and metadata; the next call builds fresh clients."""
+    _client.cache_clear()
+    _default_project.cache_clear()
+    _storage_client.cache_clear()
+    with _meta_lock:
+        _meta_cache.clear()
+
+
+def _cached_meta(key: tuple[str, ...], fetch: Callable[[], dict]) -> dict:
+    """``fetch()``, reusing a successful result for up to ``_META_TTL`` seconds."""
+    now = time.monotonic()
+    with _meta_lock:
+        hit = _meta_cache.get(key)
+    if hit is not None and hit[0] > now:
+        return dict(hit[1])
+    result = fetch()
+    if result.get("success"):
+        with _meta_lock:
+            if len(_meta_cache) >= _META_MAX:
+                # Drop the oldest entry (dicts keep insertion order)
+                _meta_cache.pop(next(iter(_meta_cache)))
+            _meta_cache[key] = (now + _META_TTL, result)
+    return result
+
+
+def run_query(
+    sql: str,
+    params: dict | None = None,
+    max_rows: int = 0,
+    batch: bool = False,
+    max_bytes: int | None = None,
+    orient: str = "records",
+) -> dict:
     """Execute a BigQuery SQL query.
 
     Args:
-      sql:      Standard SQL query string
-      params:   Optional named query parameters {name: value}
-      max_rows: Override MAX_ROWS (0 = use default)
+      sql:       Standard SQL query string
+      params:    Optional named query parameters {name: value}
+      max_rows:  Override MAX_ROWS (0 = use default)
+      batch:     Run at BATCH priority — queued until slots are idle, so
+                 slower to start but not competing with interactive work
+      max_bytes: Fail the query instead of billing more than this many bytes
+                 (see dry_run_query for an estimate)
+      orient:    "records" — rows as a list of dicts (default);
+                 "columns" — rows as {column: list[value]}, one list per column
+                 instead of one dict per row
 
     Returns:
-      {"success": bool, "columns": list[str], "rows": list[dict], "row_count": int,
-       "bytes_processed": int, "error": str|None}
+      {"success": bool, "columns": list[str], "rows": list[dict] | dict[str, list],
+       "row_count": int, "bytes_processed": int, "error": str|None}
     """
+    if orient not in ("records", "columns"):
+        return {"success": False, "columns": [], "rows": [], "row_count": 0, "bytes_processed": 0,
+                "error": f"orient must be 'records' or 'columns', not {orient!r}"}
     from google.cloud import bigquery as bq
     limit = max_rows or MAX_ROWS
     try:
         client = _client()
-        job_config = bq.QueryJobConfig()
+        job_config = bq.QueryJobConfig(
+            priority=bq.QueryPriority.BATCH if batch else bq.QueryPriority.INTERACTIVE,
+        )
+        if max_bytes is not None:
+            job_config.maximum_bytes_billed = max_bytes
         if params:
             job_config.query_parameters = [
                 bq.ScalarQueryParameter(k, _bq_type(v), v)
                 for k, v in params.items()
             ]
         job = client.query(sql, job_config=job_config, location=LOCATION)
-        rows = list(job.result(max_results=limit))
-        columns = [f.name for f in job.result().schema]
-        data = [dict(zip(columns, row.values())) for row in rows]
+        storage = _storage_client() if limit > _STORAGE_MIN_ROWS else None
+        if storage is not None:
+            # max_results would force the REST path, so stop reading batches
+            # once the limit is reached instead
+            row_iter = job.result()
+            columns = [f.name for f in row_iter.schema]
+            data, row_count = _arrow_rows(row_iter, storage, limit, columns, orient)
+        else:
+            # The schema rides on the row iterator — no second result() call
+            row_iter = job.result(max_results=limit)
+            columns = [f.name for f in row_iter.schema]
+            rows = list(row_iter)
+            if orient == "columns":
+                data = {c: [row[i] for row in rows] for i, c in enumerate(columns)}
+            else:
+                data = [dict(zip(columns, row.values())) for row in rows]
+            row_count = len(rows)
         return {
             "success": True,
             "columns": columns,
             "rows": data,
-            "row_count": len(data),
+            "row_count": row_count,
             "bytes_processed": job.total_bytes_processed or 0,
             "error": None,
         }
@@ -69,25 +164,72 @@ def run_query(sql: str, params: dict | None = None, max_rows: int = 0) -> dict:
                 "bytes_processed": 0, "error": str(e)}
 
 
+def _arrow_rows(row_iter, storage, limit: int, columns: list[str], orient: str) -> tuple[list | dict, int]:
+    """Up to ``limit`` rows decoded from Storage Read API Arrow batches, and their count."""
+    if orient == "columns":
+        # Arrow is already columnar — extend one list per column
+        cols: dict[str, list] = {c: [] for c in columns}
+        count = 0
+        for batch in row_iter.to_arrow_iterable(bqstorage_client=storage):
+            for c, values in batch.to_pydict().items():
+                cols[c].extend(values)
+            count += batch.num_rows
+            if count >= limit:
+                break
+        return {c: v[:limit] for c, v in cols.items()}, min(count, limit)
+    records: list[dict] = []
+    for batch in row_iter.to_arrow_iterable(bqstorage_client=storage):
+        records.extend(batch.to_pylist())
+        if len(records) >= limit:
+            break
+    return records[:limit], min(len(records), limit)
+
+
+def run_queries_parallel(sqls: list[str], max_workers: int = 10, max_rows: int = 0) -> list[dict]:
+    """Execute independent queries concurrently on the shared client.
+
+    Each query is network-bound, so wall time tracks the slowest query
+    rather than the sum of all of them.
+
+    Args:
+      sqls:        Standard SQL query strings
+      max_workers: Queries in flight at once (default 10)
+      max_rows:    Override MAX_ROWS per query (0 = use default)
+
+    Returns:
+      One run_query() result per SQL string, in input order.
+    """
+    if not sqls:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sqls)))) as pool:
+        return list(pool.map(lambda sql: run_query(sql, max_rows=max_rows), sqls))
+
+
+# Exact-type lookup; bool is its own key, so it never falls through to INT64
+_TYPE_MAP = {bool: "BOOL", int: "INT64", float: "FLOAT64", str: "STRING"}
+
+
 def _bq_type(value) -> str:
-    if isinstance(value, bool):
-        return "BOOL"
-    if isinstance(value, int):
-        return "INT64"
-    if isinstance(value, float):
-        return "FLOAT64"
-    return "STRING"
+    bq_type = _TYPE_MAP.get(type(value))
+    if bq_type is None:
+        # Subclasses (IntEnum and the like) map like their base type
+        bq_type = next((_TYPE_MAP[t] for t in type(value).__mro__ if t in _TYPE_MAP), "STRING")
+    return bq_type
 
 
 def list_datasets(project: str = "") -> dict:
-    """List all datasets in a project.
+    """List all datasets in a project (cached for 5 minutes).
 
     Returns:
       {"success": bool, "datasets": list[str], "error": str|None}
     """
+    return _cached_meta(("datasets", project or PROJECT), lambda: _list_datasets(project))
+
+
+def _list_datasets(project: str) -> dict:
     try:
         client = _client()
-        p = project or PROJECT or client.project
+        p = project or _default_project()
         datasets = [d.dataset_id for d in client.list_datasets(project=p)]
         return {"success": True, "datasets": datasets, "error": None}
     except Exception as e:
@@ -95,14 +237,18 @@ def list_datasets(project: str = "") -> dict:
 
 
 def list_tables(dataset_id: str, project: str = "") -> dict:
-    """List tables in a BigQuery dataset.
+    """List tables in a BigQuery dataset (cached for 5 minutes).
 
     Returns:
       {"success": bool, "tables": list[str], "error": str|None}
     """
+    return _cached_meta(("tables", project or PROJECT, dataset_id), lambda: _list_tables(dataset_id, project))
+
+
+def _list_tables(dataset_id: str, project: str) -> dict:
     try:
         client = _client()
-        p = project or PROJECT or client.project
+        p = project or _default_project()
         tables = [t.table_id for t in client.list_tables(f"{p}.{dataset_id}")]
         return {"success": True, "tables": tables, "error": None}
     except Exception as e:
@@ -110,14 +256,21 @@ def list_tables(dataset_id: str, project: str = "") -> dict:
 
 
 def get_table_schema(dataset_id: str, table_id: str, project: str = "") -> dict:
-    """Get the schema of a BigQuery table.
+    """Get the schema of a BigQuery table (cached for 5 minutes).
 
     Returns:
       {"success": bool, "columns": list[{"name","type","mode","description"}], "error": str|None}
     """
+    return _cached_meta(
+        ("schema", project or PROJECT, dataset_id, table_id),
+        lambda: _get_table_schema(dataset_id, table_id, project),
+    )
+
+
+def _get_table_schema(dataset_id: str, table_id: str, project: str) -> dict:
     try:
         client = _client()
-        p = project or PROJECT or client.project
+        p = project or _default_project()
         table = client.get_table(f"{p}.{dataset_id}.{table_id}")
         columns = [
             {
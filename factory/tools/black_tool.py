@@ -9,11 +9,17 @@ Env vars:
   BLACK_LINE_LEN — max line length (default: 88)
 """
 
+import difflib
 import logging
 import os
 import subprocess
-import tempfile
-from pathlib import Path
+
+from factory.tools._binaries import resolve_binary
+
+try:
+    import black
+except ImportError:  # pragma: no cover — falls back to the black CLI
+    black = None  # type: ignore[assignment]
 
 log = logging.getLogger(__name__)
 
@@ -21,11 +27,13 @@ BLACK_BIN = os.getenv("BLACK_BIN", "black")
 TIMEOUT = int(os.getenv("BLACK_TIMEOUT", "30"))
 LINE_LEN = int(os.getenv("BLACK_LINE_LEN", "88"))
 
+_BLACK_PATH = resolve_binary(BLACK_BIN)
+
 
-def _run(args: list[str]) -> tuple[int, str, str]:
-    cmd = [BLACK_BIN, f"--line-length={LINE_LEN}"] + args
+def _run(args: list[str], stdin: str | None = None) -> tuple[int, str, str]:
+    cmd = [_BLACK_PATH, f"--line-length={LINE_LEN}"] + args
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=TIMEOUT)
+        result = subprocess.run(cmd, input=stdin, capture_output=True, text=True, timeout=TIMEOUT)
         return result.returncode, result.stdout, result.stderr
     except FileNotFoundError:
         return -1, "", "black not found — install with: pip install black"
@@ -33,6 +41,11 @@ def _run(args: list[str]) -> tuple[int, str, str]:
         return -1, "", "black timed out"
 
 
+def _format_str(code: str) -> str:
+    """Format in-process with the black API; raises black.InvalidInput on bad source."""
+    return black.format_str(code, mode=black.Mode(line_length=LINE_LEN))
+
+
 def format_code(code: str, filename: str = "code.py") -> dict:
     """Format a Python code string with black.
 
@@ -43,18 +56,21 @@ def format_code(code: str, filename: str = "code.py") -> dict:
     Returns:
       {"success": bool, "reformatted": bool, "formatted_code": str, "error": str|None}
     """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(code)
-        tmp = f.name
-    try:
-        rc, stdout, stderr = _run([tmp])
-        if rc == -1:
-            return {"success": False, "reformatted": False, "formatted_code": code, "error": stderr}
-        formatted = Path(tmp).read_text()
-        reformatted = formatted != code
-        return {"success": True, "reformatted": reformatted, "formatted_code": formatted, "error": None}
-    finally:
-        Path(tmp).unlink(missing_ok=True)
+    if black is not None:
+        try:
+            formatted = _format_str(code)
+        except black.InvalidInput as e:
+            # Same outcome as the CLI on unparsable source: left as-is
+            return {"success": True, "reformatted": False, "formatted_code": code, "error": str(e)}
+        return {"success": True, "reformatted": formatted != code, "formatted_code": formatted, "error": None}
+    # "-" pipes the source through black's stdin/stdout — no temp file
+    rc, stdout, stderr = _run(["--stdin-filename", filename, "-"], stdin=code)
+    if rc == -1:
+        return {"success": False, "reformatted": False, "formatted_code": code, "error": stderr}
+    if rc != 0:
+        # Unparsable source is left as-is
+        return {"success": True, "reformatted": False, "formatted_code": code, "error": stderr[:1000]}
+    return {"success": True, "reformatted": stdout != code, "formatted_code": stdout, "error": None}
 
 
 def check_formatting(code: str, filename: str = "code.py") -> dict:
@@ -67,22 +83,31 @@ def check_formatting(code: str, filename: str = "code.py") -> dict:
     Returns:
       {"passed": bool, "reformatted_needed": bool, "diff": str, "error": str|None}
     """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(code)
-        tmp = f.name
-    try:
-        rc, stdout, stderr = _run(["--check", "--diff", tmp])
-        if rc == -1:
-            return {"passed": True, "reformatted_needed": False, "diff": "", "error": stderr}
-        # black exits 1 if reformatting needed, 0 if already formatted
+    if black is not None:
+        try:
+            formatted = _format_str(code)
+        except black.InvalidInput as e:
+            return {"passed": False, "reformatted_needed": False, "diff": "", "error": str(e)}
+        diff = "".join(difflib.unified_diff(
+            code.splitlines(keepends=True), formatted.splitlines(keepends=True),
+            fromfile=filename, tofile=filename,
+        ))
         return {
-            "passed": rc == 0,
-            "reformatted_needed": rc == 1,
-            "diff": stderr[:3000],  # black prints diff to stderr
+            "passed": formatted == code,
+            "reformatted_needed": formatted != code,
+            "diff": diff[:3000],
             "error": None,
         }
-    finally:
-        Path(tmp).unlink(missing_ok=True)
+    rc, stdout, stderr = _run(["--check", "--diff", "--stdin-filename", filename, "-"], stdin=code)
+    if rc == -1:
+        return {"passed": True, "reformatted_needed": False, "diff": "", "error": stderr}
+    # black exits 1 if reformatting needed, 0 if already formatted
+    return {
+        "passed": rc == 0,
+        "reformatted_needed": rc == 1,
+        "diff": stdout[:3000],  # the diff goes to stdout, status lines to stderr
+        "error": None,
+    }
 
 
 def format_file(filepath: str) -> dict:
@@ -98,6 +123,33 @@ def format_file(filepath: str) -> dict:
     return {"success": True, "reformatted": reformatted, "error": None}
 
 
+def format_files(paths: list[str]) -> dict:
+    """Format many Python files in-place with a single black run.
+
+    One process (black parallelizes internally) instead of one per file, so
+    startup is paid once.
+
+    Returns:
+      {"success": bool, "files_reformatted": int, "reformatted": list[str], "error": str|None}
+    """
+    if not paths:
+        return {"success": True, "files_reformatted": 0, "reformatted": [], "error": None}
+    rc, stdout, stderr = _run(list(paths))
+    if rc == -1:
+        return {"success": False, "files_reformatted": 0, "reformatted": [], "error": stderr}
+    reformatted = [
+        line.removeprefix("reformatted ").strip()
+        for line in stderr.splitlines()
+        if line.startswith("reformatted ")
+    ]
+    return {
+        "success": rc == 0,
+        "files_reformatted": len(reformatted),
+        "reformatted": reformatted,
+        "error": None if rc == 0 else stderr[:1000],
+    }
+
+
 def format_directory(path: str, check_only: bool = False) -> dict:
     """Format or check all Python files in a directory.
 
@@ -11,18 +11,29 @@ Env vars:
   CHECKOV_TIMEOUT — subprocess timeout seconds (default: 120)
 """
 
+import itertools
 import json
 import logging
 import os
 import subprocess
 import tempfile
+from collections import Counter
 from pathlib import Path
 
+import orjson
+
+from factory.tools._binaries import resolve_binary
+
 log = logging.getLogger(__name__)
 
 CHECKOV_BIN = os.getenv("CHECKOV_BIN", "checkov")
 TIMEOUT = int(os.getenv("CHECKOV_TIMEOUT", "120"))
 
+_CHECKOV_PATH = resolve_binary(CHECKOV_BIN)
+
+# Failed checks returned per scan; failed_count still covers every failure
+_MAX_FAILED = 50
+
 # Supported frameworks
 FRAMEWORKS = [
     "terraform", "cloudformation", "kubernetes", "dockerfile",
@@ -30,24 +41,53 @@ FRAMEWORKS = [
 ]
 
 
+_DECODER = json.JSONDecoder()
+
+
+def _decode(output: bytes) -> dict | list:
+    """First complete JSON value in checkov's output, or {}."""
+    try:
+        return orjson.loads(output)
+    except ValueError:
+        pass
+    # Banner text before the report, or several reports back to back: decode
+    # in place from the first bracket and ignore whatever follows
+    text = output.decode(errors="replace")
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if not starts:
+        return {}
+    try:
+        data, _ = _DECODER.raw_decode(text, min(starts))
+        return data
+    except json.JSONDecodeError:
+        return {}
+
+
+def _merge_reports(reports: list) -> dict:
+    """Fold checkov's per-framework report list into one report."""
+    passed: list = []
+    failed: list = []
+    summary: Counter = Counter()
+    for report in reports:
+        if not isinstance(report, dict):
+            continue
+        results = report.get("results", {})
+        passed.extend(results.get("passed_checks", []))
+        failed.extend(results.get("failed_checks", []))
+        summary.update({k: v for k, v in report.get("summary", {}).items() if isinstance(v, int)})
+    return {"results": {"passed_checks": passed, "failed_checks": failed}, "summary": dict(summary)}
+
+
 def _run(args: list[str]) -> dict:
-    cmd = [CHECKOV_BIN, "-o", "json", "--compact"] + args
+    cmd = [_CHECKOV_PATH, "-o", "json", "--compact"] + args
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=TIMEOUT)
-        output = result.stdout or result.stderr
-        # checkov may produce multiple JSON objects; take the first complete one
-        try:
-            data = json.loads(output)
-        except json.JSONDecodeError:
-            # Try to find JSON in output
-            start = output.find("{")
-            if start >= 0:
-                try:
-                    data = json.loads(output[start:])
-                except json.JSONDecodeError:
-                    data = {}
-            else:
-                data = {}
+        # Bytes in, parsed straight from the buffer — no text decode or
+        # substring copy unless the output needs salvaging
+        result = subprocess.run(cmd, capture_output=True, timeout=TIMEOUT)
+        data = _decode(result.stdout or result.stderr)
+        if isinstance(data, list):
+            # One report per framework when several were detected
+            data = _merge_reports(data)
         return {"ok": True, "data": data, "returncode": result.returncode}
     except FileNotFoundError:
         return {"ok": False, "data": {}, "returncode": -1,
@@ -63,22 +103,24 @@ def _parse(raw: dict) -> dict:
     passed_checks_list = results.get("passed_checks", [])
     failed_checks_list = results.get("failed_checks", [])
 
-    failed = []
-    for check in failed_checks_list:
-        failed.append({
+    # Only the returned checks are normalised; the count covers all of them
+    failed = [
+        {
             "check_id": check.get("check_id"),
             "check_type": check.get("check_type", ""),
             "resource": check.get("resource", ""),
             "file": check.get("file_path", ""),
             "guideline": check.get("guideline", ""),
             "severity": check.get("severity", ""),
-        })
+        }
+        for check in itertools.islice(failed_checks_list, _MAX_FAILED)
+    ]
 
     return {
-        "passed": len(failed) == 0,
+        "passed": not failed_checks_list,
         "passed_count": len(passed_checks_list),
-        "failed_count": len(failed),
-        "failed_checks": failed[:50],
+        "failed_count": len(failed_checks_list),
+        "failed_checks": failed,
         "summary": raw.get("summary", {}),
     }
 
@@ -162,7 +204,7 @@ def list_checks(framework: str = "terraform") -> dict:
     Returns:
       {"success": bool, "checks": list[{"id","name","guideline"}]}
     """
-    cmd = [CHECKOV_BIN, "--list", "--framework", framework, "-o", "json"]
+    cmd = [_CHECKOV_PATH, "--list", "--framework", framework, "-o", "json"]
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
         try:
@@ -3,6 +3,10 @@
 Used by devops and sre_ops teams to deploy microservices,
 check service health, manage revisions, and set traffic splits.
 
+Reads (describe/list) go through the google-cloud-run client when it is
+installed, sharing one gRPC channel across calls; deploys, traffic changes
+and log reads — and every call without the library — use the gcloud CLI.
+
 Env vars:
   GCP_PROJECT   — GCP project ID (default: unicon-494419)
   GCP_REGION    — default Cloud Run region (default: us-central1)
@@ -14,6 +18,17 @@ import json
 import logging
 import os
 import subprocess
+import threading
+import time
+from collections.abc import Callable
+from functools import lru_cache
+
+from factory.tools._binaries import resolve_binary
+
+try:
+    from google.cloud import run_v2
+except ImportError:  # pragma: no cover — optional accelerator
+    run_v2 = None
 
 log = logging.getLogger(__name__)
 
@@ -22,9 +37,63 @@ REGION = os.getenv("GCP_REGION", "us-central1")
 GCLOUD = os.getenv("GCLOUD_BIN", "gcloud")
 TIMEOUT = int(os.getenv("CLOUDRUN_TIMEOUT", "300"))
 
+_GCLOUD_PATH = resolve_binary(GCLOUD)
+
+# describe/list results are reused this long; deploys and traffic changes
+# made through this module invalidate them immediately.
+_CACHE_TTL = 30.0
+_CACHE_MAX = 256
+_cache: dict[tuple[str, ...], tuple[float, dict]] = {}
+_cache_lock = threading.Lock()
+
+
+def _cached(key: tuple[str, ...], fetch: Callable[[], dict]) -> dict:
+    """``fetch()``, reusing a successful result for up to ``_CACHE_TTL`` seconds."""
+    now = time.monotonic()
+    with _cache_lock:
+        hit = _cache.get(key)
+    if hit is not None and hit[0] > now:
+        return dict(hit[1])
+    result = fetch()
+    if result.get("success"):
+        with _cache_lock:
+            if len(_cache) >= _CACHE_MAX:
+                # Drop the oldest entry (dicts keep insertion order)
+                _cache.pop(next(iter(_cache)))
+            _cache[key] = (now + _CACHE_TTL, result)
+    return result
+
+
+def invalidate_service(service: str, region: str = "") -> None:
+    """Forget cached describe/list results that include ``service``."""
+    region = region or REGION
+    with _cache_lock:
+        _cache.pop(("describe", service, region), None)
+        _cache.pop(("list", region), None)
+
+
+@lru_cache(maxsize=1)
+def _services_client():
+    """Process-wide Cloud Run ServicesClient, or None when the library isn't installed."""
+    if run_v2 is None:
+        return None
+    return run_v2.ServicesClient()
 
-def _run(args: list[str], json_output: bool = True) -> dict:
-    cmd = [GCLOUD] + args + ["--project", PROJECT]
+
+def _traffic_entry(target) -> dict:
+    """A run_v2 TrafficTarget in the shape ``gcloud --format json`` reports."""
+    entry: dict = {"percent": target.percent}
+    if target.type_ == run_v2.TrafficTargetAllocationType.TRAFFIC_TARGET_ALLOCATION_TYPE_LATEST:
+        entry["latestRevision"] = True
+    if target.revision:
+        entry["revisionName"] = target.revision
+    if target.tag:
+        entry["tag"] = target.tag
+    return entry
+
+
+def _run(args: list[str], json_output: bool = True, max_text: int | None = 2000) -> dict:
+    cmd = [_GCLOUD_PATH] + args + ["--project", PROJECT]
     if json_output:
         cmd += ["--format", "json"]
     try:
@@ -35,7 +104,7 @@ def _run(args: list[str], json_output: bool = True) -> dict:
                         "stderr": result.stderr[:500]}
             except json.JSONDecodeError:
                 pass
-        return {"ok": result.returncode == 0, "data": result.stdout[:2000],
+        return {"ok": result.returncode == 0, "data": result.stdout[:max_text],
                 "stderr": result.stderr[:500]}
     except FileNotFoundError:
         return {"ok": False, "data": None, "stderr": "gcloud not found — install Google Cloud SDK"}
@@ -87,6 +156,7 @@ def deploy_service(
 
     log.info("Deploying Cloud Run service: %s from %s", service, image)
     result = _run(args)
+    invalidate_service(service, region)
     if result["ok"]:
         data = result["data"]
         if isinstance(data, dict):
@@ -101,12 +171,32 @@ def deploy_service(
 
 
 def describe_service(service: str, region: str = "") -> dict:
-    """Get details of a Cloud Run service.
+    """Get details of a Cloud Run service (cached for 30 seconds).
 
     Returns:
       {"success": bool, "url": str, "image": str, "traffic": list,
        "last_modified": str, "error": str|None}
     """
+    return _cached(("describe", service, region or REGION), lambda: _describe_service(service, region))
+
+
+def _describe_service(service: str, region: str) -> dict:
+    client = _services_client()
+    if client is not None:
+        name = f"projects/{PROJECT}/locations/{region or REGION}/services/{service}"
+        try:
+            svc = client.get_service(name=name, timeout=TIMEOUT)
+        except Exception as e:
+            return {"success": False, "url": "", "image": "", "traffic": [], "error": str(e)}
+        containers = svc.template.containers
+        return {
+            "success": True,
+            "url": svc.uri,
+            "image": containers[0].image if containers else "",
+            "traffic": [_traffic_entry(t) for t in svc.traffic],
+            "last_modified": svc.last_modifier,
+            "error": None,
+        }
     result = _run(["run", "services", "describe", service, "--region", region or REGION])
     if not result["ok"]:
         return {"success": False, "url": "", "image": "", "traffic": [], "error": result["stderr"]}
@@ -127,11 +217,27 @@ def describe_service(service: str, region: str = "") -> dict:
 
 
 def list_services(region: str = "") -> dict:
-    """List all Cloud Run services in a region.
+    """List all Cloud Run services in a region (cached for 30 seconds).
 
     Returns:
       {"success": bool, "services": list[{"name": str, "url": str, "region": str}]}
     """
+    return _cached(("list", region or REGION), lambda: _list_services(region))
+
+
+def _list_services(region: str) -> dict:
+    client = _services_client()
+    if client is not None:
+        try:
+            services = [
+                {"name": svc.name.rsplit("/", 1)[-1], "url": svc.uri, "region": region or REGION}
+                for svc in client.list_services(
+                    parent=f"projects/{PROJECT}/locations/{region or REGION}", timeout=TIMEOUT
+                )
+            ]
+        except Exception as e:
+            return {"success": False, "services": [], "error": str(e)}
+        return {"success": True, "services": services, "error": None}
     result = _run(["run", "services", "list", "--region", region or REGION])
     if not result["ok"]:
         return {"success": False, "services": [], "error": result["stderr"]}
@@ -158,14 +264,22 @@ def get_service_logs(service: str, region: str = "", limit: int = 50) -> dict:
         f'resource.labels.service_name="{service}" '
         f'resource.labels.location="{region or REGION}"'
     )
-    result = _run([
-        "logging", "read", filter_str,
-        "--limit", str(limit),
-        "--order", "desc",
-    ])
+    # Project only the payloads: entries stay one JSON object each (multi-line
+    # payloads intact) without shipping and decoding the rest of every entry
+    result = _run(
+        ["logging", "read", filter_str, "--limit", str(limit), "--order", "desc",
+         "--format", "json(textPayload,jsonPayload)"],
+        json_output=False,
+        max_text=None,
+    )
     if not result["ok"]:
         return {"success": False, "logs": [], "error": result["stderr"]}
-    entries = result["data"] if isinstance(result["data"], list) else []
+    try:
+        entries = json.loads((result["data"] or "").strip() or "[]")
+    except json.JSONDecodeError as e:
+        return {"success": False, "logs": [], "error": f"unreadable gcloud output: {e}"}
+    if not isinstance(entries, list):
+        entries = []
     logs = [e.get("textPayload") or str(e.get("jsonPayload", "")) for e in entries]
     return {"success": True, "logs": logs, "error": None}
 
@@ -186,4 +300,5 @@ def set_traffic(service: str, revision_tags: dict, region: str = "") -> dict:
     result = _run(["run", "services", "update-traffic", service,
                    "--to-revisions", traffic_args,
                    "--region", region or REGION])
+    invalidate_service(service, region)
     return {"success": result["ok"], "error": None if result["ok"] else result["stderr"]}
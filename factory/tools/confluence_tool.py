@@ -10,8 +10,13 @@ Env vars:
   CONFLUENCE_SPACE_KEY — default space key (default: AIF)
 """
 
+import atexit
+import base64
 import logging
 import os
+import re
+import threading
+from functools import lru_cache
 
 import httpx
 
@@ -23,15 +28,25 @@ USER = os.getenv("CONFLUENCE_USER", "")
 SPACE_KEY = os.getenv("CONFLUENCE_SPACE_KEY", "AIF")
 API_V2 = f"{BASE_URL}/rest/api"
 
-
-def _headers() -> dict:
-    import base64
-    creds = base64.b64encode(f"{USER}:{TOKEN}".encode()).decode()
-    return {
-        "Authorization": f"Basic {creds}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
+# Built once — the credentials are fixed for the life of the process
+_HEADERS = {
+    "Authorization": f"Basic {base64.b64encode(f'{USER}:{TOKEN}'.encode()).decode()}",
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
+
+
+@lru_cache(maxsize=1)
+def _http() -> httpx.Client:
+    """Process-wide client — keeps the Atlassian TLS connection alive between calls."""
+    client = httpx.Client(
+        base_url=API_V2,
+        headers=_HEADERS,
+        timeout=20,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+    )
+    atexit.register(client.close)
+    return client
 
 
 def _available() -> bool:
@@ -67,7 +82,7 @@ def create_page(
     if parent_id:
         payload["ancestors"] = [{"id": parent_id}]
     try:
-        resp = httpx.post(f"{API_V2}/content", headers=_headers(), json=payload, timeout=20)
+        resp = _http().post("/content", json=payload)
         if resp.status_code in (200, 201):
             data = resp.json()
             page_id = data.get("id", "")
@@ -96,7 +111,7 @@ def update_page(page_id: str, title: str, body_html: str, version_number: int =
         "body": {"storage": {"value": body_html, "representation": "storage"}},
     }
     try:
-        resp = httpx.put(f"{API_V2}/content/{page_id}", headers=_headers(), json=payload, timeout=20)
+        resp = _http().put(f"/content/{page_id}", json=payload)
         if resp.status_code == 200:
             data = resp.json()
             url = f"{BASE_URL}{data.get('_links', {}).get('webui', '')}"
@@ -116,7 +131,7 @@ def get_page_by_title(title: str, space_key: str = "") -> dict:
         return {"found": False, "page_id": "", "page_url": "", "version": 0}
     params = {"title": title, "spaceKey": space_key or SPACE_KEY, "expand": "version"}
     try:
-        resp = httpx.get(f"{API_V2}/content", headers=_headers(), params=params, timeout=10)
+        resp = _http().get("/content", params=params, timeout=10)
         if resp.status_code == 200:
             results = resp.json().get("results", [])
             if results:
@@ -133,43 +148,104 @@ def get_page_by_title(title: str, space_key: str = "") -> dict:
         return {"found": False, "page_id": "", "page_url": "", "version": 0, "error": str(e)}
 
 
+# (space, title) → (page_id, version) of pages this process last wrote, so a
+# repeat upsert is a single PUT instead of lookup + PUT.
+_KNOWN_PAGES_MAX = 1024
+_known_pages: dict[tuple[str, str], tuple[str, int]] = {}
+_known_pages_lock = threading.Lock()
+
+
+def _remember_page(space: str, title: str, page_id: str, version: int) -> None:
+    with _known_pages_lock:
+        if (space, title) not in _known_pages and len(_known_pages) >= _KNOWN_PAGES_MAX:
+            # Drop the oldest entry (dicts keep insertion order)
+            _known_pages.pop(next(iter(_known_pages)), None)
+        _known_pages[(space, title)] = (page_id, version)
+
+
 def upsert_page(title: str, body_html: str, space_key: str = "", parent_id: str = "") -> dict:
     """Create a page if it doesn't exist, update it if it does.
 
+    Pages already written by this process are updated directly from the
+    remembered id/version; if that PUT fails (edited or deleted elsewhere)
+    the title is looked up as usual.
+
     Returns:
       {"success": bool, "page_id": str, "page_url": str, "action": "created"|"updated"}
     """
-    existing = get_page_by_title(title, space_key)
+    space = space_key or SPACE_KEY
+    with _known_pages_lock:
+        known = _known_pages.get((space, title))
+    if known is not None:
+        page_id, version = known
+        result = update_page(page_id, title, body_html, version_number=version + 1)
+        if result["success"]:
+            _remember_page(space, title, page_id, version + 1)
+            return {**result, "page_id": page_id, "action": "updated"}
+        with _known_pages_lock:
+            _known_pages.pop((space, title), None)
+
+    existing = get_page_by_title(title, space)
     if existing["found"]:
-        result = update_page(
-            existing["page_id"], title, body_html,
-            version_number=existing["version"] + 1,
-        )
+        version = existing["version"] + 1
+        result = update_page(existing["page_id"], title, body_html, version_number=version)
+        if result["success"]:
+            _remember_page(space, title, existing["page_id"], version)
         return {**result, "page_id": existing["page_id"], "action": "updated"}
-    result = create_page(title, body_html, space_key, parent_id)
+    result = create_page(title, body_html, space, parent_id)
+    if result["success"]:
+        _remember_page(space, title, result["page_id"], 1)
     return {**result, "action": "created"}
 
 
+# markdown_to_storage: one alternation, scanned once.  Code blocks come first
+# so their contents are never rewritten; headings, list runs and inline
+# markup are converted in the same pass.
+_MD_TOKEN = re.compile(
+    r"```(?:\w+)?\n(?P<codeblock>[\s\S]+?)```"
+    r"|^(?P<hashes>#{1,3}) (?P<heading>.+)$"
+    r"|(?P<items>^- .+(?:\n- .+)*)"
+    r"|\*\*(?P<bold>.+?)\*\*"
+    r"|\*(?!\*)(?P<em>(?:\*\*.+?\*\*|[^*\n])+?)\*(?!\*)"
+    r"|`(?P<code>.+?)`"
+    r"|(?P<para>\n\n)",
+    re.MULTILINE,
+)
+# Markup allowed inside headings, list items and bold/italic text.  Italic
+# text may contain bold but never starts or ends on its ``**``, so
+# "*a **b** c*" stays one <em> instead of splitting at the inner stars.
+_MD_INLINE = re.compile(
+    r"\*\*(?P<bold>.+?)\*\*|\*(?!\*)(?P<em>(?:\*\*.+?\*\*|[^*\n])+?)\*(?!\*)|`(?P<code>.+?)`"
+)
+
+
+def _md_inline(m: re.Match) -> str:
+    if m["bold"] is not None:
+        return f"<strong>{_MD_INLINE.sub(_md_inline, m['bold'])}</strong>"
+    if m["em"] is not None:
+        return f"<em>{_MD_INLINE.sub(_md_inline, m['em'])}</em>"
+    return f"<code>{m['code']}</code>"
+
+
+def _md_token(m: re.Match) -> str:
+    if m["codeblock"] is not None:
+        return f'<ac:structured-macro ac:name="code"><ac:plain-text-body><![CDATA[{m["codeblock"]}]]></ac:plain-text-body></ac:structured-macro>'
+    if m["heading"] is not None:
+        level = len(m["hashes"])
+        return f"<h{level}>{_MD_INLINE.sub(_md_inline, m['heading'])}</h{level}>"
+    if m["items"] is not None:
+        items = "\n".join(
+            f"<li>{_MD_INLINE.sub(_md_inline, line[2:])}</li>" for line in m["items"].split("\n")
+        )
+        return f"<ul>{items}</ul>"
+    if m["para"] is not None:
+        return "<br/>"
+    return _md_inline(m)
+
+
 def markdown_to_storage(markdown: str) -> str:
     """Very basic Markdown → Confluence Storage Format conversion.
 
     For full fidelity, integrate the Confluence markdown macro or use pypandoc.
     """
-    import re
-    html = markdown
-    html = re.sub(r"^# (.+)$", r"<h1>\1</h1>", html, flags=re.MULTILINE)
-    html = re.sub(r"^## (.+)$", r"<h2>\1</h2>", html, flags=re.MULTILINE)
-    html = re.sub(r"^### (.+)$", r"<h3>\1</h3>", html, flags=re.MULTILINE)
-    html = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html)
-    html = re.sub(r"\*(.+?)\*", r"<em>\1</em>", html)
-    html = re.sub(r"`(.+?)`", r"<code>\1</code>", html)
-    # Code blocks
-    html = re.sub(
-        r"```(\w+)?\n([\s\S]+?)```",
-        lambda m: f'<ac:structured-macro ac:name="code"><ac:plain-text-body><![CDATA[{m.group(2)}]]></ac:plain-text-body></ac:structured-macro>',
-        html,
-    )
-    html = re.sub(r"^- (.+)$", r"<li>\1</li>", html, flags=re.MULTILINE)
-    html = re.sub(r"(<li>.*</li>)", r"<ul>\1</ul>", html, flags=re.DOTALL)
-    html = re.sub(r"\n\n", "<br/>", html)
-    return html
+    return _MD_TOKEN.sub(_md_token, markdown)
@@ -4,17 +4,165 @@ Used by data_eng, qa_eng, and biz_analysis teams for
 data quality checks, schema validation, and lightweight ETL.
 """
 
+import contextlib
 import csv
+import hashlib
 import io
+import itertools
 import json
 import logging
+import mmap
 import os
+import threading
+from collections import Counter
+from collections.abc import Iterable
 from typing import Any
 
+import orjson
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover — optional accelerator
+    pa = None  # type: ignore[assignment]
+
 log = logging.getLogger(__name__)
 
 MAX_ROWS = int(os.getenv("CSV_MAX_ROWS", "5000"))
 
+# Recent parses by content digest — validate/describe/transform chained over
+# the same payload parse it once.  Bounded LRU.
+_PARSE_CACHE_MAX = 32
+_parse_cache: dict[tuple, Any] = {}
+_parse_lock = threading.Lock()
+
+# Exactly the characters str.strip() removes, pinned here rather than
+# trusting Arrow's whitespace table to track Python's across releases.
+_PY_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004"
+    "\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+
+def _arrow_header(content: str, delimiter: str) -> list[str] | None:
+    """Header names for the Arrow path, or None when it can't be used.
+
+    None when pyarrow isn't installed or the header is missing or has
+    duplicate names — cases only the csv module handles.
+    """
+    if pa is None:
+        return None
+    header = next(csv.reader(io.StringIO(content), delimiter=delimiter), None)
+    if not header or len(set(header)) != len(header):
+        return None
+    return header
+
+
+def _arrow_batches(content: "str | pa.Buffer", delimiter: str, header: list[str], include: list[str] | None = None):
+    """Record batches of string columns covering the first MAX_ROWS data rows.
+
+    Every column is read as text, matching what csv.DictReader yields;
+    ``include`` limits which columns are converted at all.  Raises
+    pa.ArrowInvalid on input only the csv module tolerates (ragged rows).
+    """
+    reader = pacsv.open_csv(
+        pa.BufferReader(content.encode() if isinstance(content, str) else content),
+        read_options=pacsv.ReadOptions(column_names=header, skip_rows=1),
+        parse_options=pacsv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            column_types={c: pa.string() for c in header},
+            include_columns=include or [],
+        ),
+    )
+    remaining = MAX_ROWS
+    for batch in reader:
+        if remaining <= 0:
+            break
+        yield batch.slice(0, remaining)
+        remaining -= batch.num_rows
+
+
+def _cache_key(kind: str, content: str, delimiter: str, has_header: bool = True) -> tuple:
+    # Keyed on a digest, not the string — a tool chain passes the same
+    # payload as separate (possibly copied) strings
+    return (kind, hashlib.blake2b(content.encode(), digest_size=16).digest(), delimiter, has_header)
+
+
+def _cache_get(key: tuple) -> Any:
+    with _parse_lock:
+        hit = _parse_cache.pop(key, None)
+        if hit is not None:
+            _parse_cache[key] = hit  # re-insert as most recent
+        return hit
+
+
+def _cache_put(key: tuple, value: Any) -> None:
+    with _parse_lock:
+        if len(_parse_cache) >= _PARSE_CACHE_MAX:
+            # Drop the least recently used entry (dicts keep insertion order)
+            _parse_cache.pop(next(iter(_parse_cache)))
+        _parse_cache[key] = value
+
+
+def _parse_arrow(content: str, delimiter: str = ",") -> "pa.Table | None":
+    """The first MAX_ROWS data rows as an Arrow table of string columns.
+
+    Returns None when the Arrow path can't be used — callers then take
+    the pure-Python path.  Tables are immutable, so cached ones are
+    shared as-is.
+    """
+    header = _arrow_header(content, delimiter)
+    if header is None:
+        return None
+    key = _cache_key("arrow", content, delimiter)
+    table = _cache_get(key)
+    if table is not None:
+        return table
+    table = _arrow_table(content, delimiter, header)
+    if table is not None:
+        _cache_put(key, table)
+    return table
+
+
+def _arrow_table(content: "str | pa.Buffer", delimiter: str, header: list[str]) -> "pa.Table | None":
+    try:
+        return pa.Table.from_batches(
+            list(_arrow_batches(content, delimiter, header)),
+            schema=pa.schema([(c, pa.string()) for c in header]),
+        )
+    except pa.ArrowInvalid:
+        return None
+
+
+@contextlib.contextmanager
+def _mapped(path: str):
+    """The file at ``path`` as a read-only memory map (b"" when empty)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # zero-length files can't be mapped
+            return
+        # Not closed explicitly: Arrow buffers may still reference the
+        # mapping, which is released once the last of them is freed
+        yield mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _load_path(path: str, delimiter: str, arrow: bool = True) -> "pa.Table | str":
+    """The file's rows as an Arrow table parsed straight from the mapped
+    pages, or — when the Arrow path can't be used — its decoded text.
+    """
+    with _mapped(path) as mm:
+        if arrow and pa is not None:
+            end = mm.find(b"\n")
+            first = mm[:end] if end >= 0 else mm[:]
+            # An odd quote count means a quoted newline inside the header
+            header = None if first.count(b'"') % 2 else _arrow_header(first.decode(), delimiter)
+            if header is not None:
+                table = _arrow_table(pa.py_buffer(mm), delimiter, header)
+                if table is not None:
+                    return table
+        return mm[:].decode()
+
 
 def parse_csv(content: str, delimiter: str = ",", has_header: bool = True) -> dict:
     """Parse CSV content into a list of dicts (or lists if no header).
@@ -26,21 +174,84 @@ def parse_csv(content: str, delimiter: str = ",", has_header: bool = True) -> di
 
     Returns:
       {"success": bool, "columns": list[str], "rows": list[dict], "row_count": int}
+
+    Successful parses are cached by content digest; rows are shared
+    between callers and should be treated as read-only.
+    """
+    key = _cache_key("rows", content, delimiter, has_header)
+    hit = _cache_get(key)
+    if hit is not None:
+        return {**hit, "rows": list(hit["rows"])}
+    result = _parse_rows(content, delimiter, has_header)
+    if result["success"]:
+        _cache_put(key, result)
+        return {**result, "rows": list(result["rows"])}
+    return result
+
+
+def parse_csv_path(path: str, delimiter: str = ",", has_header: bool = True) -> dict:
+    """parse_csv for a file on disk.
+
+    The file is memory-mapped and, with pyarrow installed, parsed straight
+    from the mapped pages instead of first being read into a str.  Results
+    are not cached — the file may change between calls.
     """
     try:
-        reader = csv.DictReader(io.StringIO(content), delimiter=delimiter) if has_header \
-            else csv.reader(io.StringIO(content), delimiter=delimiter)
-        rows = []
-        for i, row in enumerate(reader):
-            if i >= MAX_ROWS:
-                break
-            rows.append(dict(row) if has_header else list(row))
-        columns = list(rows[0].keys()) if (has_header and rows) else []
+        loaded = _load_path(path, delimiter, arrow=has_header)
+        if not isinstance(loaded, str):
+            return _table_rows(loaded)
+    except Exception as e:
+        return {"success": False, "columns": [], "rows": [], "row_count": 0, "error": str(e)}
+    return parse_csv(loaded, delimiter, has_header)
+
+
+def _table_rows(table: "pa.Table") -> dict:
+    # Dicts are only built here, at the boundary
+    rows = table.to_pylist()
+    return {"success": True, "columns": list(rows[0]) if rows else [], "rows": rows,
+            "row_count": len(rows)}
+
+
+def _parse_rows(content: str, delimiter: str, has_header: bool) -> dict:
+    try:
+        table = _parse_arrow(content, delimiter) if has_header else None
+        if table is not None:
+            return _table_rows(table)
+        header, raw = _parse_fast(content, delimiter, has_header)
+        if not has_header:
+            return {"success": True, "columns": [], "rows": raw, "row_count": len(raw)}
+        n = len(header)
+        rows = [dict(zip(header, r)) if len(r) == n else _row_dict(header, r) for r in raw]
+        columns = list(rows[0].keys()) if rows else []
         return {"success": True, "columns": columns, "rows": rows, "row_count": len(rows)}
     except Exception as e:
         return {"success": False, "columns": [], "rows": [], "row_count": 0, "error": str(e)}
 
 
+def _parse_fast(content: str, delimiter: str, has_header: bool = True) -> tuple[list[str], list[list[str]]]:
+    """(header, first MAX_ROWS rows as lists) straight from the C csv.reader.
+
+    With a header, blank lines are skipped as csv.DictReader skips them;
+    rows may be ragged.
+    """
+    reader = csv.reader(io.StringIO(content), delimiter=delimiter)
+    if not has_header:
+        return [], list(itertools.islice(reader, MAX_ROWS))
+    header = next(reader, [])
+    return header, list(itertools.islice(filter(None, reader), MAX_ROWS))
+
+
+def _row_dict(header: list[str], row: list[str]) -> dict:
+    """A ragged row as csv.DictReader builds it: missing fields None, extras under None."""
+    d: dict = dict(zip(header, row))
+    if len(row) > len(header):
+        d[None] = row[len(header):]
+    else:
+        for key in header[len(row):]:
+            d[key] = None
+    return d
+
+
 def validate_csv(content: str, expected_columns: list[str],
                  required_columns: list[str] | None = None,
                  delimiter: str = ",") -> dict:
@@ -56,6 +267,15 @@ def validate_csv(content: str, expected_columns: list[str],
       {"passed": bool, "missing_columns": list, "extra_columns": list,
        "blank_violations": list[{"column","row_index"}], "row_count": int}
     """
+    try:
+        header = _arrow_header(content, delimiter)
+    except Exception as e:
+        return {"passed": False, "error": str(e)}
+    if header is not None:
+        result = _validate_arrow(content, delimiter, header, expected_columns, required_columns or [])
+        if result is not None:
+            return result
+
     parsed = parse_csv(content, delimiter)
     if not parsed["success"]:
         return {"passed": False, "error": parsed.get("error")}
@@ -69,7 +289,7 @@ def validate_csv(content: str, expected_columns: list[str],
     if required_columns:
         for i, row in enumerate(parsed["rows"]):
             for col in required_columns:
-                if col in row and not str(row[col]).strip():
+                if col in row and _is_blank(row[col]):
                     blank_violations.append({"column": col, "row_index": i + 2})  # +2 for header + 1-based
 
     passed = not missing and not blank_violations
@@ -82,42 +302,173 @@ def validate_csv(content: str, expected_columns: list[str],
     }
 
 
+def _validate_arrow(content: str, delimiter: str, header: list[str],
+                    expected_columns: list[str], required_columns: list[str]) -> dict | None:
+    """validate_csv streamed over Arrow batches; None to use the csv path instead.
+
+    Only the required columns are converted (the first column when none
+    are present, to count rows), one batch is held at a time, and blank
+    checks stop once 50 violations are found.
+    """
+    present = [c for c in dict.fromkeys(required_columns) if c in header]
+    hits: list[tuple[int, int, str]] = []
+    row_count = 0
+    try:
+        for batch in _arrow_batches(content, delimiter, header, present or header[:1]):
+            # Later batches only hold later rows, so once 50 are found
+            # the rest only need counting
+            if len(hits) < 50:
+                for order, col in enumerate(required_columns):
+                    if col in present:
+                        blank = pc.equal(pc.utf8_trim_whitespace(batch.column(col)), "")
+                        hits.extend(
+                            (row_count + i, order, col) for i in pc.indices_nonzero(blank)[:50].to_pylist()
+                        )
+            row_count += batch.num_rows
+    except pa.ArrowInvalid:
+        return None
+
+    # Column names come from the first row, as with parse_csv
+    actual_cols = set(header) if row_count else set()
+    expected_set = set(expected_columns)
+    missing = list(expected_set - actual_cols)
+    extra = list(actual_cols - expected_set)
+    blank_violations = [{"column": col, "row_index": i + 2} for i, _, col in sorted(hits)[:50]]
+    return {
+        "passed": not missing and not blank_violations,
+        "missing_columns": missing,
+        "extra_columns": extra,
+        "blank_violations": blank_violations,
+        "row_count": row_count,
+    }
+
+
 def describe_csv(content: str, delimiter: str = ",") -> dict:
     """Compute basic statistics for each column.
 
     Returns:
       {"success": bool, "row_count": int, "columns": list[{"name","non_null","null_count","unique","sample"}]}
     """
+    try:
+        table = _parse_arrow(content, delimiter)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    if table is not None:
+        return {"success": True, "row_count": table.num_rows, "columns": _describe_arrow(table)}
+
+    try:
+        header, raw = _parse_fast(content, delimiter)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    n = len(header)
+    if len(set(header)) == n and all(len(r) == n for r in raw):
+        # Rectangular with unique names: read columns straight off the lists
+        columns = zip(header, zip(*raw)) if raw else ()
+        return {"success": True, "row_count": len(raw), "columns": [_column_stats(c, v, all_str=True) for c, v in columns]}
+
     parsed = parse_csv(content, delimiter)
     if not parsed["success"]:
         return {"success": False, "error": parsed.get("error")}
 
     rows = parsed["rows"]
+    stats = [_column_stats(col, [row.get(col, "") for row in rows]) for col in parsed["columns"]]
+    return {"success": True, "row_count": len(rows), "columns": stats}
+
+
+def describe_csv_path(path: str, delimiter: str = ",") -> dict:
+    """describe_csv for a file on disk, memory-mapped like parse_csv_path."""
+    try:
+        loaded = _load_path(path, delimiter)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    if isinstance(loaded, str):
+        return describe_csv(loaded, delimiter)
+    return {"success": True, "row_count": loaded.num_rows, "columns": _describe_arrow(loaded)}
+
+
+def _is_blank(v: Any) -> bool:
+    """Whether ``str(v).strip()`` is empty, without building either copy for str cells."""
+    return not v or v.isspace() if type(v) is str else not str(v).strip()
+
+
+def _column_stats(col: str, values: Iterable, all_str: bool = False) -> dict[str, Any]:
+    """Stats for one column; ``all_str`` marks values known to be str (no None/list cells)."""
+    values = list(values)
+    if all_str:
+        non_null = [v for v in values if v and not v.isspace()]
+    else:
+        # _is_blank inlined — this runs once per cell
+        non_null = [v for v in values if (v and not v.isspace() if type(v) is str else str(v).strip())]
+    # Ragged rows park overflow cells in a list under the None column
+    counts = Counter(tuple(v) if type(v) is list else v for v in non_null)
+
+    col_stat: dict[str, Any] = {
+        "name": col,
+        "non_null": len(non_null),
+        "null_count": len(values) - len(non_null),
+        "unique": len(counts),
+        "sample": non_null[:3],
+    }
+    col_stat.update(_numeric_stats(counts.items()))
+    return col_stat
+
+
+def _numeric_stats(counts: Iterable[tuple[Any, int]]) -> dict[str, float]:
+    """min/max/mean over the values float() accepts, given (value, occurrences) pairs.
+
+    float() runs once per distinct value instead of once per cell; empty
+    when nothing is numeric.
+    """
+    total = 0.0
+    n_numeric = 0
+    lo = hi = None
+    for value, n in counts:
+        try:
+            f = float(value)
+        except (TypeError, ValueError):
+            continue
+        total += f * n
+        n_numeric += n
+        lo = f if lo is None else min(lo, f)
+        hi = f if hi is None else max(hi, f)
+    if not n_numeric:
+        return {}
+    return {"min": lo, "max": hi, "mean": round(total / n_numeric, 4)}
+
+
+def _describe_arrow(table: "pa.Table") -> list[dict[str, Any]]:
+    """describe_csv's per-column stats, computed on Arrow arrays.
+
+    Blank filtering and distinct counting run as Arrow kernels; numeric
+    detection goes through the same float() rules as the csv path.
+    """
+    if not table.num_rows:
+        return []
     stats = []
-    for col in parsed["columns"]:
-        values = [row.get(col, "") for row in rows]
-        non_null = [v for v in values if str(v).strip()]
-        numeric_vals = []
-        for v in non_null:
-            try:
-                numeric_vals.append(float(v))
-            except ValueError:
-                pass
+    for name in table.column_names:
+        col = table[name]
+        non_null = pc.filter(col, pc.not_equal(pc.utf8_trim_whitespace(col), ""))
+        counts = pc.value_counts(non_null)
 
         col_stat: dict[str, Any] = {
-            "name": col,
+            "name": name,
             "non_null": len(non_null),
-            "null_count": len(values) - len(non_null),
-            "unique": len(set(non_null)),
-            "sample": non_null[:3],
+            "null_count": len(col) - len(non_null),
+            "unique": len(counts),
+            "sample": non_null[:3].to_pylist(),
         }
-        if numeric_vals:
-            col_stat["min"] = min(numeric_vals)
-            col_stat["max"] = max(numeric_vals)
-            col_stat["mean"] = round(sum(numeric_vals) / len(numeric_vals), 4)
+        col_stat.update(_numeric_stats(zip(counts.field("values").to_pylist(), counts.field("counts").to_pylist())))
         stats.append(col_stat)
+    return stats
 
-    return {"success": True, "row_count": len(rows), "columns": stats}
+
+def _dumps(rows: list) -> str:
+    """Compact JSON — orjson, or stdlib json for rows orjson rejects."""
+    try:
+        return orjson.dumps(rows, default=str).decode()
+    except TypeError:
+        pass  # non-str keys (extra fields of ragged rows) — only json coerces those
+    return json.dumps(rows, default=str, separators=(",", ":"), ensure_ascii=False)
 
 
 def csv_to_json(content: str, delimiter: str = ",") -> dict:
@@ -131,7 +482,7 @@ def csv_to_json(content: str, delimiter: str = ",") -> dict:
         return {"success": False, "json_str": "[]", "error": parsed.get("error")}
     return {
         "success": True,
-        "json_str": json.dumps(parsed["rows"], default=str),
+        "json_str": _dumps(parsed["rows"]),
         "row_count": parsed["row_count"],
     }
 
@@ -150,6 +501,15 @@ def transform_csv(content: str, transforms: list[dict], delimiter: str = ",") ->
     Returns:
       {"success": bool, "csv_str": str, "row_count": int}
     """
+    try:
+        table = _parse_arrow(content, delimiter)
+    except Exception as e:
+        return {"success": False, "csv_str": "", "error": str(e)}
+    if table is not None and table.num_rows:
+        table = _transform_arrow(table, transforms)
+    if table is not None and table.num_rows:
+        return {"success": True, "csv_str": _write_arrow(table), "row_count": table.num_rows}
+
     parsed = parse_csv(content, delimiter)
     if not parsed["success"]:
         return {"success": False, "csv_str": "", "error": parsed.get("error")}
@@ -157,6 +517,27 @@ def transform_csv(content: str, transforms: list[dict], delimiter: str = ",") ->
     rows = parsed["rows"]
     columns = list(parsed["columns"])
 
+    # Ragged input gives rows different key sets (missing columns, or the
+    # None overflow key); only the op-by-op DictWriter path handles those
+    n = len(columns)
+    plan = _compile_transforms(columns, transforms) if all(len(r) == n for r in rows) else None
+    if plan is not None:
+        # One pass over the rows, building each output row once
+        names, cells = plan
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(names)
+        writerow = writer.writerow
+        for row in rows:
+            line = []
+            for src, fns in cells:
+                v = row[src]
+                for fn in fns:
+                    v = fn(v)
+                line.append(v)
+            writerow(line)
+        return {"success": True, "csv_str": out.getvalue(), "row_count": len(rows)}
+
     for t in transforms:
         op = t.get("op", "")
         if op == "rename":
@@ -178,7 +559,7 @@ def transform_csv(content: str, transforms: list[dict], delimiter: str = ",") ->
             rows = [{k: (v.strip() if k == col else v) for k, v in row.items()} for row in rows]
         elif op == "fill_na":
             col, fill = t["column"], t.get("value", "")
-            rows = [{k: (fill if k == col and not str(v).strip() else v) for k, v in row.items()} for row in rows]
+            rows = [{k: (fill if k == col and _is_blank(v) else v) for k, v in row.items()} for row in rows]
 
     # Serialise back to CSV
     out = io.StringIO()
@@ -186,3 +567,107 @@ def transform_csv(content: str, transforms: list[dict], delimiter: str = ",") ->
     writer.writeheader()
     writer.writerows(rows)
     return {"success": True, "csv_str": out.getvalue(), "row_count": len(rows)}
+
+
+def _compile_transforms(columns: list[str], transforms: list[dict]) -> tuple[list[str], list[tuple]] | None:
+    """Fold transform_csv's ops into one recipe per output column.
+
+    Returns (output names, [(source column, value functions in order)]),
+    or None for a rename onto an existing column, whose dict-merge result
+    only the op-by-op path reproduces.
+    """
+    plan: dict[str, tuple[str, list]] = {c: (c, []) for c in columns}
+    for t in transforms:
+        op = t.get("op", "")
+        if op == "rename":
+            old, new = t["from"], t["to"]
+            if old in plan and old != new:
+                if new in plan:
+                    return None
+                plan = {(new if k == old else k): v for k, v in plan.items()}
+        elif op in ("drop", "upper", "lower", "strip", "fill_na"):
+            col = t["column"]
+            if col not in plan:
+                continue
+            if op == "drop":
+                del plan[col]
+            elif op == "upper":
+                plan[col][1].append(str.upper)
+            elif op == "lower":
+                plan[col][1].append(str.lower)
+            elif op == "strip":
+                plan[col][1].append(str.strip)
+            else:
+                fill = t.get("value", "")
+                plan[col][1].append(lambda v, fill=fill: fill if _is_blank(v) else v)
+    return list(plan), list(plan.values())
+
+
+def _write_arrow(table: "pa.Table") -> str:
+    """``table`` as CSV text, byte-for-byte what csv.writer would produce.
+
+    Rows are written by Arrow's C++ writer unquoted; csv.writer only quotes
+    fields holding a delimiter, quote or line break, which the unquoted
+    writer rejects, so those tables (and single-column ones, where csv.writer
+    quotes an empty field) go through csv.writer instead.
+    """
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(table.column_names)
+    if table.num_columns > 1:
+        buf = io.BytesIO()
+        try:
+            pacsv.write_csv(table, buf, write_options=pacsv.WriteOptions(include_header=False, quoting_style="none"))
+        except pa.ArrowInvalid:
+            pass
+        else:
+            return out.getvalue() + buf.getvalue().decode()
+    if table.num_columns:
+        writer.writerows(zip(*(c.to_pylist() for c in table.columns)))
+    else:
+        # Every column dropped: csv.writer still writes one empty line per row
+        writer.writerows(itertools.repeat((), table.num_rows))
+    return out.getvalue()
+
+
+def _transform_arrow(table: "pa.Table", transforms: list[dict]) -> "pa.Table | None":
+    """transform_csv's ops applied column-wise — one kernel per op, no row dicts.
+
+    Returns None for a rename onto an existing column, whose dict-merge
+    result only the row-wise path reproduces, and for upper/lower on a
+    non-ASCII column, where Arrow's case mapping differs from Python's
+    (``"ß".upper()`` is ``"SS"``, ``"İ".lower()`` gains a combining dot).
+    """
+    for t in transforms:
+        op = t.get("op", "")
+        names = table.column_names
+        if op == "rename":
+            old, new = t["from"], t["to"]
+            if old in names and old != new:
+                if new in names:
+                    return None
+                table = table.rename_columns([new if c == old else c for c in names])
+        elif op in ("drop", "upper", "lower", "strip", "fill_na"):
+            col = t["column"]
+            if col not in names:
+                continue
+            i = names.index(col)
+            if op == "drop":
+                table = table.remove_column(i)
+                continue
+            values = table.column(i)
+            if op in ("upper", "lower") and not pc.all(pc.string_is_ascii(values)).as_py():
+                return None
+            if op == "upper":
+                values = pc.ascii_upper(values)
+            elif op == "lower":
+                values = pc.ascii_lower(values)
+            elif op == "strip":
+                values = pc.utf8_trim(values, _PY_WHITESPACE)
+            else:
+                fill = t.get("value", "")
+                fill = "" if fill is None else str(fill)  # as csv.writer would render it
+                blank = pc.equal(pc.utf8_trim(values, _PY_WHITESPACE), "")
+                values = pc.if_else(blank, fill, values)
+            table = table.set_column(i, col, values)
+    return table
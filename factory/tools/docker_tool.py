@@ -8,36 +8,49 @@ Env vars:
   DOCKER_REGISTRY — optional registry prefix (e.g. us-central1-docker.pkg.dev/myproject/repo)
 """
 
+import json
 import logging
 import os
 import subprocess
 
+import orjson
+
+from factory.tools._binaries import resolve_binary
+
 log = logging.getLogger(__name__)
 
 DOCKER_BIN = os.getenv("DOCKER_BIN", "docker")
 TIMEOUT = int(os.getenv("DOCKER_TIMEOUT", "300"))
 REGISTRY = os.getenv("DOCKER_REGISTRY", "")
 
+_DOCKER_PATH = resolve_binary(DOCKER_BIN)
+
+
+def _exec(args: list[str], timeout: int | None = None) -> subprocess.CompletedProcess:
+    """Run docker with stdout/stderr captured as bytes (no text decode)."""
+    return subprocess.run([_DOCKER_PATH] + args, capture_output=True, timeout=timeout or TIMEOUT)
+
+
+def _error(message: str) -> dict:
+    return {"success": False, "stdout": "", "stderr": message, "returncode": -1}
+
 
 def _run(args: list[str], timeout: int | None = None) -> dict:
     try:
-        result = subprocess.run(
-            [DOCKER_BIN] + args,
-            capture_output=True, text=True,
-            timeout=timeout or TIMEOUT,
-        )
-        return {
-            "success": result.returncode == 0,
-            "stdout": result.stdout[:8000],
-            "stderr": result.stderr[:3000],
-            "returncode": result.returncode,
-        }
+        result = _exec(args, timeout)
     except FileNotFoundError:
-        return {"success": False, "stdout": "", "stderr": "docker not found in PATH", "returncode": -1}
+        return _error("docker not found in PATH")
     except subprocess.TimeoutExpired:
-        return {"success": False, "stdout": "", "stderr": "docker timed out", "returncode": -1}
+        return _error("docker timed out")
     except Exception as e:
-        return {"success": False, "stdout": "", "stderr": str(e), "returncode": -1}
+        return _error(str(e))
+    # Only the kept prefix is decoded, not the whole (possibly huge) output
+    return {
+        "success": result.returncode == 0,
+        "stdout": result.stdout[:8000].decode("utf-8", "replace"),
+        "stderr": result.stderr[:3000].decode("utf-8", "replace"),
+        "returncode": result.returncode,
+    }
 
 
 def build_image(
@@ -90,15 +103,21 @@ def inspect_image(tag: str) -> dict:
     Returns:
       {"success": bool, "metadata": dict, "error": str|None}
     """
-    result = _run(["inspect", tag, "--format", "{{json .}}"], timeout=30)
-    if result["success"]:
-        import json
+    # Parsed straight from the untruncated bytes — _run's 8000-char cap
+    # would cut the JSON of any sizeable image and fail the parse
+    try:
+        result = _exec(["inspect", tag, "--format", "{{json .}}"], timeout=30)
+    except FileNotFoundError:
+        return {"success": False, "metadata": {}, "error": "docker not found in PATH"}
+    except Exception as e:
+        return {"success": False, "metadata": {}, "error": str(e)}
+    if result.returncode == 0:
         try:
-            data = json.loads(result["stdout"])
+            data = orjson.loads(result.stdout)
             return {"success": True, "metadata": data[0] if isinstance(data, list) else data, "error": None}
         except Exception:
             pass
-    return {"success": False, "metadata": {}, "error": result["stderr"]}
+    return {"success": False, "metadata": {}, "error": result.stderr[:3000].decode("utf-8", "replace")}
 
 
 def list_images(filter_ref: str = "") -> dict:
@@ -9,11 +9,16 @@ Env vars:
   FIRECRAWL_TIMEOUT  — HTTP timeout seconds (default: 60)
 """
 
+import asyncio
+import contextlib
 import logging
 import os
-import time
+from functools import lru_cache
 
 import httpx
+import orjson
+
+from factory.tools._http_clients import async_client, client_scope, process_client
 
 log = logging.getLogger(__name__)
 
@@ -22,14 +27,63 @@ BASE_URL = os.getenv("FIRECRAWL_BASE_URL", "https://api.firecrawl.dev/v1")
 TIMEOUT = int(os.getenv("FIRECRAWL_TIMEOUT", "60"))
 
 
-def _headers() -> dict:
-    return {"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"}
+# Built once — the key is fixed for the life of the process
+_HEADERS = {"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"}
+
+# Crawl status polling: start short so small crawls return promptly, back off
+# to the old fixed interval for long ones; overall wait is unchanged (5 min).
+_POLL_FIRST = 2.0
+_POLL_MAX = 10.0
+_CRAWL_WAIT = 300.0
+
+
+@lru_cache(maxsize=1)
+def _http() -> httpx.Client:
+    """Process-wide client — keeps the Firecrawl TLS connection alive between calls."""
+    return process_client(
+        base_url=BASE_URL,
+        headers=_HEADERS,
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+    )
+
+
+def _json(resp: httpx.Response) -> dict:
+    """Response body as JSON, decoded with orjson rather than httpx's stdlib path."""
+    return orjson.loads(resp.content)
 
 
 def _available() -> bool:
     return bool(API_KEY)
 
 
+def _async_client() -> httpx.AsyncClient:
+    return async_client(
+        base_url=BASE_URL,
+        headers=_HEADERS,
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+
+
+def _client_scope(client: httpx.AsyncClient | None) -> contextlib.AbstractAsyncContextManager[httpx.AsyncClient]:
+    return client_scope(client, _async_client)
+
+
+def _scrape_result(resp: httpx.Response) -> dict:
+    if resp.status_code == 200:
+        data = _json(resp).get("data", {})
+        return {
+            "success": True,
+            "markdown": data.get("markdown", "")[:10000],
+            "html": data.get("html", "")[:5000],
+            "metadata": data.get("metadata", {}),
+            "error": None,
+        }
+    return {"success": False, "markdown": "", "html": "",
+            "metadata": {}, "error": f"HTTP {resp.status_code}: {resp.text[:300]}"}
+
+
 def scrape_url(url: str, formats: list[str] | None = None) -> dict:
     """Scrape a single URL and return clean markdown/HTML.
 
@@ -45,18 +99,23 @@ def scrape_url(url: str, formats: list[str] | None = None) -> dict:
                 "metadata": {}, "error": "FIRECRAWL_API_KEY not set"}
     payload = {"url": url, "formats": formats or ["markdown"]}
     try:
-        resp = httpx.post(f"{BASE_URL}/scrape", headers=_headers(), json=payload, timeout=TIMEOUT)
-        if resp.status_code == 200:
-            data = resp.json().get("data", {})
-            return {
-                "success": True,
-                "markdown": data.get("markdown", "")[:10000],
-                "html": data.get("html", "")[:5000],
-                "metadata": data.get("metadata", {}),
-                "error": None,
-            }
+        resp = _http().post("/scrape", json=payload)
+        return _scrape_result(resp)
+    except Exception as e:
+        return {"success": False, "markdown": "", "html": "", "metadata": {}, "error": str(e)}
+
+
+async def scrape_url_async(url: str, formats: list[str] | None = None,
+                           client: httpx.AsyncClient | None = None) -> dict:
+    """Async scrape_url; pass ``client`` to share its connections across calls."""
+    if not _available():
         return {"success": False, "markdown": "", "html": "",
-                "metadata": {}, "error": f"HTTP {resp.status_code}: {resp.text[:300]}"}
+                "metadata": {}, "error": "FIRECRAWL_API_KEY not set"}
+    payload = {"url": url, "formats": formats or ["markdown"]}
+    try:
+        async with _client_scope(client) as c:
+            resp = await c.post("/scrape", json=payload)
+        return _scrape_result(resp)
     except Exception as e:
         return {"success": False, "markdown": "", "html": "", "metadata": {}, "error": str(e)}
 
@@ -77,6 +136,13 @@ def crawl_site(url: str, max_pages: int = 20, include_paths: list[str] | None =
       {"success": bool, "pages": list[{"url": str, "markdown": str}],
        "page_count": int, "error": str|None}
     """
+    return asyncio.run(crawl_site_async(url, max_pages, include_paths, exclude_paths))
+
+
+async def crawl_site_async(url: str, max_pages: int = 20, include_paths: list[str] | None = None,
+                           exclude_paths: list[str] | None = None,
+                           client: httpx.AsyncClient | None = None) -> dict:
+    """Async crawl_site; pass ``client`` to share its connections across calls."""
     if not _available():
         return {"success": False, "pages": [], "page_count": 0,
                 "error": "FIRECRAWL_API_KEY not set"}
@@ -91,37 +157,58 @@ def crawl_site(url: str, max_pages: int = 20, include_paths: list[str] | None =
         payload["excludePaths"] = exclude_paths
 
     try:
-        # Start crawl job
-        start_resp = httpx.post(f"{BASE_URL}/crawl", headers=_headers(), json=payload, timeout=30)
-        if start_resp.status_code != 200:
-            return {"success": False, "pages": [], "page_count": 0,
-                    "error": f"HTTP {start_resp.status_code}: {start_resp.text[:300]}"}
-        job_id = start_resp.json().get("id", "")
-        if not job_id:
-            return {"success": False, "pages": [], "page_count": 0, "error": "No job ID returned"}
-
-        # Poll for completion
-        for _ in range(30):  # max 5 min
-            time.sleep(10)
-            status_resp = httpx.get(f"{BASE_URL}/crawl/{job_id}", headers=_headers(), timeout=15)
-            if status_resp.status_code != 200:
-                continue
-            status_data = status_resp.json()
-            if status_data.get("status") == "completed":
-                pages = [
-                    {"url": p.get("metadata", {}).get("url", ""), "markdown": p.get("markdown", "")[:5000]}
-                    for p in status_data.get("data", [])
-                ]
-                return {"success": True, "pages": pages, "page_count": len(pages), "error": None}
-            if status_data.get("status") == "failed":
+        async with _client_scope(client) as c:
+            # Start crawl job
+            start_resp = await c.post("/crawl", json=payload, timeout=30)
+            if start_resp.status_code != 200:
                 return {"success": False, "pages": [], "page_count": 0,
-                        "error": status_data.get("error", "Crawl failed")}
+                        "error": f"HTTP {start_resp.status_code}: {start_resp.text[:300]}"}
+            job_id = _json(start_resp).get("id", "")
+            if not job_id:
+                return {"success": False, "pages": [], "page_count": 0, "error": "No job ID returned"}
+
+            # Poll for completion — the sleeps yield, so concurrent crawls overlap
+            waited, delay = 0.0, _POLL_FIRST
+            while waited < _CRAWL_WAIT:
+                await asyncio.sleep(delay)
+                waited += delay
+                delay = min(delay * 2, _POLL_MAX)
+                status_resp = await c.get(f"/crawl/{job_id}", timeout=15)
+                if status_resp.status_code != 200:
+                    continue
+                status_data = _json(status_resp)
+                if status_data.get("status") == "completed":
+                    pages = [
+                        {"url": p.get("metadata", {}).get("url", ""), "markdown": p.get("markdown", "")[:5000]}
+                        for p in status_data.get("data", [])
+                    ]
+                    return {"success": True, "pages": pages, "page_count": len(pages), "error": None}
+                if status_data.get("status") == "failed":
+                    return {"success": False, "pages": [], "page_count": 0,
+                            "error": status_data.get("error", "Crawl failed")}
 
         return {"success": False, "pages": [], "page_count": 0, "error": "Crawl job timed out"}
     except Exception as e:
         return {"success": False, "pages": [], "page_count": 0, "error": str(e)}
 
 
+def crawl_site_batch(urls: list[str], max_pages: int = 20) -> list[dict]:
+    """Crawl several sites at once over one client.
+
+    The crawls' polling waits overlap, so the batch takes about as long
+    as the slowest crawl rather than the sum of all of them.
+
+    Returns:
+      One crawl_site() result per URL, in input order.
+    """
+    async def _batch() -> list[dict]:
+        async with _async_client() as client:
+            return list(await asyncio.gather(
+                *(crawl_site_async(u, max_pages, client=client) for u in urls)
+            ))
+    return asyncio.run(_batch())
+
+
 def extract_structured(url: str, schema: dict, prompt: str = "") -> dict:
     """Extract structured data from a URL using LLM-powered extraction.
 
@@ -143,9 +230,9 @@ def extract_structured(url: str, schema: dict, prompt: str = "") -> dict:
     if prompt:
         payload["extract"]["prompt"] = prompt
     try:
-        resp = httpx.post(f"{BASE_URL}/scrape", headers=_headers(), json=payload, timeout=TIMEOUT)
+        resp = _http().post("/scrape", json=payload)
         if resp.status_code == 200:
-            data = resp.json().get("data", {}).get("extract", {})
+            data = _json(resp).get("data", {}).get("extract", {})
             return {"success": True, "data": data, "error": None}
         return {"success": False, "data": {}, "error": f"HTTP {resp.status_code}: {resp.text[:300]}"}
     except Exception as e:
@@ -3,9 +3,12 @@
 For teams that produce code/configs when no Git repo is configured.
 """
 
+import asyncio
+import concurrent.futures
 import json
 import logging
 import os
+from functools import lru_cache
 
 from google.cloud import storage
 
@@ -13,8 +16,17 @@ log = logging.getLogger(__name__)
 
 BUCKET_NAME = os.getenv("GCS_BUCKET", "unicon-494419.firebasestorage.app")
 
+# Artifacts larger than this go up as a resumable upload in chunks of this
+# size; smaller ones stay single-request (a resumable session costs an extra
+# round trip).  Must be a multiple of 256 KiB.
+_CHUNK_SIZE = 8 << 20
+# Uploads are network-bound; past a few dozen threads the returns diminish.
+_UPLOAD_WORKERS = 16
 
-def _client():
+
+@lru_cache(maxsize=1)
+def _client() -> "storage.Client":
+    """Process-wide Storage client — shares one HTTP session and credentials."""
     return storage.Client(project=os.getenv("GCP_PROJECT_ID", "unicon-494419"))
 
 
@@ -31,11 +43,14 @@ def upload_artifact(
     Path: users/{uid}/projects/{project_id}/artifacts/{team}/{filename}
     Returns: {"gcs_path": str, "public_url": str}
     """
-    client = _client()
-    bucket = client.bucket(BUCKET_NAME)
+    return _upload_bytes(uid, project_id, team, filename, content.encode("utf-8"), content_type)
+
+
+def _upload_bytes(uid: str, project_id: str, team: str, filename: str, data: bytes, content_type: str) -> dict:
+    bucket = _client().bucket(BUCKET_NAME)
     blob_path = f"users/{uid}/projects/{project_id}/artifacts/{team}/{filename}"
-    blob = bucket.blob(blob_path)
-    blob.upload_from_string(content, content_type=content_type)
+    blob = bucket.blob(blob_path, chunk_size=_CHUNK_SIZE if len(data) > _CHUNK_SIZE else None)
+    blob.upload_from_string(data, content_type=content_type)
 
     log.info("GCS upload: gs://%s/%s", BUCKET_NAME, blob_path)
     return {
@@ -44,6 +59,56 @@ def upload_artifact(
     }
 
 
+async def upload_artifact_async(
+    uid: str,
+    project_id: str,
+    team: str,
+    filename: str,
+    content: str,
+    content_type: str = "text/plain",
+    mirror_path: str | None = None,
+) -> dict:
+    """upload_artifact without blocking the event loop.
+
+    With ``mirror_path`` the artifact is also written to that local file,
+    concurrently with the upload rather than before or after it.
+    """
+    data = content.encode("utf-8")
+    upload = asyncio.to_thread(_upload_bytes, uid, project_id, team, filename, data, content_type)
+    if mirror_path is None:
+        return await upload
+    result, _ = await asyncio.gather(upload, asyncio.to_thread(_write_mirror, mirror_path, data))
+    return result
+
+
+def _write_mirror(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def upload_many(
+    uid: str,
+    project_id: str,
+    team: str,
+    files: dict[str, str],
+    content_type: str = "text/plain",
+) -> list[dict]:
+    """Upload several artifact files concurrently on the shared client.
+
+    files: {filename: content}
+    Returns: one upload_artifact() result per file, in input order.
+    """
+    if not files:
+        return []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(files), _UPLOAD_WORKERS)) as pool:
+        futures = [
+            pool.submit(upload_artifact, uid, project_id, team, name, content, content_type)
+            for name, content in files.items()
+        ]
+        return [fut.result() for fut in futures]
+
+
 def upload_json(uid: str, project_id: str, team: str, filename: str, data: dict) -> dict:
     """Upload JSON data to GCS."""
     return upload_artifact(uid, project_id, team, filename, json.dumps(data, indent=2), "application/json")
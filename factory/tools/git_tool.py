@@ -10,6 +10,8 @@ import subprocess
 import tempfile
 from pathlib import Path
 
+from factory.persistence.git_store import inject_token, strip_credentials
+
 log = logging.getLogger(__name__)
 
 
@@ -29,40 +31,40 @@ def push_files(
     tmp = tempfile.mkdtemp(prefix="aifactory-git-")
     try:
         # Inject token for HTTPS auth
-        auth_url = git_url
-        if git_token and "://" in git_url:
-            # Strip any existing credentials then inject token
-            if "@" in git_url:
-                scheme, rest = git_url.split("://", 1)
-                rest = rest.split("@", 1)[1]
-                git_url = f"{scheme}://{rest}"
-            if git_url.startswith("https://"):
-                auth_url = git_url.replace("https://", f"https://x-access-token:{git_token}@")
-            elif git_url.startswith("http://"):
-                auth_url = git_url.replace("http://", f"http://x-access-token:{git_token}@")
+        auth_url = inject_token(git_url, git_token)
+        if git_token:
+            git_url = strip_credentials(git_url)
 
-        # Clone
-        subprocess.run(["git", "clone", "--depth", "1", auth_url, tmp], capture_output=True, check=True, timeout=60)
-        # Re-set remote so push also carries auth
-        subprocess.run(["git", "remote", "set-url", "origin", auth_url], cwd=tmp, capture_output=True, check=True)
+        # Clone without checking out a working tree — only the pushed files
+        # are ever written.  The clone's origin already carries the auth URL.
+        subprocess.run(["git", "clone", "--depth", "1", "--no-checkout", auth_url, tmp],
+                       capture_output=True, check=True, timeout=60)
+        # Load HEAD's tree into the index so the commit keeps every other file
+        # (fails harmlessly on an empty repo, where there is nothing to keep)
+        subprocess.run(["git", "reset", "-q"], cwd=tmp, capture_output=True)
 
-        # Create branch
         branch = f"ai-factory/{project_id}/{branch_suffix}"
-        subprocess.run(["git", "checkout", "-b", branch], cwd=tmp, capture_output=True, check=True)
 
-        # Write files
+        # Write files, then stage them all with one git add.  Each distinct
+        # directory is created once rather than once per file.
+        root = Path(tmp)
+        for parent in {(root / filepath).parent for filepath in files}:
+            parent.mkdir(parents=True, exist_ok=True)
         for filepath, content in files.items():
-            full_path = Path(tmp) / filepath
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text(content, encoding="utf-8")
-            subprocess.run(["git", "add", filepath], cwd=tmp, capture_output=True, check=True)
+            with open(root / filepath, "wb") as f:
+                f.write(content.encode("utf-8"))
+        subprocess.run(
+            ["git", "add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+            cwd=tmp, input="\0".join(files).encode(), capture_output=True, check=True,
+        )
 
-        # Commit and push
+        # Commit and push straight to the feature branch
         subprocess.run(
             ["git", "-c", "user.name=AI Factory", "-c", "user.email=ai-factory@bot", "commit", "-m", commit_message],
             cwd=tmp, capture_output=True, check=True,
         )
-        subprocess.run(["git", "push", "origin", branch], cwd=tmp, capture_output=True, check=True, timeout=60)
+        subprocess.run(["git", "push", "origin", f"HEAD:refs/heads/{branch}"],
+                       cwd=tmp, capture_output=True, check=True, timeout=60)
 
         # Get commit hash
         result = subprocess.run(["git", "rev-parse", "HEAD"], cwd=tmp, capture_output=True, text=True)
@@ -5,23 +5,58 @@ Env vars:
   GITHUB_ORG    — org/user to create repos under (default: saibheema)
 """
 
+import asyncio
+import contextlib
 import logging
 import os
+from functools import lru_cache
 
 import httpx
 
+from factory.tools._http_clients import async_client, client_scope, process_client
+
 log = logging.getLogger(__name__)
 
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
 GITHUB_ORG = os.getenv("GITHUB_ORG", "saibheema")
 GITHUB_API = "https://api.github.com"
 
+# Built once — the token is fixed for the life of the process
+_HEADERS = {"Accept": "application/vnd.github+json", "X-GitHub-Api-Version": "2022-11-28"}
+if GITHUB_TOKEN:
+    _HEADERS["Authorization"] = f"Bearer {GITHUB_TOKEN}"
+
+
+@lru_cache(maxsize=1)
+def _http() -> httpx.Client:
+    """Process-wide client — keeps the GitHub TLS connection alive between calls."""
+    return process_client(
+        base_url=GITHUB_API,
+        headers=_HEADERS,
+        timeout=15,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+    )
+
+
+def _async_client() -> httpx.AsyncClient:
+    return async_client(
+        base_url=GITHUB_API,
+        headers=_HEADERS,
+        timeout=15,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+
 
-def _headers() -> dict:
-    h = {"Accept": "application/vnd.github+json", "X-GitHub-Api-Version": "2022-11-28"}
-    if GITHUB_TOKEN:
-        h["Authorization"] = f"Bearer {GITHUB_TOKEN}"
-    return h
+def _client_scope(client: httpx.AsyncClient | None) -> contextlib.AbstractAsyncContextManager[httpx.AsyncClient]:
+    return client_scope(client, _async_client)
+
+
+def _repo_summary(d: dict) -> dict:
+    return {"repo_url": d["html_url"], "clone_url": d["clone_url"], "default_branch": d["default_branch"]}
+
+
+def _item_summaries(items: list[dict]) -> list[dict]:
+    return [{"number": i["number"], "title": i["title"], "url": i["html_url"], "state": i["state"]} for i in items]
 
 
 # ── Repo ────────────────────────────────────────────────────────────────────
@@ -34,9 +69,8 @@ def create_repo(name: str, description: str = "", private: bool = False) -> dict
     if not GITHUB_TOKEN:
         return {"error": "GITHUB_TOKEN not set", "repo_url": "", "clone_url": ""}
     try:
-        resp = httpx.post(
-            f"{GITHUB_API}/user/repos",
-            headers=_headers(),
+        resp = _http().post(
+            "/user/repos",
             json={"name": name, "description": description, "private": private, "auto_init": True},
             timeout=20,
         )
@@ -46,7 +80,7 @@ def create_repo(name: str, description: str = "", private: bool = False) -> dict
             return {"repo_url": data["html_url"], "clone_url": data["clone_url"], "full_name": data["full_name"]}
         # Repo already exists — return existing
         if resp.status_code == 422:
-            existing = httpx.get(f"{GITHUB_API}/repos/{GITHUB_ORG}/{name}", headers=_headers(), timeout=10).json()
+            existing = _http().get(f"/repos/{GITHUB_ORG}/{name}", timeout=10).json()
             return {"repo_url": existing["html_url"], "clone_url": existing["clone_url"], "full_name": existing["full_name"]}
         return {"error": resp.text, "repo_url": ""}
     except Exception as e:
@@ -57,10 +91,20 @@ def create_repo(name: str, description: str = "", private: bool = False) -> dict
 def get_repo(full_name: str) -> dict:
     """Fetch metadata for an existing repo."""
     try:
-        resp = httpx.get(f"{GITHUB_API}/repos/{full_name}", headers=_headers(), timeout=10)
+        resp = _http().get(f"/repos/{full_name}", timeout=10)
         resp.raise_for_status()
-        d = resp.json()
-        return {"repo_url": d["html_url"], "clone_url": d["clone_url"], "default_branch": d["default_branch"]}
+        return _repo_summary(resp.json())
+    except Exception as e:
+        return {"error": str(e)}
+
+
+async def get_repo_async(full_name: str, client: httpx.AsyncClient | None = None) -> dict:
+    """Async get_repo; pass ``client`` to share its connections across calls."""
+    try:
+        async with _client_scope(client) as c:
+            resp = await c.get(f"/repos/{full_name}", timeout=10)
+        resp.raise_for_status()
+        return _repo_summary(resp.json())
     except Exception as e:
         return {"error": str(e)}
 
@@ -78,9 +122,8 @@ def create_issue(repo_full_name: str, title: str, body: str, labels: list[str] |
         payload: dict = {"title": title, "body": body}
         if labels:
             payload["labels"] = labels
-        resp = httpx.post(
-            f"{GITHUB_API}/repos/{repo_full_name}/issues",
-            headers=_headers(),
+        resp = _http().post(
+            f"/repos/{repo_full_name}/issues",
             json=payload,
             timeout=15,
         )
@@ -96,14 +139,26 @@ def create_issue(repo_full_name: str, title: str, body: str, labels: list[str] |
 def list_issues(repo_full_name: str, state: str = "open") -> dict:
     """List open/closed issues for a repo."""
     try:
-        resp = httpx.get(
-            f"{GITHUB_API}/repos/{repo_full_name}/issues",
-            headers=_headers(),
+        resp = _http().get(
+            f"/repos/{repo_full_name}/issues",
             params={"state": state, "per_page": 20},
             timeout=15,
         )
         resp.raise_for_status()
-        issues = [{"number": i["number"], "title": i["title"], "url": i["html_url"], "state": i["state"]} for i in resp.json()]
+        issues = _item_summaries(resp.json())
+        return {"issues": issues, "count": len(issues)}
+    except Exception as e:
+        return {"error": str(e), "issues": []}
+
+
+async def list_issues_async(repo_full_name: str, state: str = "open",
+                            client: httpx.AsyncClient | None = None) -> dict:
+    """Async list_issues; pass ``client`` to share its connections across calls."""
+    try:
+        async with _client_scope(client) as c:
+            resp = await c.get(f"/repos/{repo_full_name}/issues", params={"state": state, "per_page": 20})
+        resp.raise_for_status()
+        issues = _item_summaries(resp.json())
         return {"issues": issues, "count": len(issues)}
     except Exception as e:
         return {"error": str(e), "issues": []}
@@ -125,9 +180,8 @@ def create_pull_request(
     if not GITHUB_TOKEN:
         return {"error": "GITHUB_TOKEN not set", "pr_url": ""}
     try:
-        resp = httpx.post(
-            f"{GITHUB_API}/repos/{repo_full_name}/pulls",
-            headers=_headers(),
+        resp = _http().post(
+            f"/repos/{repo_full_name}/pulls",
             json={"title": title, "body": body, "head": head_branch, "base": base_branch},
             timeout=15,
         )
@@ -143,35 +197,78 @@ def create_pull_request(
 def list_pull_requests(repo_full_name: str, state: str = "open") -> dict:
     """List PRs for a repo."""
     try:
-        resp = httpx.get(
-            f"{GITHUB_API}/repos/{repo_full_name}/pulls",
-            headers=_headers(),
+        resp = _http().get(
+            f"/repos/{repo_full_name}/pulls",
             params={"state": state, "per_page": 20},
             timeout=15,
         )
         resp.raise_for_status()
-        prs = [{"number": p["number"], "title": p["title"], "url": p["html_url"], "state": p["state"]} for p in resp.json()]
+        prs = _item_summaries(resp.json())
         return {"pull_requests": prs, "count": len(prs)}
     except Exception as e:
         return {"error": str(e), "pull_requests": []}
 
 
+async def list_pull_requests_async(repo_full_name: str, state: str = "open",
+                                   client: httpx.AsyncClient | None = None) -> dict:
+    """Async list_pull_requests; pass ``client`` to share its connections across calls."""
+    try:
+        async with _client_scope(client) as c:
+            resp = await c.get(f"/repos/{repo_full_name}/pulls", params={"state": state, "per_page": 20})
+        resp.raise_for_status()
+        prs = _item_summaries(resp.json())
+        return {"pull_requests": prs, "count": len(prs)}
+    except Exception as e:
+        return {"error": str(e), "pull_requests": []}
+
+
+# ── Overview ──────────────────────────────────────────────────────────────────
+
+async def repo_overview_async(repo_full_name: str, state: str = "open") -> dict:
+    """Repo metadata, issues and PRs fetched concurrently over one client."""
+    async with _async_client() as client:
+        repo, issues, prs = await asyncio.gather(
+            get_repo_async(repo_full_name, client),
+            list_issues_async(repo_full_name, state, client),
+            list_pull_requests_async(repo_full_name, state, client),
+        )
+    return {"repo": repo, "issues": issues, "pull_requests": prs}
+
+
+def repo_overview(repo_full_name: str, state: str = "open") -> dict:
+    """Sync wrapper for :func:`repo_overview_async` — one round trip of wall time instead of three.
+
+    Returns: {"repo": get_repo(), "issues": list_issues(), "pull_requests": list_pull_requests()}
+    """
+    return asyncio.run(repo_overview_async(repo_full_name, state))
+
+
 # ── Labels ────────────────────────────────────────────────────────────────────
 
 def ensure_labels(repo_full_name: str, labels: list[dict]) -> dict:
     """Create labels if they don't exist. labels = [{"name": str, "color": str, "description": str}]"""
     if not GITHUB_TOKEN:
         return {"skipped": True}
-    created = []
-    for lbl in labels:
+    return asyncio.run(ensure_labels_async(repo_full_name, labels))
+
+
+async def ensure_labels_async(repo_full_name: str, labels: list[dict],
+                              client: httpx.AsyncClient | None = None) -> dict:
+    """Async ensure_labels — every label is posted concurrently.
+
+    Labels are independent and re-creating one is a harmless 422, so
+    nothing needs ordering.
+    """
+    if not GITHUB_TOKEN:
+        return {"skipped": True}
+
+    async def _post(c: httpx.AsyncClient, lbl: dict) -> bool:
         try:
-            httpx.post(
-                f"{GITHUB_API}/repos/{repo_full_name}/labels",
-                headers=_headers(),
-                json=lbl,
-                timeout=10,
-            )
-            created.append(lbl["name"])
+            await c.post(f"/repos/{repo_full_name}/labels", json=lbl, timeout=10)
+            return True
         except Exception:
-            pass
-    return {"labels_created": created}
+            return False
+
+    async with _client_scope(client) as c:
+        done = await asyncio.gather(*(_post(c, lbl) for lbl in labels))
+    return {"labels_created": [lbl["name"] for lbl, ok in zip(labels, done) if ok]}
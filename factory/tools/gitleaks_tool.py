@@ -14,40 +14,96 @@ import logging
 import os
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover — optional accelerator
+    ijson = None  # type: ignore[assignment]
+
 log = logging.getLogger(__name__)
 
+# ijson's parse errors don't derive from ValueError
+_REPORT_ERRORS: tuple[type[Exception], ...] = (OSError, ValueError) + ((ijson.JSONError,) if ijson is not None else ())
+
 GITLEAKS_BIN = os.getenv("GITLEAKS_BIN", "gitleaks")
 TIMEOUT = int(os.getenv("GITLEAKS_TIMEOUT", "120"))
 CONFIG = os.getenv("GITLEAKS_CONFIG", "")
 
+# Full-history scans of repos with more commits than this are split into
+# contiguous commit windows scanned by parallel gitleaks processes.
+_SHARD_MIN_COMMITS = 500
+
+# Only this many findings are returned; the rest are counted, not kept
+_MAX_FINDINGS = 50
+
 
-def _run(args: list[str]) -> dict:
-    cmd = [GITLEAKS_BIN] + args + ["--report-format", "json"]
+def _run(args: list[str], stdin: str | None = None) -> dict:
+    # The report goes to a file and is read back incrementally, so a huge
+    # report is never held whole as captured stdout
+    fd, report = tempfile.mkstemp(suffix=".json", prefix="gitleaks_report_")
+    os.close(fd)
+    cmd = [GITLEAKS_BIN] + args + ["--report-format", "json", "--report-path", report]
     if CONFIG:
         cmd += ["--config", CONFIG]
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=TIMEOUT)
+        result = subprocess.run(cmd, input=stdin, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                text=True, timeout=TIMEOUT)
         # gitleaks exits 1 when leaks found
-        try:
-            data = json.loads(result.stdout) if result.stdout.strip() else []
-        except json.JSONDecodeError:
-            data = []
-        return {"leaks": data, "returncode": result.returncode, "stderr": result.stderr[:500]}
+        leaks, count = _read_report(report)
+        return {"leaks": leaks, "leak_count": count, "returncode": result.returncode,
+                "stderr": result.stderr[:500]}
     except FileNotFoundError:
         return {"leaks": [], "returncode": -1,
                 "error": "gitleaks not found — install from https://github.com/gitleaks/gitleaks/releases"}
     except subprocess.TimeoutExpired:
         return {"leaks": [], "returncode": -1, "error": "gitleaks timed out"}
+    finally:
+        Path(report).unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=1)
+def _pipe_supported() -> bool:
+    """Whether this gitleaks can scan stdin (``detect --pipe``, v8.17+) — checked once."""
+    try:
+        result = subprocess.run([GITLEAKS_BIN, "detect", "--help"], capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return "--pipe" in result.stdout + result.stderr
+
+
+def _read_report(report: str) -> tuple[list[dict], int]:
+    """The first _MAX_FINDINGS leaks of a JSON report file, and the total count.
+
+    With ijson the array is walked one leak at a time; otherwise the file
+    is loaded in one go.  Missing or empty reports read as no leaks; a
+    malformed one keeps whatever leaks parsed before the error.
+    """
+    kept: list[dict] = []
+    count = 0
+    try:
+        with open(report, "rb") as f:
+            if not os.fstat(f.fileno()).st_size:
+                return kept, count  # gitleaks failed before writing a report
+            leaks = ijson.items(f, "item") if ijson is not None else json.load(f)
+            for leak in leaks:
+                if count < _MAX_FINDINGS:
+                    kept.append(leak)
+                count += 1
+    except _REPORT_ERRORS:
+        pass
+    return kept, count
 
 
 def _parse(raw: dict) -> dict:
     leaks = raw.get("leaks", [])
     if "error" in raw:
         return {"passed": True, "secret_count": 0, "leaks": [], "error": raw["error"]}
+    count = raw.get("leak_count", len(leaks))
     findings = []
-    for leak in leaks:
+    for leak in leaks[:_MAX_FINDINGS]:
         findings.append({
             "rule_id": leak.get("RuleID") or leak.get("rule_id", ""),
             "description": leak.get("Description") or leak.get("description", ""),
@@ -60,30 +116,77 @@ def _parse(raw: dict) -> dict:
             "secret_preview": (leak.get("Secret") or leak.get("secret", ""))[:6] + "***",
         })
     return {
-        "passed": len(findings) == 0,
-        "secret_count": len(findings),
-        "leaks": findings[:50],
+        "passed": count == 0,
+        "secret_count": count,
+        "leaks": findings,
     }
 
 
-def scan_repo(path: str = ".", since_commit: str = "") -> dict:
+def scan_repo(path: str = ".", since_commit: str = "", depth: int | None = None) -> dict:
     """Scan a git repository for secrets in commit history.
 
     Args:
       path:         Path to git repository (default: current dir)
       since_commit: Optional commit SHA to scan from (for incremental scans)
+      depth:        Only scan the last ``depth`` commits of HEAD; ignored when
+                    since_commit is set.  CI pre-commit gates should pass
+                    depth=50 rather than audit the whole history.
 
     Returns:
       {"passed": bool, "secret_count": int, "leaks": list[{"rule_id","file","line","secret_preview"}]}
     """
-    args = ["detect", "--source", path, "--no-git" if not Path(path, ".git").exists() else ""]
+    is_git = Path(path, ".git").exists()
+    args = ["detect", "--source", path, "--no-git" if not is_git else ""]
     args = [a for a in args if a]
     if since_commit:
         args += ["--log-opts", f"{since_commit}..HEAD"]
+    elif depth is not None and is_git:
+        args += ["--log-opts", f"-n {depth}"]
+    elif is_git:
+        return _parse(_run_sharded(args, path))
     raw = _run(args)
     return _parse(raw)
 
 
+def _commit_count(path: str) -> int:
+    try:
+        result = subprocess.run(
+            ["git", "-C", path, "rev-list", "--count", "--all"],
+            capture_output=True, text=True, timeout=TIMEOUT,
+        )
+        return int(result.stdout.strip() or 0) if result.returncode == 0 else 0
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        return 0
+
+
+def _run_sharded(args: list[str], path: str) -> dict:
+    """_run over the full history, split across parallel gitleaks processes.
+
+    Each shard scans a disjoint window of the same ``git log --all`` walk
+    gitleaks does by default (``--skip``/``-n``), and the leaks are merged.
+    """
+    count = _commit_count(path)
+    shards = min(os.cpu_count() or 1, count // _SHARD_MIN_COMMITS)
+    if shards <= 1:
+        return _run(args)
+    size = -(-count // shards)  # ceil
+    windows = [
+        args + ["--log-opts", f"--full-history --all --skip={start} -n {size}"]
+        for start in range(0, count, size)
+    ]
+    with ThreadPoolExecutor(max_workers=len(windows)) as pool:
+        results = list(pool.map(_run, windows))
+    for r in results:
+        if "error" in r:
+            return r
+    return {
+        "leaks": [leak for r in results for leak in r["leaks"]][:_MAX_FINDINGS],
+        "leak_count": sum(r["leak_count"] for r in results),
+        "returncode": max(r["returncode"] for r in results),
+        "stderr": "".join(r.get("stderr", "") for r in results)[:500],
+    }
+
+
 def scan_string(content: str, rule_hint: str = "") -> dict:
     """Scan a string/content snippet for secrets (uses --no-git mode).
 
@@ -94,19 +197,22 @@ def scan_string(content: str, rule_hint: str = "") -> dict:
     Returns:
       {"passed": bool, "secret_count": int, "leaks": list}
     """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False, prefix="gitleaks_") as f:
-        f.write(content)
-        tmp_path = f.name
-    try:
-        raw = _run(["detect", "--source", tmp_path, "--no-git"])
-        result = _parse(raw)
-        # Fix file path in findings back to rule_hint
-        for leak in result.get("leaks", []):
-            if rule_hint:
-                leak["file"] = rule_hint
-        return result
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+    if _pipe_supported():
+        # Piped straight in — no temp file to write and remove
+        result = _parse(_run(["detect", "--pipe", "--no-git"], stdin=content))
+    else:
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False, prefix="gitleaks_") as f:
+            f.write(content)
+            tmp_path = f.name
+        try:
+            result = _parse(_run(["detect", "--source", tmp_path, "--no-git"]))
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
+    # Fix file path in findings back to rule_hint
+    for leak in result.get("leaks", []):
+        if rule_hint:
+            leak["file"] = rule_hint
+    return result
 
 
 def scan_staged_changes(repo_path: str = ".") -> dict:
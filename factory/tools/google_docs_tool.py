@@ -5,10 +5,8 @@ Documents are created in a shared Drive folder per project.
 """
 
 import logging
-import os
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from factory.tools._google_api import service
 
 log = logging.getLogger(__name__)
 
@@ -18,23 +16,12 @@ SCOPES = [
 ]
 
 
-def _get_creds():
-    """Build credentials from ADC or explicit path."""
-    cred_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-    if cred_path:
-        return service_account.Credentials.from_service_account_file(cred_path, scopes=SCOPES)
-    # On Cloud Run, use default credentials
-    import google.auth
-    creds, _ = google.auth.default(scopes=SCOPES)
-    return creds
-
-
 def _docs_service():
-    return build("docs", "v1", credentials=_get_creds(), cache_discovery=False)
+    return service("docs", "v1", SCOPES)
 
 
 def _drive_service():
-    return build("drive", "v3", credentials=_get_creds(), cache_discovery=False)
+    return service("drive", "v3", SCOPES)
 
 
 def create_document(title: str, content: str, folder_id: str | None = None) -> dict:
@@ -67,7 +54,8 @@ def create_document(title: str, content: str, folder_id: str | None = None) -> d
 def append_to_document(doc_id: str, content: str) -> dict:
     """Append text to an existing Google Doc."""
     docs = _docs_service()
-    doc = docs.documents().get(documentId=doc_id).execute()
+    # Only the end index is needed — not the whole document body
+    doc = docs.documents().get(documentId=doc_id, fields="body(content(endIndex))").execute()
     end_index = doc["body"]["content"][-1]["endIndex"] - 1
     requests = [{"insertText": {"location": {"index": max(end_index, 1)}, "text": "\n" + content}}]
     docs.documents().batchUpdate(documentId=doc_id, body={"requests": requests}).execute()
@@ -1,10 +1,11 @@
 """Google Drive tool — manage project folders and file organization."""
 
+import concurrent.futures
 import logging
 import os
+import threading
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from factory.tools._google_api import service
 
 log = logging.getLogger(__name__)
 
@@ -14,17 +15,31 @@ SCOPES = ["https://www.googleapis.com/auth/drive.file"]
 ROOT_FOLDER_ID = os.getenv("GDRIVE_ROOT_FOLDER_ID", "")
 
 
-def _get_creds():
-    cred_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-    if cred_path:
-        return service_account.Credentials.from_service_account_file(cred_path, scopes=SCOPES)
-    import google.auth
-    creds, _ = google.auth.default(scopes=SCOPES)
-    return creds
+def _drive_service():
+    return service("drive", "v3", SCOPES)
 
 
-def _drive_service():
-    return build("drive", "v3", credentials=_get_creds(), cache_discovery=False)
+# uid → user folder id.  A user's folder is looked up (or created) once per
+# process; every later project of theirs goes straight to the project level.
+_USER_FOLDERS_MAX = 4096
+_user_folders: dict[str, str] = {}
+_user_folders_lock = threading.Lock()
+# Drive calls are network-bound; bulk provisioning runs this many at once
+_FOLDER_WORKERS = 8
+
+
+def _user_folder(uid: str) -> str:
+    with _user_folders_lock:
+        folder = _user_folders.get(uid)
+    if folder is not None:
+        return folder
+    folder = _find_or_create_folder(_drive_service(), uid, ROOT_FOLDER_ID or None)
+    with _user_folders_lock:
+        if len(_user_folders) >= _USER_FOLDERS_MAX:
+            # Drop the oldest entry (dicts keep insertion order)
+            _user_folders.pop(next(iter(_user_folders)))
+        _user_folders[uid] = folder
+    return folder
 
 
 def ensure_project_folder(project_id: str, uid: str) -> str:
@@ -35,20 +50,43 @@ def ensure_project_folder(project_id: str, uid: str) -> str:
     """
     drive = _drive_service()
 
-    # Find or create the user folder
-    user_folder = _find_or_create_folder(drive, uid, ROOT_FOLDER_ID or None)
+    # Find or create the user folder (remembered after the first project)
+    user_folder = _user_folder(uid)
     # Find or create the project folder
-    project_folder = _find_or_create_folder(drive, project_id, user_folder)
+    try:
+        project_folder = _find_or_create_folder(drive, project_id, user_folder)
+    except Exception:
+        # The remembered user folder may have been deleted — look it up again
+        with _user_folders_lock:
+            _user_folders.pop(uid, None)
+        project_folder = _find_or_create_folder(drive, project_id, _user_folder(uid))
 
     log.info("Drive project folder: %s/%s → %s", uid, project_id, project_folder)
     return project_folder
 
 
+def ensure_project_folders_bulk(items: list[tuple[str, str]]) -> dict[tuple[str, str], str]:
+    """ensure_project_folder for many (project_id, uid) pairs concurrently.
+
+    Each distinct user folder is resolved first, once, so concurrent
+    projects of one user never race to create it.
+    Returns {(project_id, uid): folder_id}.
+    """
+    if not items:
+        return {}
+    uids = list(dict.fromkeys(uid for _, uid in items))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(items), _FOLDER_WORKERS)) as pool:
+        list(pool.map(_user_folder, uids))
+        pairs = list(dict.fromkeys(items))
+        folders = pool.map(lambda item: ensure_project_folder(*item), pairs)
+        return dict(zip(pairs, folders))
+
+
 def _find_or_create_folder(drive, name: str, parent_id: str | None) -> str:
     """Find an existing folder by name under parent, or create one."""
-    query = f"name='{name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
+    query = f"name='{_q_escape(name)}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
     if parent_id:
-        query += f" and '{parent_id}' in parents"
+        query += f" and '{_q_escape(parent_id)}' in parents"
     results = drive.files().list(q=query, fields="files(id)", pageSize=1).execute()
     files = results.get("files", [])
     if files:
@@ -61,6 +99,11 @@ def _find_or_create_folder(drive, name: str, parent_id: str | None) -> str:
     return folder["id"]
 
 
+def _q_escape(value: str) -> str:
+    """``value`` as the body of a single-quoted Drive query string."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
 def share_with_user(file_id: str, email: str, role: str = "writer") -> None:
     """Share a Drive file/folder with a user by email."""
     drive = _drive_service()
@@ -68,5 +111,6 @@ def share_with_user(file_id: str, email: str, role: str = "writer") -> None:
         fileId=file_id,
         body={"type": "user", "role": role, "emailAddress": email},
         sendNotificationEmail=False,
+        fields="id",
     ).execute()
     log.info("Shared %s with %s (%s)", file_id, email, role)
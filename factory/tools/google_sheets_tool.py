@@ -4,10 +4,8 @@ Uses Application Default Credentials.
 """
 
 import logging
-import os
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from factory.tools._google_api import service
 
 log = logging.getLogger(__name__)
 
@@ -17,21 +15,12 @@ SCOPES = [
 ]
 
 
-def _get_creds():
-    cred_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-    if cred_path:
-        return service_account.Credentials.from_service_account_file(cred_path, scopes=SCOPES)
-    import google.auth
-    creds, _ = google.auth.default(scopes=SCOPES)
-    return creds
-
-
 def _sheets_service():
-    return build("sheets", "v4", credentials=_get_creds(), cache_discovery=False)
+    return service("sheets", "v4", SCOPES)
 
 
 def _drive_service():
-    return build("drive", "v3", credentials=_get_creds(), cache_discovery=False)
+    return service("drive", "v3", SCOPES)
 
 
 def create_spreadsheet(
@@ -56,39 +45,51 @@ def create_spreadsheet(
     sheet_id = sheet_file["id"]
     sheet_url = sheet_file.get("webViewLink", f"https://docs.google.com/spreadsheets/d/{sheet_id}/edit")
 
-    # Write data
+    # Values, bold header and column widths in one batchUpdate round trip
     sheets = _sheets_service()
     values = [headers] + rows
-    sheets.spreadsheets().values().update(
-        spreadsheetId=sheet_id,
-        range="Sheet1!A1",
-        valueInputOption="RAW",
-        body={"values": values},
-    ).execute()
-
-    # Auto-resize + bold headers
+    requests = [
+        {
+            "updateCells": {
+                "start": {"sheetId": 0, "rowIndex": 0, "columnIndex": 0},
+                "rows": [{"values": [_cell(v) for v in row]} for row in values],
+                "fields": "userEnteredValue",
+            }
+        },
+        {
+            "repeatCell": {
+                "range": {"sheetId": 0, "startRowIndex": 0, "endRowIndex": 1},
+                "cell": {"userEnteredFormat": {"textFormat": {"bold": True}}},
+                "fields": "userEnteredFormat.textFormat.bold",
+            }
+        },
+        {
+            "autoResizeDimensions": {
+                "dimensions": {"sheetId": 0, "dimension": "COLUMNS", "startIndex": 0, "endIndex": len(headers)}
+            }
+        },
+    ]
     try:
-        sheets.spreadsheets().batchUpdate(
+        sheets.spreadsheets().batchUpdate(spreadsheetId=sheet_id, body={"requests": requests}).execute()
+    except Exception:
+        # Formatting is non-critical — retry with just the values
+        sheets.spreadsheets().values().update(
             spreadsheetId=sheet_id,
-            body={
-                "requests": [
-                    {
-                        "repeatCell": {
-                            "range": {"sheetId": 0, "startRowIndex": 0, "endRowIndex": 1},
-                            "cell": {"userEnteredFormat": {"textFormat": {"bold": True}}},
-                            "fields": "userEnteredFormat.textFormat.bold",
-                        }
-                    },
-                    {
-                        "autoResizeDimensions": {
-                            "dimensions": {"sheetId": 0, "dimension": "COLUMNS", "startIndex": 0, "endIndex": len(headers)}
-                        }
-                    },
-                ]
-            },
+            range="Sheet1!A1",
+            valueInputOption="RAW",
+            body={"values": values},
         ).execute()
-    except Exception:
-        pass  # Non-critical formatting
 
     log.info("Created Google Sheet: %s (%d rows) → %s", title, len(rows), sheet_url)
     return {"sheet_id": sheet_id, "sheet_url": sheet_url, "title": title, "rows": len(rows)}
+
+
+def _cell(value) -> dict:
+    """A CellData entry holding ``value`` as a RAW values().update would store it."""
+    if value is None:
+        return {}
+    if isinstance(value, bool):
+        return {"userEnteredValue": {"boolValue": value}}
+    if isinstance(value, (int, float)):
+        return {"userEnteredValue": {"numberValue": value}}
+    return {"userEnteredValue": {"stringValue": str(value)}}
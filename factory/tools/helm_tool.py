@@ -8,9 +8,17 @@ Env vars:
   HELM_TIMEOUT    — command timeout in seconds (default: 120)
 """
 
+import atexit
+import hashlib
 import logging
 import os
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from factory.tools._binaries import resolve_binary
 
 log = logging.getLogger(__name__)
 
@@ -18,11 +26,21 @@ HELM_BIN = os.getenv("HELM_BIN", "helm")
 NAMESPACE = os.getenv("HELM_NAMESPACE", "default")
 TIMEOUT = int(os.getenv("HELM_TIMEOUT", "120"))
 
+_HELM_PATH = resolve_binary(HELM_BIN)
+# Releases upgraded at once by upgrade_many — each is its own helm process
+# talking to the same API server, so keep the fan-out modest.
+_UPGRADE_WORKERS = 4
+
+# Values files written by this process, keyed by content digest — retrying
+# or re-installing with the same values reuses the file.  Removed at exit.
+_values_files: set[str] = set()
+_values_lock = threading.Lock()
+
 
 def _run(args: list[str]) -> dict:
     try:
         result = subprocess.run(
-            [HELM_BIN] + args,
+            [_HELM_PATH] + args,
             capture_output=True, text=True, timeout=TIMEOUT,
         )
         return {
@@ -59,7 +77,6 @@ def install_chart(
     Returns:
       {"success": bool, "stdout": str, "stderr": str}
     """
-    import tempfile, json
     ns = namespace or NAMESPACE
     args = ["install", release_name, chart, "-n", ns, "--create-namespace"]
     if dry_run:
@@ -68,13 +85,36 @@ def install_chart(
         for s in set_args:
             args += ["--set", s]
     if values:
-        with tempfile.NamedTemporaryFile(suffix=".yaml", mode="w", delete=False) as f:
-            import yaml  # type: ignore[import]
-            yaml.dump(values, f)
-            args += ["-f", f.name]
+        args += ["-f", _values_file(values)]
     return _run(args)
 
 
+def _values_file(values: dict) -> str:
+    """Path of a YAML file holding ``values``, written once per distinct content."""
+    import yaml  # type: ignore[import]
+    # libyaml's C emitter when available
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    # Keyed by the YAML helm will actually read, so equal keys mean equal files
+    text = yaml.dump(values, Dumper=dumper)
+    digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    path = os.path.join(tempfile.gettempdir(), f"ai-factory-helm-{digest}.yaml")
+    with _values_lock:
+        if path in _values_files and os.path.exists(path):
+            return path
+        with tempfile.NamedTemporaryFile(suffix=".yaml", mode="w", delete=False) as f:
+            f.write(text)
+        os.replace(f.name, path)
+        if not _values_files:
+            atexit.register(_remove_values_files)
+        _values_files.add(path)
+    return path
+
+
+def _remove_values_files() -> None:
+    for path in _values_files:
+        Path(path).unlink(missing_ok=True)
+
+
 def upgrade_chart(
     release_name: str,
     chart: str,
@@ -93,6 +133,27 @@ def upgrade_chart(
     return _run(args)
 
 
+def upgrade_many(releases: list[dict], max_workers: int = _UPGRADE_WORKERS) -> list[dict]:
+    """Run several independent upgrade_chart() calls concurrently.
+
+    Each helm invocation spends much of its time starting up (kubeconfig,
+    API discovery, TLS to the API server); running them side by side
+    overlaps that instead of paying it once per release in sequence.
+
+    Args:
+      releases:    upgrade_chart keyword arguments, one dict per release
+                   (e.g. {"release_name": "api", "chart": "./charts/api"})
+      max_workers: Releases in flight at once (default 4)
+
+    Returns:
+      One upgrade_chart() result per release, in input order.
+    """
+    if not releases:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(releases)))) as pool:
+        return list(pool.map(lambda kwargs: upgrade_chart(**kwargs), releases))
+
+
 def rollback_release(release_name: str, revision: int = 0, namespace: str = "") -> dict:
     """Rollback a release to a previous revision (0 = previous)."""
     ns = namespace or NAMESPACE
@@ -8,23 +8,122 @@ Env vars:
   HF_ENDPOINT  — custom endpoint (default: https://huggingface.co)
 """
 
+import asyncio
+import contextlib
 import logging
 import os
+import threading
+import time
+from functools import lru_cache
 
 import httpx
 
+from factory.tools._http_clients import async_client, client_scope, process_client
+
 log = logging.getLogger(__name__)
 
 HF_TOKEN = os.getenv("HF_TOKEN", "")
 HF_API = "https://huggingface.co/api"
 TIMEOUT = 15
 
+# GET responses are reused for _CACHE_TTL seconds, then revalidated with the
+# ETag / Last-Modified the Hub sent (a 304 carries no body).  While the Hub
+# is unreachable or erroring, the last good response is served.  Bounded LRU.
+_CACHE_TTL = 300.0
+_CACHE_MAX = 512
+_cache: dict[tuple, tuple[float, httpx.Response]] = {}
+_cache_lock = threading.Lock()
+
+# Built once — the token is fixed for the life of the process
+_HEADERS = {"Accept": "application/json"}
+if HF_TOKEN:
+    _HEADERS["Authorization"] = f"Bearer {HF_TOKEN}"
+
+
+@lru_cache(maxsize=1)
+def _http() -> httpx.Client:
+    """Process-wide client — keeps the Hub TLS connection alive between calls."""
+    return process_client(
+        headers=_HEADERS,
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+
+
+def _async_client() -> httpx.AsyncClient:
+    return async_client(
+        headers=_HEADERS,
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+
+
+def _cache_lookup(url: str, params: dict | None) -> tuple[tuple, tuple[float, httpx.Response] | None]:
+    key = (url, tuple(sorted((params or {}).items())))
+    with _cache_lock:
+        hit = _cache.pop(key, None)
+        if hit is not None:
+            _cache[key] = hit  # re-insert as most recent
+    return key, hit
+
+
+def _validators(hit: tuple[float, httpx.Response] | None) -> dict | None:
+    """Conditional-GET headers for revalidating a cached response."""
+    if hit is None:
+        return None
+    headers = {}
+    if etag := hit[1].headers.get("etag"):
+        headers["If-None-Match"] = etag
+    if modified := hit[1].headers.get("last-modified"):
+        headers["If-Modified-Since"] = modified
+    return headers or None
+
+
+def _settle(key: tuple, hit: tuple[float, httpx.Response] | None, resp: httpx.Response) -> httpx.Response:
+    """The response to return for a (possibly conditional) GET; caches 200s."""
+    if resp.status_code == 304 and hit is not None:
+        resp = hit[1]
+    elif resp.status_code != 200:
+        # stale-if-error: a server failure doesn't replace a good answer
+        return hit[1] if hit is not None and resp.status_code >= 500 else resp
+    with _cache_lock:
+        if key not in _cache and len(_cache) >= _CACHE_MAX:
+            # Drop the least recently used entry (dicts keep insertion order)
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = (time.monotonic() + _CACHE_TTL, resp)
+    return resp
+
+
+def _get(url: str, params: dict | None = None, **kwargs) -> httpx.Response:
+    """GET through the response cache on the shared client."""
+    key, hit = _cache_lookup(url, params)
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
+    try:
+        resp = _http().get(url, params=params, headers=_validators(hit), **kwargs)
+    except httpx.HTTPError:
+        if hit is not None:
+            return hit[1]
+        raise
+    return _settle(key, hit, resp)
+
+
+async def _aget(client: httpx.AsyncClient, url: str, params: dict | None = None, **kwargs) -> httpx.Response:
+    """Async _get on ``client``, sharing the same response cache."""
+    key, hit = _cache_lookup(url, params)
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
+    try:
+        resp = await client.get(url, params=params, headers=_validators(hit), **kwargs)
+    except httpx.HTTPError:
+        if hit is not None:
+            return hit[1]
+        raise
+    return _settle(key, hit, resp)
+
 
-def _headers() -> dict:
-    h = {"Accept": "application/json"}
-    if HF_TOKEN:
-        h["Authorization"] = f"Bearer {HF_TOKEN}"
-    return h
+def _client_scope(client: httpx.AsyncClient | None) -> contextlib.AbstractAsyncContextManager[httpx.AsyncClient]:
+    return client_scope(client, _async_client)
 
 
 def search_models(query: str, task: str = "", limit: int = 10) -> dict:
@@ -46,7 +145,7 @@ def search_models(query: str, task: str = "", limit: int = 10) -> dict:
     if task:
         params["pipeline_tag"] = task
     try:
-        resp = httpx.get(f"{HF_API}/models", headers=_headers(), params=params, timeout=TIMEOUT)
+        resp = _get(f"{HF_API}/models", params=params)
         resp.raise_for_status()
         models = resp.json()
         results = [
@@ -77,26 +176,55 @@ def get_model_info(model_id: str) -> dict:
        "tags": list, "library": str, "created_at": str, "card_summary": str}
     """
     try:
-        resp = httpx.get(f"{HF_API}/models/{model_id}", headers=_headers(), timeout=TIMEOUT)
+        resp = _get(f"{HF_API}/models/{model_id}")
         resp.raise_for_status()
-        m = resp.json()
-        return {
-            "success": True,
-            "id": m.get("id", ""),
-            "task": m.get("pipeline_tag", ""),
-            "downloads": m.get("downloads", 0),
-            "likes": m.get("likes", 0),
-            "tags": m.get("tags", []),
-            "library": m.get("library_name", ""),
-            "created_at": m.get("createdAt", ""),
-            "private": m.get("private", False),
-            "url": f"https://huggingface.co/{model_id}",
-            "error": None,
-        }
+        return _model_info(model_id, resp.json())
     except Exception as e:
         return {"success": False, "id": model_id, "error": str(e)}
 
 
+async def get_model_info_async(model_id: str, client: httpx.AsyncClient | None = None) -> dict:
+    """Async get_model_info; pass ``client`` to share its connections across calls."""
+    try:
+        async with _client_scope(client) as c:
+            resp = await _aget(c, f"{HF_API}/models/{model_id}")
+        resp.raise_for_status()
+        return _model_info(model_id, resp.json())
+    except Exception as e:
+        return {"success": False, "id": model_id, "error": str(e)}
+
+
+def _model_info(model_id: str, m: dict) -> dict:
+    return {
+        "success": True,
+        "id": m.get("id", ""),
+        "task": m.get("pipeline_tag", ""),
+        "downloads": m.get("downloads", 0),
+        "likes": m.get("likes", 0),
+        "tags": m.get("tags", []),
+        "library": m.get("library_name", ""),
+        "created_at": m.get("createdAt", ""),
+        "private": m.get("private", False),
+        "url": f"https://huggingface.co/{model_id}",
+        "error": None,
+    }
+
+
+def get_models_bulk(model_ids: list[str]) -> list[dict]:
+    """get_model_info for several models at once, fetched concurrently over one client.
+
+    Returns: one get_model_info() result per id, in input order.
+    """
+    if not model_ids:
+        return []
+    return asyncio.run(_get_models_bulk(model_ids))
+
+
+async def _get_models_bulk(model_ids: list[str]) -> list[dict]:
+    async with _async_client() as client:
+        return list(await asyncio.gather(*(get_model_info_async(m, client) for m in model_ids)))
+
+
 def search_datasets(query: str, limit: int = 10) -> dict:
     """Search HuggingFace datasets.
 
@@ -105,7 +233,7 @@ def search_datasets(query: str, limit: int = 10) -> dict:
     """
     try:
         params = {"search": query, "limit": limit, "sort": "downloads", "direction": -1}
-        resp = httpx.get(f"{HF_API}/datasets", headers=_headers(), params=params, timeout=TIMEOUT)
+        resp = _get(f"{HF_API}/datasets", params=params)
         resp.raise_for_status()
         datasets = resp.json()
         results = [
@@ -130,19 +258,28 @@ def get_model_card(model_id: str) -> dict:
       {"success": bool, "card": str (first 3000 chars), "error": str|None}
     """
     try:
-        resp = httpx.get(
-            f"https://huggingface.co/{model_id}/raw/main/README.md",
-            headers=_headers(),
-            timeout=TIMEOUT,
-            follow_redirects=True,
-        )
-        if resp.status_code == 200:
-            return {"success": True, "card": resp.text[:3000], "error": None}
-        return {"success": False, "card": "", "error": f"HTTP {resp.status_code}"}
+        resp = _get(f"https://huggingface.co/{model_id}/raw/main/README.md", follow_redirects=True)
+        return _card_result(resp)
+    except Exception as e:
+        return {"success": False, "card": "", "error": str(e)}
+
+
+async def get_model_card_async(model_id: str, client: httpx.AsyncClient | None = None) -> dict:
+    """Async get_model_card; pass ``client`` to share its connections across calls."""
+    try:
+        async with _client_scope(client) as c:
+            resp = await _aget(c, f"https://huggingface.co/{model_id}/raw/main/README.md", follow_redirects=True)
+        return _card_result(resp)
     except Exception as e:
         return {"success": False, "card": "", "error": str(e)}
 
 
+def _card_result(resp: httpx.Response) -> dict:
+    if resp.status_code == 200:
+        return {"success": True, "card": resp.text[:3000], "error": None}
+    return {"success": False, "card": "", "error": f"HTTP {resp.status_code}"}
+
+
 def list_model_files(model_id: str) -> dict:
     """List files in a model repository.
 
@@ -150,10 +287,62 @@ def list_model_files(model_id: str) -> dict:
       {"success": bool, "files": list[{"path": str, "size": int}]}
     """
     try:
-        resp = httpx.get(f"{HF_API}/models/{model_id}", headers=_headers(), timeout=TIMEOUT)
+        resp = _get(f"{HF_API}/models/{model_id}")
         resp.raise_for_status()
-        siblings = resp.json().get("siblings", [])
-        files = [{"path": s.get("rfilename", ""), "size": s.get("size", 0)} for s in siblings]
-        return {"success": True, "files": files, "error": None}
+        return _files_result(resp.json())
     except Exception as e:
         return {"success": False, "files": [], "error": str(e)}
+
+
+async def list_model_files_async(model_id: str, client: httpx.AsyncClient | None = None) -> dict:
+    """Async list_model_files; pass ``client`` to share its connections across calls."""
+    try:
+        async with _client_scope(client) as c:
+            resp = await _aget(c, f"{HF_API}/models/{model_id}")
+        resp.raise_for_status()
+        return _files_result(resp.json())
+    except Exception as e:
+        return {"success": False, "files": [], "error": str(e)}
+
+
+def _files_result(m: dict) -> dict:
+    siblings = m.get("siblings", [])
+    files = [{"path": s.get("rfilename", ""), "size": s.get("size", 0)} for s in siblings]
+    return {"success": True, "files": files, "error": None}
+
+
+async def get_model_details_async(model_id: str, client: httpx.AsyncClient | None = None) -> dict:
+    """Info, model card and file list for one model, fetched concurrently.
+
+    Info and files come from the same /models/{id} response, so this is
+    two requests rather than three.
+    """
+    async with _client_scope(client) as c:
+        async def info_and_files() -> tuple[dict, dict]:
+            try:
+                resp = await _aget(c, f"{HF_API}/models/{model_id}")
+                resp.raise_for_status()
+                m = resp.json()
+                return _model_info(model_id, m), _files_result(m)
+            except Exception as e:
+                return ({"success": False, "id": model_id, "error": str(e)},
+                        {"success": False, "files": [], "error": str(e)})
+
+        (info, files), card = await asyncio.gather(info_and_files(), get_model_card_async(model_id, c))
+    return {"info": info, "card": card, "files": files}
+
+
+def gather_model_details(model_ids: list[str]) -> list[dict]:
+    """get_model_details_async for several models, all in flight at once over one client.
+
+    Returns: [{"info": get_model_info(), "card": get_model_card(), "files": list_model_files()}]
+    in input order.
+    """
+    if not model_ids:
+        return []
+    return asyncio.run(_gather_model_details(model_ids))
+
+
+async def _gather_model_details(model_ids: list[str]) -> list[dict]:
+    async with _async_client() as client:
+        return list(await asyncio.gather(*(get_model_details_async(m, client) for m in model_ids)))
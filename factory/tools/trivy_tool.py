@@ -8,16 +8,21 @@ Env vars:
   TRIVY_SEVERITY — minimum severity to report (default: HIGH,CRITICAL)
 """
 
-import json
 import logging
 import os
 import subprocess
 
+import orjson
+
+from factory.tools._binaries import resolve_binary
+
 log = logging.getLogger(__name__)
 
 TRIVY_BIN = os.getenv("TRIVY_BIN", "trivy")
 TRIVY_SEVERITY = os.getenv("TRIVY_SEVERITY", "HIGH,CRITICAL")
 
+_TRIVY_PATH = resolve_binary(TRIVY_BIN)
+
 
 def scan_image(image: str) -> dict:
     """Scan a Docker image for known CVEs.
@@ -64,38 +69,41 @@ def scan_secrets(path: str) -> dict:
 
 def _run_trivy(args: list[str], label: str, result_key: str = "vulnerabilities") -> dict:
     try:
+        # Bytes straight to the parser — no text decode or strip() copy
+        # of a potentially large report; --quiet drops the progress output
         result = subprocess.run(
-            [TRIVY_BIN] + args,
+            [_TRIVY_PATH, "--quiet"] + args,
             capture_output=True,
-            text=True,
             timeout=180,
         )
         items = []
-        output = result.stdout.strip()
-        if output:
+        criticals = 0
+        if result.stdout.strip():
             try:
-                data = json.loads(output)
-                for target in data.get("Results", []):
-                    for item in target.get("Vulnerabilities", target.get("Misconfigurations", target.get("Secrets", []))):
-                        items.append({
-                            "id": item.get("VulnerabilityID", item.get("ID", "")),
-                            "title": item.get("Title", item.get("Message", "")),
-                            "severity": item.get("Severity", ""),
-                            "package": item.get("PkgName", ""),
-                            "installed_version": item.get("InstalledVersion", ""),
-                            "fixed_version": item.get("FixedVersion", ""),
-                        })
-            except json.JSONDecodeError:
-                pass
-
-        criticals = [v for v in items if v["severity"] in ("CRITICAL", "HIGH")]
-        passed = len(criticals) == 0
-        log.info("trivy scan: %s — %d issue(s) (%d critical/high)", label, len(items), len(criticals))
+                data = orjson.loads(result.stdout)
+            except ValueError:  # orjson.JSONDecodeError subclasses it
+                data = {}
+            # One pass: build each finding and tally critical/high as we go
+            for target in data.get("Results") or []:
+                for item in target.get("Vulnerabilities", target.get("Misconfigurations", target.get("Secrets", []))):
+                    severity = item.get("Severity", "")
+                    criticals += severity in ("CRITICAL", "HIGH")
+                    items.append({
+                        "id": item.get("VulnerabilityID", item.get("ID", "")),
+                        "title": item.get("Title", item.get("Message", "")),
+                        "severity": severity,
+                        "package": item.get("PkgName", ""),
+                        "installed_version": item.get("InstalledVersion", ""),
+                        "fixed_version": item.get("FixedVersion", ""),
+                    })
+
+        passed = criticals == 0
+        log.info("trivy scan: %s — %d issue(s) (%d critical/high)", label, len(items), criticals)
         return {
             "passed": passed,
             result_key: items,
             f"{result_key.rstrip('s')}_count": len(items),
-            "critical_high_count": len(criticals),
+            "critical_high_count": criticals,
         }
     except FileNotFoundError:
         log.warning("trivy not found — install: brew install trivy")
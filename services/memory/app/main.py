@@ -127,6 +127,71 @@ def _retain_db(bank_id: str, item: str) -> bool:
         return False
 
 
+def _retain_many_db(items: list[tuple[str, str]]) -> bool:
+    """Insert many (bank_id, item) rows over one connection and commit."""
+    params = _db_params()
+    if not params:
+        return False
+    try:
+        embeddings: list | None = None
+        if _pgvector_enabled and _embed_model is not None and _EMBED_DIM > 0:
+            try:
+                embeddings = [e.tolist() for e in _embed_model.encode([i for _, i in items])]
+            except Exception:
+                embeddings = None
+
+        with psycopg.connect(**params) as conn:
+            with conn.cursor() as cur:
+                if embeddings is not None:
+                    cur.executemany(
+                        "INSERT INTO memory_items(bank_id, item, embedding) "
+                        "VALUES (%s, %s, %s::vector)",
+                        [(b, i, str(e)) for (b, i), e in zip(items, embeddings)],
+                    )
+                else:
+                    cur.executemany(
+                        "INSERT INTO memory_items(bank_id, item) VALUES (%s, %s)",
+                        items,
+                    )
+            conn.commit()
+        return True
+    except Exception:
+        return False
+
+
+def _recall_many_db(bank_ids: list[str], limit: int) -> dict[str, list[str]] | None:
+    """Newest ``limit`` items per bank for several banks in one query."""
+    params = _db_params()
+    if not params:
+        return None
+    try:
+        grouped: dict[str, list[str]] = {bank_id: [] for bank_id in bank_ids}
+        with psycopg.connect(**params) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT bank_id, item
+                    FROM (
+                        SELECT bank_id, item, created_at, id,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY bank_id
+                                   ORDER BY created_at DESC, id DESC
+                               ) AS rn
+                        FROM memory_items
+                        WHERE bank_id = ANY(%s)
+                    ) ranked
+                    WHERE rn <= %s
+                    ORDER BY created_at ASC, id ASC
+                    """,
+                    (bank_ids, limit),
+                )
+                for bank_id, item in cur.fetchall():
+                    grouped[bank_id].append(item)
+        return grouped
+    except Exception:
+        return None
+
+
 def _recall_db(bank_id: str, limit: int) -> list[str] | None:
     params = _db_params()
     if not params:
@@ -270,6 +335,20 @@ class RetainRequest(BaseModel):
     item: str
 
 
+class RecallBatchRequest(BaseModel):
+    bank_ids: list[str]
+    limit: int = 5
+
+
+class RetainBatchItem(BaseModel):
+    bank_id: str
+    item: str
+
+
+class RetainBatchRequest(BaseModel):
+    items: list[RetainBatchItem]
+
+
 @app.on_event("startup")
 def startup() -> None:
     _init_db()
@@ -302,6 +381,29 @@ def retain(bank_id: str, req: RetainRequest) -> dict:
     return {"bank_id": bank_id, "size": len(banks[bank_id]), "store": "memory"}
 
 
+@app.post("/banks/recall-batch")
+def recall_batch(req: RecallBatchRequest) -> dict:
+    """Recall several banks in one round-trip — ``{"banks": {bank_id: items}}``."""
+    db_banks = _recall_many_db(req.bank_ids, req.limit)
+    if db_banks is not None:
+        return {"banks": db_banks, "store": "postgres"}
+    return {
+        "banks": {b: banks[b][-req.limit:] for b in req.bank_ids},
+        "store": "memory",
+    }
+
+
+@app.post("/banks/retain-batch")
+def retain_batch(req: RetainBatchRequest) -> dict:
+    """Retain many ``{bank_id, item}`` pairs in one round-trip."""
+    items = [(x.bank_id, x.item) for x in req.items]
+    if items and _retain_many_db(items):
+        return {"status": "stored", "count": len(items), "store": "postgres"}
+    for bank_id, item in items:
+        banks[bank_id].append(item)
+    return {"status": "stored", "count": len(items), "store": "memory"}
+
+
 @app.get("/banks/snapshot")
 def snapshot() -> dict:
     db_snapshot = _snapshot_db()
@@ -38,6 +38,7 @@ from factory.agents.phase2_handlers import (
 from factory.agents.task_result import TaskResult
 from factory.llm.runtime import TeamLLMRuntime
 from factory.memory.decision_log import DecisionLog, TEAM_DECISION_TYPE
+from factory.pipeline import count_lines
 from factory.pipeline.phase1_pipeline import Phase1Context, Phase1Pipeline
 from factory.pipeline.phase2_pipeline import Phase2Context, Phase2Pipeline
 from factory.pipeline.project_qa import answer_project_question
@@ -330,8 +331,9 @@ def _task_store_save(
             _task_meta_index[task_id] = {"uid": uid, "project_id": project_id}
         try:
             fs = _get_firestore()
-            fs.save_run(uid, project_id, task_id, payload)
-            fs.save_task_routing(task_id, uid, project_id)  # cross-instance lookup
+            with fs.batch():
+                fs.save_run(uid, project_id, task_id, payload)
+                fs.save_task_routing(task_id, uid, project_id)  # cross-instance lookup
         except Exception:
             log.warning("Firestore save failed for run %s", task_id)
 
@@ -676,6 +678,9 @@ def _run_full_pipeline_tracked(
         "backend_eng", "database_eng", "frontend_eng", "devops", "qa_eng",
     })
     shared_knowledge_parts: list[str] = []
+    # Joined form of shared_knowledge_parts, extended on append rather than
+    # re-joined for every team (and again on a blocked-team retry)
+    shared_knowledge = ""
     # Sol Arch per-team handoffs — populated when solution_arch runs.
     # Maps team slug → specific instruction extracted from HANDOFF_* LLM sections.
     _sol_arch_handoffs: dict[str, str] = {}
@@ -721,7 +726,7 @@ def _run_full_pipeline_tracked(
                 git_token=_git_token,
                 folder_id=_folder_id,
                 all_code=flat_code or None,
-                shared_knowledge="\n\n".join(shared_knowledge_parts),
+                shared_knowledge=shared_knowledge,
                 next_team=teams[idx + 1] if idx + 1 < len(teams) else "none",
                 session_creds=_screds or None,
                 sol_arch_handoff=_sol_arch_handoffs.get(team, ""),
@@ -787,7 +792,7 @@ def _run_full_pipeline_tracked(
                     uid=uid, project_id=req.project_id,
                     git_url=_git_url, git_token=_git_token,
                     folder_id=_folder_id, all_code=flat_code or None,
-                    shared_knowledge="\n\n".join(shared_knowledge_parts),
+                    shared_knowledge=shared_knowledge,
                     next_team=teams[idx + 1] if idx + 1 < len(teams) else "none",
                     session_creds=_screds or None,
                     sol_arch_handoff=_sol_arch_handoffs.get(team, ""),
@@ -869,9 +874,9 @@ def _run_full_pipeline_tracked(
                     _label = team.replace("_", " ").title()
                     # Sol Arch gets more space as it's foundational; others get 800 chars
                     _max_chars = 1200 if team == "solution_arch" else 800
-                    shared_knowledge_parts.append(
-                        f"[{_label}] {_title}:\n{_rationale[:_max_chars]}"
-                    )
+                    _part = f"[{_label}] {_title}:\n{_rationale[:_max_chars]}"
+                    shared_knowledge_parts.append(_part)
+                    shared_knowledge = f"{shared_knowledge}\n\n{_part}" if shared_knowledge else _part
                     # Emit context-share comms event to downstream teams
                     next_team = teams[idx + 1] if idx + 1 < len(teams) else "all"
                     _push_comms(task_id, team, next_team, "context",
@@ -886,7 +891,7 @@ def _run_full_pipeline_tracked(
 
             summary = (
                 f"phase2-stage={team} prior={len(prior)} "
-                f"artifact_lines={len(stage.artifact.splitlines())}"
+                f"artifact_lines={count_lines(stage.artifact)}"
             )
             item = f"{req.project_id}:{summary}:{stage.artifact[:120]}"
 
@@ -928,18 +933,20 @@ def _run_full_pipeline_tracked(
 
         # ── Handoff validation ──
         handoffs: list[dict[str, str | bool]] = []
+        overall_handoff_ok = True
         for idx, team in enumerate(teams):
             expected = teams[idx + 1] if idx < len(teams) - 1 else "none"
             observed = extract_handoff_to(artifacts.get(team, ""))
+            ok = observed == expected
+            overall_handoff_ok &= ok
             handoffs.append(
                 {
                     "team": team,
                     "expected_handoff_to": expected,
                     "observed_handoff_to": observed,
-                    "ok": observed == expected,
+                    "ok": ok,
                 }
             )
-        overall_handoff_ok = all(bool(x["ok"]) for x in handoffs)
 
         # ── Build unified project structure ──
         # Merge all team code into one flat file tree, keeping team attribution
@@ -1903,8 +1910,12 @@ def get_project_session(
             runs = store.list_runs(user.uid, project_id, limit=1)
             if runs:
                 latest = runs[0]
-                result["last_task_id"] = latest.get("task_id") or latest.get("id")
-                result["last_run"] = latest
+                task_id = latest.get("task_id") or latest.get("id")
+                result["last_task_id"] = task_id
+                # list_runs only carries summary fields — the frontend needs
+                # the run's result and activities to restore the view
+                full = store.get_run(user.uid, project_id, task_id)
+                result["last_run"] = {"id": latest.get("id"), **full} if full else latest
         except Exception:
             pass
     except Exception as exc:
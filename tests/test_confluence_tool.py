@@ -0,0 +1,52 @@
+import re
+
+import pytest
+
+from factory.tools.confluence_tool import markdown_to_storage
+
+
+def _baseline_markdown_to_storage(markdown: str) -> str:
+    """The original substitution-chain converter, kept as the reference."""
+    html = markdown
+    html = re.sub(r"^# (.+)$", r"<h1>\1</h1>", html, flags=re.MULTILINE)
+    html = re.sub(r"^## (.+)$", r"<h2>\1</h2>", html, flags=re.MULTILINE)
+    html = re.sub(r"^### (.+)$", r"<h3>\1</h3>", html, flags=re.MULTILINE)
+    html = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html)
+    html = re.sub(r"\*(.+?)\*", r"<em>\1</em>", html)
+    html = re.sub(r"`(.+?)`", r"<code>\1</code>", html)
+    html = re.sub(
+        r"```(\w+)?\n([\s\S]+?)```",
+        lambda m: f'<ac:structured-macro ac:name="code"><ac:plain-text-body><![CDATA[{m.group(2)}]]></ac:plain-text-body></ac:structured-macro>',
+        html,
+    )
+    html = re.sub(r"^- (.+)$", r"<li>\1</li>", html, flags=re.MULTILINE)
+    html = re.sub(r"(<li>.*</li>)", r"<ul>\1</ul>", html, flags=re.DOTALL)
+    html = re.sub(r"\n\n", "<br/>", html)
+    return html
+
+
+@pytest.mark.parametrize(
+    "markdown",
+    [
+        "# Title\n## Sub *it*\n### Third **bold**",
+        "Intro\n\n- one\n- two *em*\n- **three**",
+        "text *a **b** c*",
+        "**a *b* c** and *x* then *y*",
+        "*a **b***",
+        "Use `pip install` here\n\nDone",
+        "a*b and 2 * 3",
+    ],
+)
+def test_markdown_to_storage_matches_baseline(markdown) -> None:
+    assert markdown_to_storage(markdown) == _baseline_markdown_to_storage(markdown)
+
+
+def test_markdown_to_storage_code_blocks() -> None:
+    # The baseline ran inline `code` first and mangled every fenced block
+    html = markdown_to_storage("Before\n\n```python\n**kwargs and *args\n# not a heading\n```\n\nAfter")
+
+    assert html == (
+        'Before<br/><ac:structured-macro ac:name="code"><ac:plain-text-body>'
+        "<![CDATA[**kwargs and *args\n# not a heading\n]]>"
+        "</ac:plain-text-body></ac:structured-macro><br/>After"
+    )
@@ -0,0 +1,79 @@
+import pytest
+
+from factory.tools import csv_tool
+
+CASES = {
+    "simple": "name,age,city\nAda,36,London\nLinus,28, Helsinki \n",
+    "ragged": "a,b\n1,2,3\n4,5\n6\n",
+    "blank_lines": "a,b\n\n1,2\n\n\n3,4\n",
+    "quoted_newline": 'a,b\n"line one\nline two",2\n"x, y",3\n',
+    "non_ascii": "name,town\nstraße,İstanbul\n Ōsaka　,Zürich\n",
+    "blank_cells": "a,b\n ,1\n,2\n\x1c,3\n",
+}
+
+TRANSFORMS = [
+    {"op": "upper", "column": "name"},
+    {"op": "lower", "column": "town"},
+    {"op": "strip", "column": "name"},
+    {"op": "strip", "column": "city"},
+    {"op": "fill_na", "column": "a", "value": "NA"},
+    {"op": "rename", "from": "b", "to": "bee"},
+    {"op": "drop", "column": "age"},
+]
+
+
+def _run_all(content: str, tmp_path) -> dict:
+    path = tmp_path / "data.csv"
+    path.write_text(content, encoding="utf-8")
+    columns = content.split("\n", 1)[0].split(",")
+    return {
+        "parse": csv_tool.parse_csv(content),
+        "parse_no_header": csv_tool.parse_csv(content, has_header=False),
+        "parse_path": csv_tool.parse_csv_path(str(path)),
+        "validate": csv_tool.validate_csv(content, columns),
+        "describe": csv_tool.describe_csv(content),
+        "describe_path": csv_tool.describe_csv_path(str(path)),
+        "to_json": csv_tool.csv_to_json(content),
+        "transform": csv_tool.transform_csv(content, TRANSFORMS),
+        "transform_empty": csv_tool.transform_csv(content, []),
+        "transform_drop_all": csv_tool.transform_csv(content, [{"op": "drop", "column": c} for c in columns]),
+    }
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_csv_tool_matches_without_pyarrow(case, tmp_path, monkeypatch) -> None:
+    pytest.importorskip("pyarrow")
+    content = CASES[case]
+
+    csv_tool._parse_cache.clear()
+    with_arrow = _run_all(content, tmp_path)
+
+    monkeypatch.setattr(csv_tool, "pa", None)
+    csv_tool._parse_cache.clear()
+    without_arrow = _run_all(content, tmp_path)
+    csv_tool._parse_cache.clear()
+
+    assert with_arrow == without_arrow
+
+
+def test_transform_csv_ragged_rows() -> None:
+    result = csv_tool.transform_csv("a,b\n1,2,3\n4,5\n", [])
+
+    assert result["success"] is True
+    assert result["row_count"] == 2
+
+
+def test_transform_csv_case_mapping_matches_python() -> None:
+    result = csv_tool.transform_csv(
+        "a,b\nstraße,İ\n",
+        [{"op": "upper", "column": "a"}, {"op": "lower", "column": "b"}],
+    )
+
+    assert result["csv_str"] == f"a,b\n{'straße'.upper()},{'İ'.lower()}\n"
+
+
+def test_transform_csv_dropping_every_column_keeps_one_line_per_row() -> None:
+    result = csv_tool.transform_csv("a,b\n1,2\n3,4\n", [{"op": "drop", "column": "a"}, {"op": "drop", "column": "b"}])
+
+    assert result["csv_str"] == "\n\n\n"
+    assert result["row_count"] == 2
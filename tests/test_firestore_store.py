@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+import itertools
+import threading
+
+from google.cloud import firestore  # type: ignore
+
+from factory.persistence.firestore_store import FirestoreStore
+
+
+class FakeSnapshot:
+    def __init__(self, ref, data) -> None:
+        self.reference = ref
+        self.id = ref.id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data or {})
+
+
+class FakeQuery:
+    def __init__(self, db, path, order=None, count=None, after=None) -> None:
+        self.db, self.path = db, path
+        self._order, self._count, self._after = order, count, after
+
+    def _derive(self, **kw):
+        args = {"order": self._order, "count": self._count, "after": self._after, **kw}
+        return FakeQuery(self.db, self.path, **args)
+
+    def select(self, fields):
+        return self
+
+    def order_by(self, field, direction=None):
+        return self._derive(order=(field, direction == firestore.Query.DESCENDING))
+
+    def limit(self, n):
+        return self._derive(count=n)
+
+    def start_after(self, snap):
+        return self._derive(after=snap.id)
+
+    def stream(self):
+        refs = [FakeDoc(self.db, p) for p in self.db.docs if p[:-1] == self.path]
+        snaps = [r.get() for r in refs]
+        if self._order is not None:
+            field, desc = self._order
+            snaps.sort(key=lambda s: s.to_dict().get(field, ""), reverse=desc)
+        if self._after is not None:
+            ids = [s.id for s in snaps]
+            snaps = snaps[ids.index(self._after) + 1:]
+        return iter(snaps[: self._count] if self._count is not None else snaps)
+
+
+class FakeCollection(FakeQuery):
+    def document(self, doc_id=None):
+        return FakeDoc(self.db, self.path + (doc_id or f"auto-{next(self.db.ids):06d}",))
+
+
+class FakeDoc:
+    def __init__(self, db, path) -> None:
+        self.db, self.path, self.id = db, path, path[-1]
+
+    def collection(self, name):
+        return FakeCollection(self.db, self.path + (name,))
+
+    def get(self):
+        return FakeSnapshot(self, self.db.docs.get(self.path))
+
+    def set(self, data, merge=False):
+        base = dict(self.db.docs.get(self.path, {})) if merge else {}
+        base.update(data)
+        self.db.docs[self.path] = base
+
+    def update(self, data):
+        doc = self.db.docs[self.path]
+        for k, v in data.items():
+            if v is firestore.DELETE_FIELD:
+                doc.pop(k, None)
+            else:
+                doc[k] = v
+
+
+class FakeBatch:
+    def __init__(self, db) -> None:
+        self.db, self.ops = db, []
+
+    def set(self, ref, data, merge=False):
+        self.ops.append(lambda: ref.set(data, merge=merge))
+
+    def update(self, ref, data):
+        self.ops.append(lambda: ref.update(data))
+
+    def commit(self):
+        for op in self.ops:
+            op()
+        self.db.commits.append(len(self.ops))
+
+
+class FakeDB:
+    def __init__(self) -> None:
+        self.docs: dict[tuple, dict] = {}
+        self.commits: list[int] = []
+        self.ids = itertools.count()
+
+    def collection(self, name):
+        return FakeCollection(self, (name,))
+
+    def batch(self):
+        return FakeBatch(self)
+
+
+def _store() -> FirestoreStore:
+    # Skip __init__ — it would open a real Firestore client
+    store = FirestoreStore.__new__(FirestoreStore)
+    store.db = FakeDB()
+    store._local = threading.local()
+    store._token_cache = {}
+    store._token_lock = threading.Lock()
+    return store
+
+
+@dataclass
+class Decision:
+    id: str
+    ts: str = "2026-01-01T00:00:00+00:00"
+    project_id: str = "p"
+    team: str = "backend_eng"
+    decision_type: str = "architecture"
+    title: str = "t"
+    rationale: str = "r"
+    artifact_ref: str = ""
+
+
+def test_save_decisions_bulk_chunks_past_the_batch_limit() -> None:
+    store = _store()
+
+    store.save_decisions_bulk("u", "p", [Decision(id=f"d{i}") for i in range(1201)])
+
+    assert store.db.commits == [500, 500, 201]
+    decisions = store._project_ref("u", "p").collection("decisions")
+    assert len(list(decisions.stream())) == 1201
+
+
+def test_reads_skip_migrated_docs_while_legacy_array_remains() -> None:
+    store = _store()
+    bank = store._bank_ref("u", "p", "team-a")
+    bank.set({"items": ["old-0", "old-1", "old-2"]})
+    # A migration that failed after writing its first chunk
+    for i, item in enumerate(["old-0", "old-1"]):
+        bank.collection("items").document(f"legacy-{i:06d}").set(store._pack_item(item, f"0000#{i:06d}"))
+    store.retain("u", "p", "team-a", "new-0")
+
+    assert store.recall("u", "p", "team-a", limit=10) == ["old-0", "old-1", "old-2", "new-0"]
+    assert store.recall("u", "p", "team-a", limit=2) == ["old-2", "new-0"]
+    assert store.memory_snapshot("u", "p") == {"team-a": ["old-0", "old-1", "old-2", "new-0"]}
+
+    assert store.migrate_memory_banks("u", "p") == 3
+    assert store.recall("u", "p", "team-a", limit=10) == ["old-0", "old-1", "old-2", "new-0"]
+    assert store.memory_snapshot("u", "p") == {"team-a": ["old-0", "old-1", "old-2", "new-0"]}
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from factory.tools import gitleaks_tool
+
+LEAKS = [
+    {"RuleID": f"rule-{i}", "Description": "Generic API Key", "File": f"src/f{i}.py", "StartLine": i}
+    for i in range(60)
+]
+
+
+@pytest.fixture(params=["ijson", "json"])
+def reader(request, monkeypatch):
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(gitleaks_tool, "ijson", None)
+    return gitleaks_tool._read_report
+
+
+def test_read_report_keeps_first_findings_and_counts_all(reader, tmp_path) -> None:
+    report = tmp_path / "report.json"
+    report.write_text(json.dumps(LEAKS))
+
+    kept, count = reader(str(report))
+
+    assert kept == LEAKS[: gitleaks_tool._MAX_FINDINGS]
+    assert count == 60
+
+
+def test_read_report_empty_and_missing(reader, tmp_path) -> None:
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"")
+
+    assert reader(str(empty)) == ([], 0)
+    assert reader(str(tmp_path / "missing.json")) == ([], 0)
+
+
+def test_read_report_truncated(reader, tmp_path) -> None:
+    report = tmp_path / "truncated.json"
+    text = json.dumps(LEAKS[:3])
+    report.write_text(text[: text.index('"rule-2"')])
+
+    kept, count = reader(str(report))
+
+    # ijson keeps the leaks parsed before the cut; json.load keeps none
+    assert kept == LEAKS[:count]
+    assert count <= 2
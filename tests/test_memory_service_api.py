@@ -27,3 +27,26 @@ def test_memory_snapshot() -> None:
     response = client.get("/banks/snapshot")
     assert response.status_code == 200
     assert "banks" in response.json()
+
+
+def test_memory_retain_and_recall_batch() -> None:
+    retain = client.post(
+        "/banks/retain-batch",
+        json={"items": [
+            {"bank_id": "batch-a", "item": "a1"},
+            {"bank_id": "batch-b", "item": "b1"},
+            {"bank_id": "batch-a", "item": "a2"},
+        ]},
+    )
+    assert retain.status_code == 200
+    assert retain.json()["count"] == 3
+
+    recall = client.post(
+        "/banks/recall-batch",
+        json={"bank_ids": ["batch-a", "batch-b", "batch-empty"], "limit": 1},
+    )
+    assert recall.status_code == 200
+    banks = recall.json()["banks"]
+    assert banks["batch-a"] == ["a2"]
+    assert banks["batch-b"] == ["b1"]
+    assert banks["batch-empty"] == []
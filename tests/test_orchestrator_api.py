@@ -2,6 +2,8 @@ from datetime import UTC, datetime, timedelta
 
 from fastapi.testclient import TestClient
 
+from factory.auth.firebase_auth import AuthUser, get_current_user
+from services.orchestrator.app import main
 from services.orchestrator.app.main import app, broker
 
 
@@ -116,3 +118,39 @@ def test_clarification_respond_roundtrip() -> None:
     get_response = client.get(f"/api/clarifications/{request_id}")
     assert get_response.status_code == 200
     assert "phase-1 template" in (get_response.json()["answer"] or "")
+
+
+class SessionStore:
+    """list_runs returns summaries only, like the Firestore projection."""
+
+    def __init__(self) -> None:
+        self.run = {
+            "task_id": "t-1",
+            "status": "COMPLETE",
+            "result": {"artifacts": ["spec.md"]},
+            "activities": [{"team": "backend_eng", "msg": "done"}],
+        }
+
+    def recall(self, uid, project_id, bank_id, limit=5):
+        return []
+
+    def list_runs(self, uid, project_id, limit=20):
+        return [{"id": "t-1", "task_id": "t-1", "status": "COMPLETE"}]
+
+    def get_run(self, uid, project_id, task_id):
+        return dict(self.run) if task_id == "t-1" else None
+
+
+def test_session_restore_returns_full_last_run(monkeypatch) -> None:
+    monkeypatch.setattr(main, "_get_firestore", lambda: SessionStore())
+    app.dependency_overrides[get_current_user] = lambda: AuthUser(uid="u-1", email="", display_name="")
+    try:
+        response = client.get("/api/projects/p-1/session")
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["last_task_id"] == "t-1"
+    assert body["last_run"]["result"] == {"artifacts": ["spec.md"]}
+    assert body["last_run"]["activities"] == [{"team": "backend_eng", "msg": "done"}]
@@ -10,3 +10,16 @@ def test_phase1_pipeline_runs_all_teams() -> None:
     assert all(r.status == "COMPLETE" for r in run.results)
     assert set(run.artifacts.keys()) == {"biz_analysis", "solution_arch", "backend_eng", "qa_eng", "docs_team"}
     assert "BRD:" in run.artifacts["biz_analysis"]
+
+
+def test_phase1_pipeline_retains_one_item_per_team() -> None:
+    memory = MemoryController()
+    pipeline = Phase1Pipeline(memory=memory)
+    pipeline.run(Phase1Context(project_id="p1", requirement="ship mvp"))
+    run = pipeline.run(Phase1Context(project_id="p1", requirement="ship mvp"))
+
+    snapshot = memory.snapshot()
+    assert {f"team-{t}" for t in pipeline.teams} <= set(snapshot)
+    assert all(len(snapshot[f"team-{t}"]) == 2 for t in pipeline.teams)
+    assert [r.team for r in run.results] == pipeline.teams
+    assert all("prior=1" in r.reasoning for r in run.results)
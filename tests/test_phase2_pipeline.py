@@ -1,5 +1,14 @@
+import pytest
+
+from factory.agents.phase2_handlers import Phase2StageArtifact
 from factory.memory.memory_controller import MemoryController
-from factory.pipeline.phase2_pipeline import Phase2Context, Phase2Pipeline
+from factory.pipeline import phase2_pipeline
+from factory.pipeline.phase2_pipeline import (
+    TEAM_DEPENDENCIES,
+    Phase2Context,
+    Phase2Pipeline,
+    _ancestors,
+)
 
 
 class LocalAdapter:
@@ -28,6 +37,22 @@ def test_phase2_pipeline_runs_17_teams() -> None:
     assert all(h["ok"] for h in run.handoffs)
 
 
+class FailingMemory:
+    def recall(self, bank_id: str, limit: int = 5):
+        raise RuntimeError("memory down")
+
+    def retain(self, bank_id: str, item: str):
+        raise RuntimeError("memory down")
+
+
+def test_phase2_pipeline_survives_memory_failure() -> None:
+    pipeline = Phase2Pipeline(memory=FailingMemory())
+    run = pipeline.run(Phase2Context(project_id="p2-mem", requirement="memory outage"))
+
+    assert len(run.results) == 17
+    assert all("fallback" in run.artifacts[t] for t in pipeline.teams)
+
+
 def test_phase2_pipeline_handoff_contract_order() -> None:
     pipeline = Phase2Pipeline(memory=LocalAdapter())
     run = pipeline.run(Phase2Context(project_id="p2-handoff", requirement="validate sequence"))
@@ -41,3 +66,62 @@ def test_phase2_pipeline_handoff_contract_order() -> None:
         assert handoff["expected_handoff_to"] == expected_next
         assert handoff["observed_handoff_to"] == expected_next
         assert handoff["ok"] is True
+
+
+def _shared_knowledge_by_team(monkeypatch) -> dict[str, str]:
+    """Run the pipeline with a stub handler; return what each team was shown."""
+    seen: dict[str, str] = {}
+
+    def handler(team, requirement, prior_count, llm_runtime, shared_knowledge):
+        seen[team] = shared_knowledge
+        return Phase2StageArtifact(
+            team=team,
+            artifact=f"P2:{team}\n- handoff_to: none",
+            decision_title=f"decision-of-{team}",
+            decision_rationale="because",
+        )
+
+    monkeypatch.setattr(phase2_pipeline, "run_phase2_handler", handler)
+    Phase2Pipeline(memory=LocalAdapter()).run(Phase2Context(project_id="p2-kb", requirement="kb"))
+    return seen
+
+
+def test_phase2_dependencies_cover_all_teams(monkeypatch) -> None:
+    assert set(TEAM_DEPENDENCIES) == set(Phase2Pipeline.teams)
+    for preds in TEAM_DEPENDENCIES.values():
+        assert set(preds) <= set(Phase2Pipeline.teams)
+    seen = _shared_knowledge_by_team(monkeypatch)
+    assert "decision-of-solution_arch" in seen["backend_eng"]
+    assert seen["product_mgmt"] == ""
+
+
+# The wave schedule the DAG replaced — every team saw the knowledge of all
+# producers in earlier waves, and must still be shown it.
+_LEGACY_WAVES = [
+    ["product_mgmt", "biz_analysis"],
+    ["solution_arch"],
+    ["api_design", "ux_ui"],
+    ["frontend_eng", "backend_eng", "database_eng", "data_eng", "ml_eng"],
+    ["security_eng", "compliance", "devops"],
+    ["qa_eng", "sre_ops"],
+    ["docs_team", "feature_eng"],
+]
+
+
+def test_phase2_teams_see_knowledge_of_earlier_wave_producers(monkeypatch) -> None:
+    seen = _shared_knowledge_by_team(monkeypatch)
+    everything = "\n".join(seen.values())
+    producers = {t for t in Phase2Pipeline.teams if f"decision-of-{t}:" in everything}
+    assert {"solution_arch", "backend_eng", "qa_eng"} <= producers
+
+    earlier: set[str] = set()
+    for wave in _LEGACY_WAVES:
+        for team in wave:
+            missing = sorted(p for p in earlier & producers if f"decision-of-{p}:" not in seen[team])
+            assert not missing, f"{team} lost knowledge from {missing}"
+        earlier.update(wave)
+
+
+def test_phase2_dependency_cycle_rejected() -> None:
+    with pytest.raises(ValueError):
+        _ancestors({"a": ["b"], "b": ["a"]})
@@ -1,4 +1,4 @@
-from factory.pipeline.project_qa import answer_project_question
+from factory.pipeline.project_qa import _QAIndex, _index_for, _tokens, answer_project_question
 
 
 def test_answer_project_question_with_matches() -> None:
@@ -31,3 +31,22 @@ def test_answer_project_question_no_matches() -> None:
     )
     assert "No strong memory match" in answer
     assert matches == []
+
+
+def test_qa_index_candidates_share_a_token() -> None:
+    index = _QAIndex({
+        "team-a": ["API contract", "", "deploy pipeline"],
+        "team-b": ["api gateway"],
+    })
+
+    assert index.candidates(_tokens("api?")) == [0, 2]
+    assert index.items[2] == ("team-b", "api gateway")
+    assert index.candidates(_tokens("unrelated")) == []
+
+
+def test_qa_index_reused_for_equal_snapshots() -> None:
+    first = _index_for({"team-a": ["API contract"], "team-b": ["api gateway"]})
+
+    assert _index_for({"team-a": ["API contract"], "team-b": ["api gateway"]}) is first
+    assert _index_for({"team-a": ["API contract", "api gateway"]}) is not first
+    assert _index_for({"team-a": ["API", "contract"], "team-b": ["api gateway"]}) is not first